@@ -0,0 +1,3 @@
+"""
+Benchmarks locales del extractor de Jira
+"""
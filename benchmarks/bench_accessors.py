@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark del acceso a campos por issue
+
+Compara el costo por issue de resolver todas las rutas de campos que leen
+los extractores con distintas estrategias, sobre issues en JSON crudo y
+como objetos jira.resources.Issue:
+
+  string_walk    Recorrido por ruta separando el string en cada llamada
+                 (implementación anterior de _safe_get_nested_attribute)
+  compiled_path  Un accesor precompilado por ruta (compile_path)
+  fused_plan     Plan fusionado de todas las rutas (AccessorPlan.resolve)
+  extract_issue  JiraDataExtractor._extract_issue_data completo
+
+Uso:
+  python benchmarks/bench_accessors.py
+  python benchmarks/bench_accessors.py --issues 20000 --repeat 7
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jira.resources import Issue
+from rich.console import Console
+from rich.table import Table
+
+from src.extractors import compile_path
+from src.jira_extractor import JiraDataExtractor
+from benchmarks.synthetic_data import generate_project
+
+
+def string_walk(obj: Any, path: str, default: Any = None) -> Any:
+    """Recorrido de una ruta separando el string en cada llamada (estrategia anterior)"""
+    try:
+        current = obj
+        for attr in path.split('.'):
+            current = current[attr] if isinstance(current, dict) else getattr(current, attr)
+            if current is None:
+                return default
+        return current
+    except (AttributeError, KeyError, TypeError):
+        return default
+
+
+def per_issue_us(func: Callable[[Any], Any], issues: List[Any], repeat: int) -> float:
+    """Mejor tiempo de `repeat` pasadas sobre los issues, en microsegundos por issue"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for issue in issues:
+            func(issue)
+        best = min(best, time.perf_counter() - start)
+    return best / len(issues) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-benchmark de acceso a campos por issue')
+    parser.add_argument('--issues', type=int, default=5000, help='Cantidad aproximada de issues')
+    parser.add_argument('--repeat', type=int, default=5, help='Repeticiones (se toma la mejor)')
+    args = parser.parse_args()
+
+    project = generate_project('BENCH', stories=max(1, args.issues // 4))
+    raw_issues = project.issues
+    resource_issues = [Issue({}, None, raw) for raw in raw_issues]
+
+    extractor = JiraDataExtractor()
+    plan = extractor.issue_plan
+    accessors = [compile_path(path) for path in plan.paths]
+
+    strategies = {
+        'string_walk': lambda issue: [string_walk(issue, path) for path in plan.paths],
+        'compiled_path': lambda issue: [accessor(issue) for accessor in accessors],
+        'fused_plan': plan.resolve,
+        'extract_issue': extractor._extract_issue_data
+    }
+
+    table = Table(title=f"⏱️ Acceso a campos: {len(raw_issues)} issues, {len(plan.paths)} rutas", show_header=True)
+    table.add_column("Estrategia", style="cyan", no_wrap=True)
+    table.add_column("JSON (µs/issue)", style="green")
+    table.add_column("Resource (µs/issue)", style="green")
+
+    for name, func in strategies.items():
+        table.add_row(
+            name,
+            f"{per_issue_us(func, raw_issues, args.repeat):.2f}",
+            f"{per_issue_us(func, resource_issues, args.repeat):.2f}"
+        )
+
+    Console().print(table)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark de paginación: secuencial vs descarga concurrente de páginas
+
+Levanta un Jira falso local con latencia simulada y mide
+JiraDataExtractor._paginated_search con distintos niveles de concurrencia.
+Con --extract mide además la búsqueda con extracción de filas
+(_search_issues) con y sin solapamiento de descarga y extracción
+(prefetch_pages): con solapamiento el tiempo total se acerca al de la
+descarga sola.
+
+Uso:
+  python benchmarks/bench_pagination.py --issues 5000 --latency 0.05 --concurrency 1 4 8
+  python benchmarks/bench_pagination.py --issues 20000 --latency 0.05 --concurrency 1 4 --extract
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rich.console import Console
+from rich.table import Table
+
+from src.config import JIRA_CONFIG, EXTRACTION_CONFIG
+from src.jira_extractor import JiraDataExtractor
+from benchmarks.fake_jira import FakeJiraServer, generate_issues
+
+
+JQL = 'project = BENCH ORDER BY created DESC'
+
+
+def connect(server_url: str, concurrency: int) -> JiraDataExtractor:
+    """Crea un extractor silencioso conectado al Jira falso"""
+    JIRA_CONFIG.update({'server': server_url, 'email': 'bench', 'token': 'bench'})
+
+    extractor = JiraDataExtractor(concurrency=concurrency)
+    extractor.jira_service.console = Console(quiet=True)
+    extractor.display_utils.console = Console(quiet=True)
+    if not extractor.jira_service.connect():
+        raise RuntimeError("No se pudo conectar al Jira falso")
+    return extractor
+
+
+def run_search(server_url: str, concurrency: int, safety_limit: int):
+    """Ejecuta una búsqueda paginada completa y retorna (segundos, keys)"""
+    extractor = connect(server_url, concurrency)
+
+    start = time.perf_counter()
+    issues = extractor._paginated_search(JQL, safety_limit, True)
+    elapsed = time.perf_counter() - start
+
+    return elapsed, [extractor.structure_extractor._get_issue_key(issue) for issue in issues]
+
+
+def run_extraction(server_url: str, concurrency: int, safety_limit: int, prefetch_pages: int) -> float:
+    """Ejecuta la búsqueda con extracción de filas y retorna los segundos"""
+    extractor = connect(server_url, concurrency)
+    EXTRACTION_CONFIG['prefetch_pages'] = prefetch_pages
+
+    start = time.perf_counter()
+    extractor._search_issues(JQL, safety_limit, True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de paginación contra un Jira falso local')
+    parser.add_argument('--issues', type=int, default=5000, help='Issues en el Jira falso')
+    parser.add_argument('--latency', type=float, default=0.05, help='Latencia simulada por request (s)')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 8],
+                        help='Niveles de concurrencia a medir')
+    parser.add_argument('--extract', action='store_true',
+                        help='Medir también descarga + extracción con y sin solapamiento')
+    args = parser.parse_args()
+    prefetch_pages = EXTRACTION_CONFIG['prefetch_pages'] or 4
+
+    console = Console()
+    issues = generate_issues('BENCH', args.issues)
+
+    table = Table(title=f"⏱️ Paginación: {args.issues} issues, latencia {args.latency}s", show_header=True)
+    table.add_column("Concurrencia", style="cyan")
+    table.add_column("Tiempo (s)", style="green")
+    table.add_column("Requests", style="yellow")
+    table.add_column("Speedup", style="magenta")
+    if args.extract:
+        table.add_column("+ extracción solapada (s)", style="green")
+        table.add_column("+ extracción sin solapar (s)", style="yellow")
+
+    baseline_time = None
+    baseline_keys = None
+
+    for concurrency in args.concurrency:
+        with FakeJiraServer(issues, latency=args.latency) as server:
+            elapsed, keys = run_search(server.url, concurrency, args.issues)
+            requests_made = server.request_count
+
+        if baseline_time is None:
+            baseline_time, baseline_keys = elapsed, keys
+        elif keys != baseline_keys:
+            console.print(f"❌ [red]El orden de resultados difiere con concurrencia {concurrency}[/red]")
+            sys.exit(1)
+
+        row = [str(concurrency), f"{elapsed:.2f}", str(requests_made), f"{baseline_time / elapsed:.1f}x"]
+
+        if args.extract:
+            for prefetch in (prefetch_pages, 0):
+                with FakeJiraServer(issues, latency=args.latency) as server:
+                    row.append(f"{run_extraction(server.url, concurrency, args.issues, prefetch):.2f}")
+
+        table.add_row(*row)
+
+    console.print(table)
+    console.print(f"✅ [green]Resultados idénticos y en el mismo orden ({len(baseline_keys)} issues)[/green]")
+
+
+if __name__ == '__main__':
+    main()
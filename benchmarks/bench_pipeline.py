@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Benchmark de punta a punta: extracción → agregación → resumen → exportación
+
+Genera proyectos sintéticos de distintos tamaños y mide cada etapa del
+pipeline con los mismos componentes que usa JiraDataExtractor.run:
+
+  parse_issues           JSON de la búsqueda → jira.resources.Issue
+  process_issues         JiraDataExtractor._process_issues (incluye subtareas)
+  process_raw_issues     Ídem sobre el JSON crudo (raw_json, sin objetos Issue; en procesos con --workers)
+  subtask_relationships  SubtaskProcessor.process_subtask_relationships (aislado)
+  summary                DisplayUtils.show_extraction_summary
+  excel_export           ExcelExporter.export
+  csv_export             CSVExporter.export
+  export_both            JiraDataExtractor._export_data con --format both (tabla compartida, formatos en hilos)
+  sqlite_export          SQLiteExporter.export (upsert en la misma base en cada repetición)
+  parquet_export         ParquetExporter.export (requiere pyarrow; si no está, se omite por defecto)
+
+Por etapa reporta tiempo (mejor de --repeat), issues/s y memoria pico
+(tracemalloc, en una corrida aparte para no distorsionar los tiempos). Los
+resultados se comparan con un baseline JSON y el script termina con código 1
+si alguna etapa es más lenta que el baseline más allá de la tolerancia.
+
+Uso:
+  python benchmarks/bench_pipeline.py --sizes 1000 10000
+  python benchmarks/bench_pipeline.py --sizes 1000 10000 100000 --save-baseline
+  python benchmarks/bench_pipeline.py --sizes 10000 --stages process_issues csv_export
+  python benchmarks/bench_pipeline.py --sizes 100000 --stages process_raw_issues --workers 4
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jira.resources import Issue
+from rich.console import Console
+from rich.table import Table
+
+from src.config import EXPORT_CONFIG
+from src.jira_extractor import JiraDataExtractor
+from src.exporters import ParquetExporter
+from benchmarks.synthetic_data import generate_project
+
+STAGES = ['parse_issues', 'process_issues', 'process_raw_issues', 'subtask_relationships', 'summary', 'excel_export', 'csv_export', 'export_both', 'sqlite_export', 'parquet_export']
+DEFAULT_STAGES = [stage for stage in STAGES if stage != 'parquet_export' or ParquetExporter.is_available()]
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'baselines' / 'pipeline.json'
+
+
+class PipelineBenchmark:
+    """Prepara los datos de un tamaño y ejecuta cada etapa de forma aislada"""
+
+    def __init__(self, size: int, subtasks_per_story: int, workers: int = 1):
+        """
+        Args:
+            size: Cantidad aproximada de issues (historias + subtareas + epics)
+            subtasks_per_story: Subtareas por historia en promedio
+            workers: Procesos de extracción de process_raw_issues (--workers)
+        """
+        stories = max(1, math.ceil(size / (1 + subtasks_per_story)))
+        self.project = generate_project('BENCH', stories=stories, subtasks_per_story=subtasks_per_story)
+        self.size = len(self.project.issues)
+
+        self.extractor = JiraDataExtractor(workers=workers)
+        self.extractor.structure_extractor.set_sprint_context({
+            sprint['id']: {**sprint, 'board_name': f"BENCH Board {sprint['originBoardId']}"}
+            for sprint in self.project.all_sprints if sprint['state'] == 'active'
+        })
+
+        # Entradas de cada etapa (se completan al ejecutar las anteriores)
+        self.issues: List[Issue] = []
+        self.main_issues: List[Dict[str, Any]] = []
+        self.subtasks: List[Dict[str, Any]] = []
+        self.data: List[Dict[str, Any]] = []
+
+        # Capturar las entradas de la agregación de subtareas durante _process_issues
+        processor = self.extractor.subtask_processor
+        original = processor.process_subtask_relationships
+
+        def capture(main_issues, subtasks):
+            self.main_issues, self.subtasks = main_issues, subtasks
+            return original(main_issues, subtasks)
+
+        self._process_subtasks = original
+        processor.process_subtask_relationships = capture
+
+    def stage(self, name: str) -> Callable[[], Any]:
+        """Retorna la función que ejecuta una etapa"""
+        return {
+            'parse_issues': self._parse_issues,
+            'process_issues': self._process,
+            'process_raw_issues': self._process_raw,
+            'subtask_relationships': lambda: self._process_subtasks(self.main_issues, self.subtasks),
+            'summary': lambda: self.extractor.display_utils.show_extraction_summary(self.data),
+            'excel_export': lambda: self._export(self.extractor.excel_exporter, 'xlsx'),
+            'csv_export': lambda: self._export(self.extractor.csv_exporter, 'csv'),
+            'export_both': self._export_both,
+            'sqlite_export': self._export_sqlite,
+            'parquet_export': lambda: self._export(self.extractor.exporters['parquet'], 'parquet')
+        }[name]
+
+    def _parse_issues(self) -> None:
+        self.issues = [Issue({}, None, raw) for raw in self.project.issues]
+
+    def _process(self) -> None:
+        # Los objetos Issue no se pueden enviar a otros procesos: siempre en este proceso
+        workers, self.extractor.workers = self.extractor.workers, 1
+        try:
+            self.data = self.extractor._process_issues(self.issues)
+        finally:
+            self.extractor.workers = workers
+
+    def _process_raw(self) -> None:
+        self.data = self.extractor._process_issues(self.project.issues)
+
+    def _export(self, exporter, extension: str) -> None:
+        if not exporter.export(self.data, 'BENCH', f"bench_{self.size}.{extension}"):
+            raise RuntimeError(f"Falló la exportación {extension}")
+
+    def _export_sqlite(self) -> None:
+        exporter = self.extractor.exporters['sqlite']
+        if not exporter.export(self.data, 'BENCH', f"bench_{self.size}.sqlite3", subtasks=self.subtasks):
+            raise RuntimeError("Falló la exportación sqlite")
+
+    def _export_both(self) -> None:
+        if not self.extractor._export_data(self.data, 'BENCH', 'both'):
+            raise RuntimeError("Falló la exportación both")
+
+
+def measure(func: Callable[[], Any], repeat: int, memory: bool) -> Dict[str, float]:
+    """
+    Mide una etapa: mejor tiempo de `repeat` corridas y memoria pico
+
+    La salida de consola de los componentes se descarta (se sigue pagando
+    el costo de renderizarla).
+    """
+    sink = io.StringIO()
+    best = float('inf')
+
+    with contextlib.redirect_stdout(sink):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+            sink.seek(0)
+            sink.truncate()
+
+        peak = None
+        if memory:
+            tracemalloc.start()
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    return {'seconds': best, 'peak_mb': peak / (1024 * 1024) if peak is not None else None}
+
+
+def load_baseline(path: Path) -> Dict[str, Any]:
+    """Carga el baseline si existe"""
+    if not path.exists():
+        return {}
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark del pipeline extracción → exportación')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000],
+                        help='Cantidad de issues por corrida (ej: 1000 10000 100000)')
+    parser.add_argument('--subtasks', type=int, default=3, help='Subtareas por historia en promedio')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=DEFAULT_STAGES,
+                        help='Etapas a medir (las anteriores se ejecutan igual para preparar datos)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Procesos de extracción para process_raw_issues (como --workers de main.py)')
+    parser.add_argument('--repeat', type=int, default=3, help='Repeticiones por etapa (se toma la mejor)')
+    parser.add_argument('--no-memory', action='store_true', help='No medir memoria pico (más rápido)')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help='Archivo JSON de baseline')
+    parser.add_argument('--save-baseline', action='store_true', help='Guardar los resultados como baseline')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='Regresión de tiempo tolerada respecto del baseline (0.5 = 50%%)')
+    parser.add_argument('--min-delta', type=float, default=0.1,
+                        help='Diferencia mínima en segundos para considerar una regresión (evita ruido)')
+    parser.add_argument('--json', type=Path, help='Guardar también los resultados de esta corrida en JSON')
+    args = parser.parse_args()
+
+    console = Console()
+    baseline = load_baseline(args.baseline).get('results', {})
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    regressions = []
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        # Los exportadores escriben en un directorio temporal
+        EXPORT_CONFIG['reports_dir'] = output_dir
+
+        for size in args.sizes:
+            console.print(f"⚙️ [cyan]Generando proyecto sintético de ~{size} issues...[/cyan]")
+            bench = PipelineBenchmark(size, args.subtasks, args.workers)
+            size_results = {}
+
+            table = Table(title=f"⏱️ Pipeline: {bench.size} issues", show_header=True)
+            table.add_column("Etapa", style="cyan", no_wrap=True, min_width=21)
+            table.add_column("Tiempo (s)", style="green")
+            table.add_column("Issues/s", style="green")
+            table.add_column("Memoria pico (MB)", style="yellow")
+            table.add_column("vs baseline", style="magenta")
+
+            last_stage = max(STAGES.index(name) for name in args.stages)
+            for name in STAGES[:last_stage + 1]:
+                measured = name in args.stages
+                result = measure(bench.stage(name), args.repeat if measured else 1,
+                                 memory=measured and not args.no_memory)
+                if not measured:
+                    continue
+
+                result['issues_per_sec'] = bench.size / result['seconds'] if result['seconds'] else None
+                size_results[name] = result
+
+                previous = baseline.get(str(size), {}).get(name)
+                delta_text = '-'
+                if previous:
+                    delta = result['seconds'] / previous['seconds'] - 1
+                    delta_text = f"{delta:+.0%}"
+                    if delta > args.tolerance and result['seconds'] - previous['seconds'] > args.min_delta:
+                        regressions.append(f"{name} ({size} issues): {delta:+.0%}")
+                        delta_text = f"[red]{delta_text}[/red]"
+
+                table.add_row(
+                    name,
+                    f"{result['seconds']:.3f}",
+                    f"{result['issues_per_sec']:,.0f}" if result['issues_per_sec'] else '-',
+                    f"{result['peak_mb']:.1f}" if result['peak_mb'] is not None else '-',
+                    delta_text
+                )
+
+            results[str(size)] = size_results
+            console.print(table)
+
+    report = {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'subtasks_per_story': args.subtasks,
+            'workers': args.workers,
+            'repeat': args.repeat
+        },
+        'results': results
+    }
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding='utf-8')
+        console.print(f"💾 [green]Resultados guardados en {args.json}[/green]")
+
+    if args.save_baseline:
+        # Conservar los tamaños y etapas del baseline que no se midieron en esta corrida
+        merged = load_baseline(args.baseline)
+        merged_results = merged.get('results', {})
+        for size, size_results in results.items():
+            merged_results.setdefault(size, {}).update(size_results)
+        report['results'] = merged_results
+        os.makedirs(args.baseline.parent, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2), encoding='utf-8')
+        console.print(f"💾 [green]Baseline actualizado: {args.baseline}[/green]")
+
+    if regressions and not args.save_baseline:
+        console.print(f"❌ [red]Regresiones mayores a {args.tolerance:.0%}:[/red]")
+        for regression in regressions:
+            console.print(f"   • {regression}")
+        sys.exit(1)
+
+    console.print("✅ [green]Sin regresiones respecto del baseline[/green]" if baseline
+                  else "ℹ️ [dim]Sin baseline para comparar (usar --save-baseline)[/dim]")
+
+
+if __name__ == '__main__':
+    main()
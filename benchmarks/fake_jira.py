@@ -0,0 +1,334 @@
+"""
+Servidor Jira falso para benchmarks locales
+
+Implementa la parte de la API REST que usa el extractor (serverInfo, myself,
+field, search y los endpoints Agile de boards y sprints) sobre datos
+sintéticos, con latencia configurable por request para simular la red y
+rechazos 429 inyectados para probar el limitador de tasa.
+"""
+import json
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Any, Optional
+from urllib.parse import urlparse, parse_qs
+
+from benchmarks.synthetic_data import SyntheticProject, generate_issues, generate_project
+
+# Cláusulas JQL que entiende la búsqueda falsa (el resto se ignora)
+PROJECT_PATTERN = re.compile(r'\bproject\s*=\s*"?([\w-]+)"?', re.IGNORECASE)
+SPRINT_PATTERN = re.compile(r'\bsprint\s*=\s*(\d+)', re.IGNORECASE)
+SPRINT_IN_PATTERN = re.compile(r'\bsprint\s+in\s*\(([^)]*)\)', re.IGNORECASE)
+STATUS_NOT_IN_PATTERN = re.compile(r'\bstatus\s+not\s+in\s*\(([^)]*)\)', re.IGNORECASE)
+UPDATED_SINCE_PATTERN = re.compile(r'\bupdated\s*>=\s*"(\d{4}/\d{2}/\d{2} \d{2}:\d{2})"', re.IGNORECASE)
+UPDATED_RELATIVE_PATTERN = re.compile(r'\bupdated\s*>=\s*-(\d+)d', re.IGNORECASE)
+ORDER_BY_PATTERN = re.compile(r'\bORDER\s+BY\s+(\w+)(?:\s+(ASC|DESC))?', re.IGNORECASE)
+
+AGILE_PAGE_SIZE = 50
+
+__all__ = ['FakeJiraServer', 'SyntheticProject', 'generate_issues', 'generate_project']
+
+
+class FakeJiraServer:
+    """Servidor HTTP local que responde como una instancia de Jira"""
+
+    def __init__(self, issues: List[Dict[str, Any]], latency: float = 0.05,
+                 max_page_size: int = 100, boards: Optional[List[Dict[str, Any]]] = None,
+                 sprints: Optional[Dict[int, List[Dict[str, Any]]]] = None,
+                 throttle_every: int = 0, retry_after: float = 0.0):
+        """
+        Args:
+            issues: Issues que devuelve la búsqueda
+            latency: Segundos de espera por request
+            max_page_size: Máximo maxResults aceptado por la búsqueda
+            boards: Boards de la API Agile (None = sin boards)
+            sprints: Sprints de cada board {board_id: [sprint, ...]}
+            throttle_every: Responder 429 a uno de cada N requests (0 = nunca)
+            retry_after: Valor del header Retry-After de los 429 (segundos)
+        """
+        self.issues = issues
+        self.latency = latency
+        self.max_page_size = max_page_size
+        self.boards = boards or []
+        self.sprints = sprints or {}
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.request_count = 0
+        self.throttled_count = 0
+        self._sprints_by_id = {sprint['id']: sprint for board_sprints in self.sprints.values()
+                               for sprint in board_sprints}
+        self._search_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @classmethod
+    def from_project(cls, project: SyntheticProject, **kwargs) -> 'FakeJiraServer':
+        """
+        Crea un servidor que expone un proyecto sintético completo
+
+        Args:
+            project: Proyecto generado con generate_project
+            **kwargs: Opciones del servidor (latency, throttle_every, ...)
+        """
+        return cls(project.issues, boards=project.boards, sprints=project.sprints, **kwargs)
+
+    @property
+    def url(self) -> str:
+        """URL base del servidor"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakeJiraServer':
+        """Inicia el servidor en un hilo de fondo"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Detiene el servidor"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'FakeJiraServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def handle(self, path: str, params: Dict[str, str]) -> Any:
+        """
+        Resuelve un request GET
+
+        Args:
+            path: Ruta del request
+            params: Parámetros de query (valores repetidos unidos con comas)
+
+        Returns:
+            Cuerpo JSON de la respuesta (None = 404)
+        """
+        if path.startswith('/rest/agile/'):
+            return self._handle_agile(path, params)
+        if path.endswith('/serverInfo'):
+            return {'baseUrl': self.url, 'version': '9.0.0', 'versionNumbers': [9, 0, 0],
+                    'deploymentType': 'Server'}
+        if path.endswith('/myself'):
+            return {'name': 'bench', 'displayName': 'Benchmark', 'accountId': 'bench',
+                    'timeZone': 'UTC'}
+        if path.endswith('/field'):
+            return [
+                {'id': 'summary', 'name': 'Summary', 'custom': False, 'schema': {'type': 'string', 'system': 'summary'}},
+                {'id': 'parent', 'name': 'Parent', 'custom': False},
+                {'id': 'customfield_10007', 'name': 'Sprint', 'custom': True,
+                 'schema': {'type': 'array', 'items': 'string', 'custom': 'com.pyxis.greenhopper.jira:gh-sprint'}},
+                {'id': 'customfield_10014', 'name': 'Epic Link', 'custom': True,
+                 'schema': {'type': 'any', 'custom': 'com.pyxis.greenhopper.jira:gh-epic-link'}},
+                {'id': 'customfield_10008', 'name': 'Epic Name', 'custom': True,
+                 'schema': {'type': 'string', 'custom': 'com.pyxis.greenhopper.jira:gh-epic-label'}}
+            ]
+        if path.endswith('/search'):
+            return self._search(params)
+        return None
+
+    def _search(self, params: Dict[str, str]) -> Dict[str, Any]:
+        """Página de /rest/api/2/search con filtro JQL y proyección de campos"""
+        matches = self._filter_issues(params.get('jql', ''))
+        start_at = int(params.get('startAt', 0))
+        max_results = min(int(params.get('maxResults', 50)), self.max_page_size)
+        page = matches[start_at:start_at + max_results]
+
+        requested = params.get('fields', '*all')
+        if requested not in ('*all', '*navigable', ''):
+            wanted = set(requested.split(','))
+            page = [{**issue, 'fields': {name: value for name, value in issue['fields'].items()
+                                         if name in wanted}} for issue in page]
+
+        return {'startAt': start_at, 'maxResults': max_results,
+                'total': len(matches), 'issues': page}
+
+    def _filter_issues(self, jql: str) -> List[Dict[str, Any]]:
+        """
+        Aplica las cláusulas conocidas del JQL (con cache por query)
+
+        Soporta `project = X`, `sprint = N` (unidas con OR), `sprint in (...)`,
+        `status NOT IN (...)`, `updated >= "yyyy/MM/dd HH:mm"` (UTC),
+        `updated >= -Nd` y `ORDER BY updated|created [ASC|DESC]`.
+        """
+        with self._lock:
+            cached = self._search_cache.get(jql)
+        if cached is not None:
+            return cached
+
+        project_match = PROJECT_PATTERN.search(jql)
+        project_key = project_match.group(1) if project_match else None
+
+        sprint_ids = {int(value) for value in SPRINT_PATTERN.findall(jql)}
+        for group in SPRINT_IN_PATTERN.findall(jql):
+            sprint_ids.update(int(value) for value in group.split(',') if value.strip().isdigit())
+
+        excluded_statuses = set()
+        for group in STATUS_NOT_IN_PATTERN.findall(jql):
+            excluded_statuses.update(value.strip().strip('"').lower() for value in group.split(','))
+
+        updated_since = self._updated_since(jql)
+
+        matches = []
+        for issue in self.issues:
+            fields = issue['fields']
+            if project_key and issue['key'].rsplit('-', 1)[0] != project_key:
+                continue
+            if sprint_ids:
+                issue_sprints = {sprint['id'] for sprint in fields.get('customfield_10007') or []}
+                if not issue_sprints & sprint_ids:
+                    continue
+            if excluded_statuses and (fields.get('status') or {}).get('name', '').lower() in excluded_statuses:
+                continue
+            if updated_since and fields.get('updated', '') < updated_since:
+                continue
+            matches.append(issue)
+
+        order_match = ORDER_BY_PATTERN.search(jql)
+        if order_match:
+            field = order_match.group(1)
+            descending = (order_match.group(2) or 'ASC').upper() == 'DESC'
+            matches.sort(key=lambda issue: issue['fields'].get(field) or '', reverse=descending)
+
+        with self._lock:
+            self._search_cache[jql] = matches
+        return matches
+
+    def _updated_since(self, jql: str) -> Optional[str]:
+        """Límite inferior de `updated` en el formato de las fechas de los issues"""
+        since = None
+        absolute = UPDATED_SINCE_PATTERN.search(jql)
+        relative = UPDATED_RELATIVE_PATTERN.search(jql)
+
+        if absolute:
+            since = datetime.strptime(absolute.group(1), '%Y/%m/%d %H:%M')
+        elif relative:
+            since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=int(relative.group(1)))
+
+        return since.strftime('%Y-%m-%dT%H:%M:%S.000+0000') if since else None
+
+    def _handle_agile(self, path: str, params: Dict[str, str]) -> Any:
+        """Resuelve /rest/agile/1.0/board, /board/{id}/sprint y /sprint/{id}"""
+        parts = path.rstrip('/').split('/')[4:]
+
+        if parts == ['board']:
+            boards = self.boards
+            project_filter = params.get('projectKeyOrId')
+            if project_filter:
+                boards = [board for board in boards
+                          if board.get('location', {}).get('projectKey') == project_filter]
+            return self._agile_page(boards, params)
+
+        if len(parts) == 3 and parts[0] == 'board' and parts[2] == 'sprint':
+            board_sprints = self.sprints.get(int(parts[1]))
+            if board_sprints is None:
+                return None
+            states = params.get('state')
+            if states:
+                allowed = set(states.split(','))
+                board_sprints = [sprint for sprint in board_sprints if sprint['state'] in allowed]
+            return self._agile_page(board_sprints, params)
+
+        if len(parts) == 2 and parts[0] == 'sprint' and parts[1].isdigit():
+            return self._sprints_by_id.get(int(parts[1]))
+
+        return None
+
+    def _agile_page(self, values: List[Dict[str, Any]], params: Dict[str, str]) -> Dict[str, Any]:
+        """Página en el formato de la API Agile (startAt/maxResults/isLast/values)"""
+        start_at = int(params.get('startAt', 0))
+        max_results = min(int(params.get('maxResults', AGILE_PAGE_SIZE)), AGILE_PAGE_SIZE)
+        page = values[start_at:start_at + max_results]
+        return {'startAt': start_at, 'maxResults': max_results,
+                'isLast': start_at + len(page) >= len(values), 'values': page}
+
+    def _next_request(self) -> bool:
+        """Cuenta un request y decide si se rechaza con 429"""
+        with self._lock:
+            self.request_count += 1
+            throttled = bool(self.throttle_every) and self.request_count % self.throttle_every == 0
+            if throttled:
+                self.throttled_count += 1
+            return throttled
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                throttled = server._next_request()
+                if server.latency > 0:
+                    time.sleep(server.latency)
+
+                headers = {'Content-Type': 'application/json'}
+                if throttled:
+                    status = 429
+                    body = {'errorMessages': ['Rate limit exceeded']}
+                    headers['Retry-After'] = str(server.retry_after)
+                else:
+                    parsed = urlparse(self.path)
+                    params = {k: ','.join(v) for k, v in parse_qs(parsed.query).items()}
+                    body = server.handle(parsed.path, params)
+                    status = 200 if body is not None else 404
+                    if body is None:
+                        body = {'errorMessages': ['Not found']}
+
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    """Levanta el servidor con un proyecto sintético hasta Ctrl+C"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Jira falso local con datos sintéticos')
+    parser.add_argument('--project', default='BENCH', help='Clave del proyecto')
+    parser.add_argument('--boards', type=int, default=2, help='Cantidad de boards')
+    parser.add_argument('--sprints', type=int, default=6, help='Sprints por board')
+    parser.add_argument('--epics', type=int, default=10, help='Cantidad de epics')
+    parser.add_argument('--stories', type=int, default=1000, help='Historias, tareas y bugs')
+    parser.add_argument('--subtasks', type=int, default=3, help='Subtareas por historia (promedio)')
+    parser.add_argument('--seed', type=int, default=42, help='Semilla del generador')
+    parser.add_argument('--latency', type=float, default=0.05, help='Latencia simulada por request (s)')
+    parser.add_argument('--throttle-every', type=int, default=0, help='Responder 429 a uno de cada N requests')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After de los 429 (s)')
+    args = parser.parse_args()
+
+    project = generate_project(args.project, boards=args.boards, sprints_per_board=args.sprints,
+                               epics=args.epics, stories=args.stories,
+                               subtasks_per_story=args.subtasks, seed=args.seed)
+    server = FakeJiraServer.from_project(project, latency=args.latency,
+                                         throttle_every=args.throttle_every,
+                                         retry_after=args.retry_after)
+
+    with server:
+        print(f"Jira falso en {server.url} ({project.get_stats()})")
+        print(f"  JIRA_SERVER={server.url} JIRA_EMAIL=bench JIRA_API_TOKEN=bench "
+              f"python main.py --project {args.project}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,291 @@
+"""
+Generador de proyectos Jira sintéticos para benchmarks y pruebas de carga
+
+Produce boards, sprints, epics, historias y subtareas con la forma de la API
+REST (los mismos campos que leen los extractores), de manera determinística
+a partir de una semilla.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any
+
+from src.config import CUSTOM_FIELDS
+
+# Tipos de issue de nivel superior (no epics) y subtareas por categoría
+STORY_TYPES = ['Historia', 'Historia', 'Tarea', 'Bug']
+SUBTASK_SUMMARIES = [
+    'Análisis funcional',
+    'Diseño técnico',
+    'Desarrollo backend',
+    'Implementación frontend',
+    'Testing integración',
+    'QA regresión',
+    'Revisión de código'
+]
+STATUSES = ['Por hacer', 'En curso', 'En revisión', 'Finalizado']
+PRIORITIES = ['Alta', 'Media', 'Baja']
+
+JIRA_DATE_FORMAT = '%Y-%m-%dT%H:%M:%S.000+0000'
+AGILE_DATE_FORMAT = '%Y-%m-%dT%H:%M:%S.000Z'
+
+
+class SyntheticProject:
+    """Proyecto sintético: boards, sprints por board e issues en formato REST"""
+
+    def __init__(self, project_key: str, boards: List[Dict[str, Any]],
+                 sprints: Dict[int, List[Dict[str, Any]]], issues: List[Dict[str, Any]]):
+        """
+        Args:
+            project_key: Clave del proyecto
+            boards: Boards en formato de la API Agile
+            sprints: Sprints de cada board {board_id: [sprint, ...]}
+            issues: Issues (epics, historias y subtareas) en formato de búsqueda
+        """
+        self.project_key = project_key
+        self.boards = boards
+        self.sprints = sprints
+        self.issues = issues
+
+    @property
+    def all_sprints(self) -> List[Dict[str, Any]]:
+        """Sprints de todos los boards"""
+        return [sprint for board_sprints in self.sprints.values() for sprint in board_sprints]
+
+    @property
+    def active_sprint_ids(self) -> List[int]:
+        """IDs de los sprints activos"""
+        return [sprint['id'] for sprint in self.all_sprints if sprint['state'] == 'active']
+
+    def get_stats(self) -> Dict[str, int]:
+        """Cantidad de elementos generados por tipo"""
+        subtasks = sum(1 for issue in self.issues if issue['fields']['issuetype']['subtask'])
+        epics = sum(1 for issue in self.issues if issue['fields']['issuetype']['name'] == 'Epic')
+        return {
+            'boards': len(self.boards),
+            'sprints': len(self.all_sprints),
+            'epics': epics,
+            'stories': len(self.issues) - subtasks - epics,
+            'subtasks': subtasks,
+            'issues': len(self.issues)
+        }
+
+
+def generate_project(project_key: str = 'BENCH', boards: int = 2, sprints_per_board: int = 6,
+                     epics: int = 10, stories: int = 1000, subtasks_per_story: int = 3,
+                     seed: int = 42) -> SyntheticProject:
+    """
+    Genera un proyecto sintético completo
+
+    Cada board tiene un sprint activo (el último) y el resto cerrados, todos
+    creados dentro de la ventana de sprints recientes. Las historias se
+    reparten entre sprints y epics en orden; las subtareas heredan el sprint
+    de su padre y su resumen cae en las categorías de SUBTASK_MAPPING.
+
+    Args:
+        project_key: Clave del proyecto
+        boards: Cantidad de boards
+        sprints_per_board: Sprints por board
+        epics: Cantidad de epics
+        stories: Cantidad de issues de nivel superior (historias, tareas, bugs)
+        subtasks_per_story: Subtareas por historia en promedio (varía entre 0 y el doble)
+        seed: Semilla del generador
+
+    Returns:
+        Proyecto sintético
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+
+    board_list = []
+    sprints_by_board = {}
+    sprint_id = 1000
+
+    for board_index in range(boards):
+        board_id = board_index + 1
+        board_list.append({
+            'id': board_id,
+            'self': f"http://fake/rest/agile/1.0/board/{board_id}",
+            'name': f"{project_key} Board {board_id}",
+            'type': 'scrum',
+            'location': {'projectKey': project_key, 'projectName': f"Proyecto {project_key}"}
+        })
+
+        board_sprints = []
+        for sprint_index in range(sprints_per_board):
+            sprint_id += 1
+            weeks_ago = 2 * (sprints_per_board - sprint_index - 1)
+            start = now - timedelta(weeks=weeks_ago, days=1)
+            end = start + timedelta(weeks=2)
+            active = sprint_index == sprints_per_board - 1
+
+            sprint = {
+                'id': sprint_id,
+                'self': f"http://fake/rest/agile/1.0/sprint/{sprint_id}",
+                'state': 'active' if active else 'closed',
+                'name': f"{project_key} Sprint {sprint_index + 1} (B{board_id})",
+                'startDate': start.strftime(AGILE_DATE_FORMAT),
+                'endDate': end.strftime(AGILE_DATE_FORMAT),
+                'createdDate': (start - timedelta(days=1)).strftime(AGILE_DATE_FORMAT),
+                'originBoardId': board_id,
+                'goal': f"Objetivo {sprint_index + 1}"
+            }
+            if not active:
+                sprint['completeDate'] = end.strftime(AGILE_DATE_FORMAT)
+            board_sprints.append(sprint)
+
+        sprints_by_board[board_id] = board_sprints
+
+    all_sprints = [sprint for board_sprints in sprints_by_board.values() for sprint in board_sprints]
+    issues = []
+    counter = 0
+
+    def next_key() -> str:
+        nonlocal counter
+        counter += 1
+        return f"{project_key}-{counter}"
+
+    epic_keys = []
+    for epic_index in range(epics):
+        key = next_key()
+        epic_keys.append(key)
+        issues.append(_build_issue(rng, key, counter, project_key, now,
+                                   issue_type='Epic', summary=f"Epic sintético {epic_index + 1}"))
+
+    for story_index in range(stories):
+        key = next_key()
+        story_id = counter
+        sprint = all_sprints[story_index % len(all_sprints)] if all_sprints else None
+        epic_key = epic_keys[story_index % len(epic_keys)] if epic_keys else None
+        issue_type = STORY_TYPES[story_index % len(STORY_TYPES)]
+
+        story = _build_issue(rng, key, story_id, project_key, now, issue_type=issue_type,
+                             summary=f"{issue_type} sintética {story_index + 1}",
+                             sprint=sprint, epic_key=epic_key)
+        issues.append(story)
+
+        # Variar la cantidad de subtareas (0, n o 2n) manteniendo el promedio n
+        subtask_count = subtasks_per_story * (1, 2, 0, 1)[story_index % 4]
+
+        aggregates = {name: story['fields']['timetracking'].get(f"{name}Seconds", 0)
+                      for name in ('timeSpent', 'originalEstimate', 'remainingEstimate')}
+
+        for subtask_index in range(subtask_count):
+            subtask_key = next_key()
+            summary = SUBTASK_SUMMARIES[(story_index + subtask_index) % len(SUBTASK_SUMMARIES)]
+            subtask = _build_issue(rng, subtask_key, counter, project_key, now,
+                                   issue_type='Sub-tarea', summary=f"{summary} {key}",
+                                   sprint=sprint, parent_key=key)
+            issues.append(subtask)
+
+            for name in aggregates:
+                aggregates[name] += subtask['fields']['timetracking'].get(f"{name}Seconds", 0)
+
+        story['fields']['aggregatetimespent'] = aggregates['timeSpent'] or None
+        story['fields']['aggregatetimeoriginalestimate'] = aggregates['originalEstimate'] or None
+        story['fields']['aggregatetimeestimate'] = aggregates['remainingEstimate'] or None
+
+    return SyntheticProject(project_key, board_list, sprints_by_board, issues)
+
+
+def _build_issue(rng: random.Random, key: str, number: int, project_key: str, now: datetime,
+                 issue_type: str, summary: str, sprint: Dict[str, Any] = None,
+                 epic_key: str = None, parent_key: str = None) -> Dict[str, Any]:
+    """Construye un issue en el formato JSON de la búsqueda REST"""
+    issue_id = str(10000 + number)
+    created = now - timedelta(days=rng.randint(1, 120), minutes=rng.randint(0, 1440))
+    updated = created + timedelta(days=rng.randint(0, 30), minutes=rng.randint(0, 1440))
+    if updated > now:
+        updated = now - timedelta(minutes=rng.randint(1, 600))
+
+    # Tiempos en múltiplos de 15 minutos (algunos issues sin registrar)
+    time_spent = 900 * rng.randint(0, 48)
+    original_estimate = 900 * rng.randint(0, 64)
+    remaining = max(0, original_estimate - time_spent)
+    timetracking = {}
+    if original_estimate:
+        timetracking['originalEstimateSeconds'] = original_estimate
+        timetracking['remainingEstimateSeconds'] = remaining
+    if time_spent:
+        timetracking['timeSpentSeconds'] = time_spent
+
+    fields = {
+        'summary': summary,
+        'issuetype': {'name': issue_type, 'subtask': parent_key is not None},
+        'status': {'name': rng.choice(STATUSES)},
+        'priority': {'name': rng.choice(PRIORITIES)},
+        'assignee': {'displayName': f"Usuario {rng.randint(1, 12)}"} if rng.random() > 0.1 else None,
+        'reporter': {'displayName': f"Reporter {rng.randint(1, 4)}"},
+        'created': created.strftime(JIRA_DATE_FORMAT),
+        'updated': updated.strftime(JIRA_DATE_FORMAT),
+        'project': {'key': project_key, 'name': f"Proyecto {project_key}"},
+        'timetracking': timetracking,
+        'aggregatetimespent': time_spent or None,
+        'aggregatetimeoriginalestimate': original_estimate or None,
+        'aggregatetimeestimate': remaining or None,
+        'components': [{'name': f"Componente {rng.randint(1, 5)}"}] if rng.random() > 0.5 else [],
+        'labels': [f"label{rng.randint(1, 8)}"] if rng.random() > 0.6 else [],
+        'fixVersions': [{'name': f"v1.{rng.randint(0, 9)}"}] if rng.random() > 0.7 else [],
+        'customfield_10007': None,
+        'customfield_10014': epic_key,
+        'customfield_10008': None
+    }
+
+    if sprint:
+        fields['customfield_10007'] = [{
+            'id': sprint['id'],
+            'name': sprint['name'],
+            'state': sprint['state'],
+            'boardId': sprint['originBoardId'],
+            'goal': sprint['goal']
+        }]
+
+    if parent_key:
+        fields['parent'] = {'key': parent_key}
+
+    for field_id in CUSTOM_FIELDS.values():
+        fields[field_id] = {'value': f"Opción {rng.randint(1, 3)}"} if rng.random() > 0.5 else None
+
+    return {
+        'id': issue_id,
+        'key': key,
+        'self': f"http://fake/rest/api/2/issue/{issue_id}",
+        'fields': fields
+    }
+
+
+def generate_issues(project_key: str, count: int) -> List[Dict[str, Any]]:
+    """
+    Genera issues sintéticos simples (sin sprints ni subtareas)
+
+    Args:
+        project_key: Clave del proyecto
+        count: Cantidad de issues a generar
+
+    Returns:
+        Lista de issues en formato JSON de la API REST
+    """
+    issues = []
+    for i in range(1, count + 1):
+        key = f"{project_key}-{i}"
+        issues.append({
+            'id': str(10000 + i),
+            'key': key,
+            'self': f"http://fake/rest/api/2/issue/{10000 + i}",
+            'fields': {
+                'summary': f"Issue sintético {i}",
+                'issuetype': {'name': 'Historia', 'subtask': False},
+                'status': {'name': 'En curso'},
+                'priority': {'name': 'Media'},
+                'assignee': {'displayName': f"Usuario {i % 7}"},
+                'reporter': {'displayName': 'Reporter'},
+                'created': '2024-01-01T10:00:00.000+0000',
+                'updated': '2024-01-02T10:00:00.000+0000',
+                'project': {'key': project_key},
+                'timetracking': {'timeSpentSeconds': 3600 * (i % 5)},
+                'aggregatetimespent': 3600 * (i % 5),
+                'components': [],
+                'labels': [],
+                'fixVersions': []
+            }
+        })
+    return issues
@@ -11,6 +11,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from src.jira_extractor import JiraDataExtractor
+from src.config import RECORDING_CONFIG
+from src.exporters import get_format_choices, get_unavailable_formats
+from src.exporters.parquet_exporter import PARTITION_COLUMNS
 
 
 def main():
@@ -30,6 +33,31 @@ Ejemplos de uso:
   
   # Limitar a 1000 issues:
   python main.py --project CMZ100 --limit 1000
+  
+  # Descargar 8 páginas en paralelo:
+  python main.py --project CMZ100 --concurrency 8
+  
+  # Extraer los issues en 4 procesos:
+  python main.py --project CMZ100 --workers 4
+  
+  # CSV comprimido y dividido en partes de 100.000 filas:
+  python main.py --project CMZ100 --format csv --csv-compression gzip --csv-rows-per-file 100000
+  
+  # Parquet particionado por proyecto y sprint (requiere pyarrow):
+  python main.py --project CMZ100 --format parquet --parquet-partition-by project_key sprint_id
+  
+  # Actualizar la base SQLite de reportes (upsert de issues, subtareas y sprints):
+  python main.py --project CMZ100 --format sqlite
+  
+  # Sincronización incremental (solo issues actualizados):
+  python main.py --project CMZ100 --incremental
+  
+  # Volver a descargar boards y sprints ignorando el cache:
+  python main.py --project CMZ100 --refresh-metadata
+  
+  # Grabar las respuestas de Jira y reproducirlas luego sin red:
+  python main.py --project CMZ100 --record
+  python main.py --project CMZ100 --replay
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
@@ -42,9 +70,9 @@ Ejemplos de uso:
     
     parser.add_argument(
         '--format',
-        choices=['excel', 'csv', 'both'],
+        choices=get_format_choices(),
         default='both',
-        help='Formato de exportación (por defecto: both)'
+        help='Formato de exportación: both = excel y csv, all = todos los disponibles (por defecto: both)'
     )
     
     parser.add_argument(
@@ -59,19 +87,102 @@ Ejemplos de uso:
         help='Usar búsqueda tradicional sin selección de sprints'
     )
     
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        help='Páginas de Jira a descargar en paralelo (por defecto: 1, secuencial)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Procesos que extraen los issues en paralelo (por defecto: 1, en el proceso principal)'
+    )
+    
+    parser.add_argument(
+        '--csv-compression',
+        choices=['gzip', 'zstd'],
+        help='Comprimir el CSV al escribirlo (zstd requiere el paquete zstandard)'
+    )
+    
+    parser.add_argument(
+        '--csv-rows-per-file',
+        type=int,
+        metavar='N',
+        help='Dividir el CSV en partes de N filas, cada una con encabezado'
+    )
+    
+    parser.add_argument(
+        '--parquet-partition-by',
+        nargs='+',
+        choices=PARTITION_COLUMNS,
+        metavar='COLUMNA',
+        help=f"Particionar el Parquet por columnas ({', '.join(PARTITION_COLUMNS)})"
+    )
+    
+    parser.add_argument(
+        '--refresh-metadata',
+        action='store_true',
+        help='Ignorar el cache de boards y sprints y volver a descargarlos'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Descargar solo issues actualizados desde la última sincronización (almacén local)'
+    )
+    
+    http_group = parser.add_mutually_exclusive_group()
+    http_group.add_argument(
+        '--record',
+        nargs='?',
+        const=RECORDING_CONFIG['path'],
+        metavar='DIR',
+        help=f"Grabar las respuestas de Jira en DIR (por defecto: {RECORDING_CONFIG['path']})"
+    )
+    http_group.add_argument(
+        '--replay',
+        nargs='?',
+        const=RECORDING_CONFIG['path'],
+        metavar='DIR',
+        help='Reproducir una grabación sin acceder a Jira (no requiere credenciales)'
+    )
+    
     args = parser.parse_args()
     
+    # Formatos con dependencias opcionales (ej: parquet requiere pyarrow)
+    if args.format in get_unavailable_formats():
+        parser.error(f"el formato '{args.format}' requiere dependencias opcionales no instaladas (ver requirements.txt)")
+    
     # Determinar si usar sprints (por defecto sí, a menos que se especifique --no-sprints)
     use_sprints = not args.no_sprints
     
+    # Modo de acceso HTTP: normal, grabación o reproducción
+    if args.record:
+        http_mode, http_store = 'record', args.record
+    elif args.replay:
+        http_mode, http_store = 'replay', args.replay
+    else:
+        http_mode, http_store = None, None
+    
     # Crear y ejecutar extractor
-    extractor = JiraDataExtractor()
+    extractor = JiraDataExtractor(
+        concurrency=args.concurrency,
+        workers=args.workers,
+        csv_compression=args.csv_compression,
+        csv_rows_per_file=args.csv_rows_per_file,
+        parquet_partition_cols=args.parquet_partition_by,
+        refresh_metadata=args.refresh_metadata,
+        http_mode=http_mode,
+        http_store=http_store
+    )
     
     success = extractor.run(
         project_key=args.project,
         export_format=args.format,
         max_results=args.limit,
-        use_sprints=use_sprints
+        use_sprints=use_sprints,
+        incremental=args.incremental
     )
     
     # Código de salida
@@ -1,6 +1,7 @@
 """
 Configuración centralizada del extractor de Jira
 """
+import json
 import os
 from typing import Dict, Any
 from dotenv import load_dotenv
@@ -20,8 +21,36 @@ EXTRACTION_CONFIG = {
     'extract_all_issues': True,
     'max_issues_fallback': 5000,
     'page_size': 100,
-    'page_delay': 0.1,  # Segundos entre páginas para evitar rate limiting
+    'key_page_size': 1000,  # Página de la búsqueda solo de keys del modo incremental (si Jira la limita, se usa el tamaño real)
+    'concurrency': 1,  # Páginas descargadas en paralelo (1 = secuencial)
+    'prefetch_pages': 4,  # Páginas descargadas por adelantado mientras se extraen las anteriores (0 = sin solapamiento)
     'recent_sprint_days': 60,  # Días para considerar un sprint como "reciente"
+    'board_workers': 8,  # Boards consultados en paralelo al buscar sprints
+    'raw_json': True,  # Procesar issues como JSON (False = objetos Resource de la librería jira)
+    'workers': 1,  # Procesos que extraen los issues (1 = en el proceso principal; requiere raw_json)
+    'worker_chunk_size': None,  # Issues por lote enviado a los procesos (None = ajuste automático)
+    'worker_chunk_seconds': 0.1,  # Duración objetivo de cada lote con ajuste automático
+}
+
+# Configuración de la sesión HTTP compartida (API REST y API Agile)
+HTTP_CONFIG = {
+    'pool_connections': 10,  # Hosts distintos a mantener en el pool
+    'pool_maxsize': 10,  # Conexiones keep-alive por host (se amplía según concurrency)
+    'accept_encoding': 'gzip, deflate'
+}
+
+# Configuración del limitador de tasa adaptativo (token bucket)
+RATE_LIMIT_CONFIG = {
+    'initial_rate': 10.0,  # Requests por segundo al inicio
+    'min_rate': 0.5,  # Tasa mínima tras rechazos del servidor
+    'max_rate': 100.0,  # Tasa máxima alcanzable
+    'burst': 10,  # Requests consecutivos permitidos sin espera
+    'increase_step': 0.5,  # Aumento de tasa por cada respuesta exitosa
+    'decrease_factor': 0.5,  # Factor de reducción ante 429/503
+    'near_limit_ratio': 0.1,  # Fracción de X-RateLimit-Remaining considerada "cerca del límite"
+    'max_retries': 5,  # Reintentos ante 429/503
+    'backoff_base': 1.0,  # Segundos del primer backoff sin Retry-After
+    'backoff_max': 60.0  # Máximo backoff sin Retry-After
 }
 
 # Configuración de exportación
@@ -30,23 +59,92 @@ EXPORT_CONFIG = {
     'timestamp_format': '%Y%m%d_%H%M%S',
     'excel_sheet_name_template': '{project_key}_Data',
     'max_column_width': 50,
-    'min_column_width': 10
+    'min_column_width': 10,
+    'csv_compression': None,  # None, 'gzip' o 'zstd' (requiere el paquete zstandard)
+    'csv_rows_per_file': None,  # Filas por archivo CSV, dividiendo en partes (None = un solo archivo)
+    'export_workers': 4,  # Formatos escritos en paralelo, en hilos (1 = uno tras otro)
+    'parquet_compression': 'zstd',  # Códec de Parquet: 'zstd', 'snappy', 'gzip' o 'none'
+    'parquet_partition_cols': None  # Particiones Hive, ej: ['project_key', 'sprint_id'] (None = un archivo)
+}
+
+# Cache persistente de metadatos (boards, sprints, campos)
+CACHE_CONFIG = {
+    'path': os.path.join(EXPORT_CONFIG['reports_dir'], '.cache', 'metadata.sqlite3'),
+    'default_ttl': 3600,  # Segundos
+    'ttl': {
+        'boards': 24 * 3600,  # Boards de un proyecto
+        'sprints': 15 * 60,  # Sprints de un board por estado (cambian al abrir/cerrar sprints)
+        'sprint_details': 3600,  # Detalle de un sprint por ID
+        'fields': 24 * 3600,  # Definiciones de campos de la instancia
+        'capabilities': 7 * 24 * 3600  # Funcionalidades soportadas por la instancia
+    }
 }
 
-# Campos personalizados de Jira (customfields)
+# Almacén local de issues para la sincronización incremental (--incremental)
+ISSUE_STORE_CONFIG = {
+    'path': os.path.join(EXPORT_CONFIG['reports_dir'], '.cache', 'issues.sqlite3'),
+    'overlap_minutes': 5  # Solapamiento de la ventana `updated` (los upserts son idempotentes)
+}
+
+# Base SQLite con issues, subtareas, sprints y corridas (--format sqlite), actualizada en el lugar
+WAREHOUSE_CONFIG = {
+    'path': os.path.join(EXPORT_CONFIG['reports_dir'], 'warehouse.sqlite3')
+}
+
+# Grabación y reproducción de respuestas HTTP (--record / --replay)
+RECORDING_CONFIG = {
+    'path': os.path.join(EXPORT_CONFIG['reports_dir'], '.cache', 'http'),
+    'placeholder_server': 'https://replay.invalid'  # Servidor usado si la grabación no lo registró
+}
+
+# Campos de Jira cuyo ID depende de la instancia: se resuelven con /rest/api/2/field
+# (tipo del campo en schema.custom o nombre visible) y se usan los IDs por defecto
+# si la instancia no los informa. Los IDs resueltos se guardan en el cache ('fields')
+FIELD_ROLES = {
+    'sprint': {
+        'schema': 'com.pyxis.greenhopper.jira:gh-sprint',
+        'names': ['Sprint'],
+        'default': ['customfield_10007']
+    },
+    'epic_link': {
+        'schema': 'com.pyxis.greenhopper.jira:gh-epic-link',
+        'names': ['Epic Link'],
+        'default': ['customfield_10014', 'customfield_10008']
+    },
+    'parent': {
+        'schema': None,
+        'names': ['Parent'],
+        'default': ['parent']
+    }
+}
+
+# Campos personalizados de Jira (customfields): ID o nombre visible del campo
 CUSTOM_FIELDS = {
     'generico1': 'customfield_14399',
     'generico2': 'customfield_14400', 
     'generico3': 'customfield_14401'
 }
 
-# Mapeo de tipos de subtareas
+# Mapeo de tipos de subtareas: categoría → palabras clave, en orden de prioridad
+# (se puede reemplazar con un JSON indicado en SUBTASK_MAPPING_FILE)
 SUBTASK_MAPPING = {
     'analisis': ['analisis', 'análisis', 'analysis', 'diseño', 'design'],
     'testing': ['testing', 'test', 'qa', 'prueba', 'pruebas'],
     'desarrollo': ['desarrollo', 'dev', 'development', 'implementación', 'implementation']
 }
 
+if os.getenv('SUBTASK_MAPPING_FILE'):
+    with open(os.getenv('SUBTASK_MAPPING_FILE'), encoding='utf-8') as mapping_file:
+        SUBTASK_MAPPING = json.load(mapping_file)
+
+# Categoría de las subtareas que no coinciden con ninguna palabra clave
+SUBTASK_DEFAULT_CATEGORY = os.getenv('SUBTASK_DEFAULT_CATEGORY', 'desarrollo')
+
+# Categorías con columnas de tiempo agregado (las del mapeo más la categoría por defecto)
+SUBTASK_CATEGORIES = list(SUBTASK_MAPPING) + [
+    category for category in [SUBTASK_DEFAULT_CATEGORY] if category not in SUBTASK_MAPPING
+]
+
 # Configuración de columnas para exportación
 COLUMN_ORDER = {
     'base': ['epic_key', 'feature'],
@@ -55,9 +153,9 @@ COLUMN_ORDER = {
     'time': ['time_spent', 'original_estimate', 'remaining_estimate'],
     'aggregate_time': ['aggregate_time_spent', 'aggregate_original_estimate', 'aggregate_time_estimate'],
     'subtask': [
-        'analisis_time_spent', 'analisis_original_estimate', 'analisis_remaining',
-        'testing_time_spent', 'testing_original_estimate', 'testing_remaining',
-        'desarrollo_time_spent', 'desarrollo_original_estimate', 'desarrollo_remaining'
+        f'{category}_{metric}'
+        for category in SUBTASK_CATEGORIES
+        for metric in ('time_spent', 'original_estimate', 'remaining')
     ],
     'metadata': ['is_subtask', 'parent_key', 'sprint_name', 'sprint_id', 
                  'sprint_state', 'board_name', 'components', 'labels', 'fixversion',
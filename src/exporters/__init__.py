@@ -4,9 +4,23 @@ Exportadores de datos
 from .base_exporter import BaseExporter
 from .excel_exporter import ExcelExporter
 from .csv_exporter import CSVExporter
+from .parquet_exporter import ParquetExporter
+from .sqlite_exporter import SQLiteExporter
+from .csv_writer import CSVStreamWriter
+from .registry import EXPORTERS, FORMAT_ALIASES, register_exporter, get_format_choices, get_unavailable_formats, resolve_formats, create_exporters
 
 __all__ = [
     'BaseExporter',
     'ExcelExporter',
-    'CSVExporter'
+    'CSVExporter',
+    'ParquetExporter',
+    'SQLiteExporter',
+    'CSVStreamWriter',
+    'EXPORTERS',
+    'FORMAT_ALIASES',
+    'register_exporter',
+    'get_format_choices',
+    'get_unavailable_formats',
+    'resolve_formats',
+    'create_exporters'
 ]
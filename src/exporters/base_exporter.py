@@ -4,40 +4,71 @@ Exportador base para diferentes formatos
 import os
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import Iterable, List, Optional
 import pandas as pd
 from rich.console import Console
 
 from ..config import EXPORT_CONFIG, COLUMN_ORDER
+from ..models import IssueRecord
 
 
 class BaseExporter(ABC):
-    """Clase base para exportadores de datos"""
+    """
+    Clase base para exportadores de datos
+    
+    Los exportadores se registran por formato con `register_exporter`. Los
+    que escriben a partir de un DataFrame declaran `uses_frame = True` y
+    reciben la tabla compartida que arma `prepare_dataframe` una sola vez
+    para todos los formatos (ver JiraDataExtractor._export_data).
+    """
+    
+    # Nombre del formato (lo asigna register_exporter)
+    format_name = ''
+    
+    # Si True, export() usa el DataFrame compartido (parámetro frame)
+    uses_frame = False
+    
+    # Si True, export() recibe también las subtareas (parámetro subtasks), que
+    # no forman parte de los datos exportados porque se agregan en sus padres
+    uses_subtasks = False
     
     def __init__(self):
         self.console = Console()
     
+    @staticmethod
+    def is_available() -> bool:
+        """Indica si están instaladas las dependencias del formato"""
+        return True
+    
     @abstractmethod
-    def export(self, data: List[Dict[str, Any]], project_key: str, filename: str) -> bool:
+    def export(self, data: List[IssueRecord], project_key: str, filename: str = None,
+               frame: Optional[pd.DataFrame] = None) -> bool:
         """
         Exporta los datos al formato específico
         
         Args:
             data: Datos a exportar
             project_key: Clave del proyecto
-            filename: Nombre del archivo (sin extensión)
+            filename: Nombre del archivo (opcional, se genera automáticamente)
+            frame: DataFrame compartido de prepare_dataframe con numeric_times
+                (solo lectura; None = el exportador lo arma si lo necesita)
             
         Returns:
             True si la exportación fue exitosa
         """
         pass
     
-    def prepare_dataframe(self, data: List[Dict[str, Any]]) -> pd.DataFrame:
+    @staticmethod
+    def prepare_dataframe(data: List[IssueRecord], numeric_times: bool = False) -> pd.DataFrame:
         """
         Prepara el DataFrame con el orden de columnas correcto
         
+        Los tiempos se convierten a horas recién aquí.
+        
         Args:
             data: Datos a exportar
+            numeric_times: Si True, las horas quedan como números; si no, como
+                texto con coma decimal
             
         Returns:
             DataFrame preparado y ordenado
@@ -46,7 +77,23 @@ class BaseExporter(ABC):
             return pd.DataFrame()
         
         # Crear DataFrame
-        df = pd.DataFrame(data)
+        df = pd.DataFrame([record.to_dict(numeric_times) for record in data])
+        
+        return df[BaseExporter.order_columns(df.columns)]
+    
+    @staticmethod
+    def order_columns(columns: Iterable[str]) -> List[str]:
+        """
+        Ordena las columnas según COLUMN_ORDER (las no configuradas van al final)
+        
+        Args:
+            columns: Columnas presentes en los datos
+            
+        Returns:
+            Columnas en el orden de exportación
+        """
+        columns = list(columns)
+        present = set(columns)
         
         # Construir orden de columnas
         ordered_columns = []
@@ -59,15 +106,15 @@ class BaseExporter(ABC):
             COLUMN_ORDER['metadata']
         ]:
             for col in col_group:
-                if col in df.columns:
+                if col in present:
                     ordered_columns.append(col)
         
         # Agregar cualquier columna restante
-        for col in df.columns:
+        for col in columns:
             if col not in ordered_columns:
                 ordered_columns.append(col)
         
-        return df[ordered_columns]
+        return ordered_columns
     
     def ensure_reports_directory(self) -> str:
         """
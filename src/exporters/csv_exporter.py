@@ -2,21 +2,46 @@
 Exportador a formato CSV
 """
 import os
-from typing import List, Dict, Any
+from itertools import chain
+from typing import Iterable, Optional
+import pandas as pd
 from .base_exporter import BaseExporter
+from .csv_writer import CSVStreamWriter
+from .registry import register_exporter
+from ..models import IssueRecord
+from ..config import EXPORT_CONFIG
 
 
+@register_exporter('csv')
 class CSVExporter(BaseExporter):
     """Exportador especializado en formato CSV"""
     
-    def export(self, data: List[Dict[str, Any]], project_key: str, filename: str = None) -> bool:
+    def __init__(self, compression: Optional[str] = None, rows_per_file: Optional[int] = None):
+        """
+        Args:
+            compression: None, 'gzip' o 'zstd' (None = valor de configuración)
+            rows_per_file: Filas por archivo, dividiendo en partes (None = valor de configuración)
+        """
+        super().__init__()
+        self.compression = compression or EXPORT_CONFIG['csv_compression']
+        self.rows_per_file = rows_per_file or EXPORT_CONFIG['csv_rows_per_file']
+    
+    def export(self, data: Iterable[IssueRecord], project_key: str, filename: str = None,
+               frame: Optional[pd.DataFrame] = None) -> bool:
         """
         Exporta los datos a formato CSV
         
+        Las filas se escriben a medida que se recorren los datos, sin armar
+        un DataFrame: `data` puede ser cualquier iterable de registros. Las
+        columnas se fijan con el primer registro (todos comparten el mismo
+        esquema). No usa el DataFrame compartido: las horas van como texto
+        con coma decimal.
+        
         Args:
-            data: Datos a exportar
+            data: Registros a exportar (lista o iterador)
             project_key: Clave del proyecto
             filename: Nombre del archivo (opcional, se genera automáticamente)
+            frame: Ignorado (ver uses_frame)
             
         Returns:
             True si la exportación fue exitosa
@@ -30,13 +55,25 @@ class CSVExporter(BaseExporter):
             csv_path = os.path.join(reports_dir, filename)
             self.console.print(f"📄 [cyan]Generando CSV: {csv_path}[/cyan]")
             
-            # Preparar DataFrame
-            df = self.prepare_dataframe(data)
+            records = iter(data)
+            first = next(records, None)
+            if first is None:
+                self.console.print("❌ [red]No hay datos para exportar a CSV[/red]")
+                return False
+            
+            # Esquema de columnas fijo a partir del primer registro
+            columns = self.order_columns(first.to_dict())
+            rows = ([row.get(column) for column in columns]
+                    for row in map(IssueRecord.to_dict, chain([first], records)))
             
             # Exportar a CSV con encoding UTF-8 BOM para compatibilidad
-            df.to_csv(csv_path, index=False, encoding='utf-8-sig')
+            with CSVStreamWriter(csv_path, columns, self.compression, self.rows_per_file) as writer:
+                writer.write_rows(rows)
             
-            self.console.print(f"✅ [green]CSV generado: {csv_path}[/green]")
+            for path in writer.paths:
+                self.console.print(f"✅ [green]CSV generado: {path}[/green]")
+            if len(writer.paths) > 1:
+                self.console.print(f"   📦 [dim]{writer.rows_written} filas en {len(writer.paths)} partes[/dim]")
             return True
             
         except Exception as e:
@@ -0,0 +1,141 @@
+"""
+Escritor de CSV por filas con compresión y división en partes opcionales
+"""
+import csv
+import gzip
+import io
+import os
+from itertools import islice
+from typing import Any, Iterable, List, Optional, Sequence, TextIO
+
+try:
+    import zstandard
+except ImportError:  # Dependencia opcional: solo se usa con compresión zstd
+    zstandard = None
+
+# Extensión agregada al archivo según la compresión
+COMPRESSION_EXTENSIONS = {None: '', 'gzip': '.gz', 'zstd': '.zst'}
+
+# Filas que se toman del iterador por cada escritura
+CHUNK_ROWS = 1000
+
+
+class CSVStreamWriter:
+    """
+    Escribe filas CSV a medida que llegan, con un esquema de columnas fijo
+
+    Las filas se consumen del iterador en bloques de CHUNK_ROWS y se
+    escriben directamente al archivo (comprimido o no), de modo que nunca
+    se retiene más que un bloque. Con `rows_per_file` la salida se divide
+    en partes numeradas (archivo_part001.csv, ...) y cada una lleva su
+    encabezado. El formato es el de DataFrame.to_csv: separador coma,
+    comillas solo cuando hacen falta, fin de línea del sistema y None como
+    celda vacía.
+    """
+
+    def __init__(self, path: str, columns: Sequence[str], compression: Optional[str] = None,
+                 rows_per_file: Optional[int] = None, encoding: str = 'utf-8-sig'):
+        """
+        Args:
+            path: Ruta del archivo CSV (sin la extensión de compresión)
+            columns: Columnas del encabezado, en orden
+            compression: None, 'gzip' o 'zstd' (requiere el paquete zstandard)
+            rows_per_file: Filas por parte (None = un solo archivo)
+            encoding: Codificación del texto (por defecto UTF-8 con BOM)
+        """
+        if compression not in COMPRESSION_EXTENSIONS:
+            raise ValueError(f"Compresión no soportada: {compression}")
+        if compression == 'zstd' and zstandard is None:
+            raise ImportError("La compresión zstd requiere el paquete 'zstandard' (pip install zstandard)")
+
+        self.path = path
+        self.columns = list(columns)
+        self.compression = compression
+        self.rows_per_file = rows_per_file
+        self.encoding = encoding
+
+        self.paths: List[str] = []
+        self.rows_written = 0
+        self._file: Optional[TextIO] = None
+        self._writer = None
+        self._part_rows = 0
+
+    def __enter__(self) -> 'CSVStreamWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write_rows(self, rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Escribe filas (en el orden de `columns`) a medida que el iterador las entrega
+
+        Args:
+            rows: Filas a escribir (se consumen una vez)
+
+        Returns:
+            Cantidad de filas escritas en esta llamada
+        """
+        rows = iter(rows)
+        written = 0
+
+        while True:
+            if self.rows_per_file and self._part_rows >= self.rows_per_file:
+                self._close_part()
+
+            limit = CHUNK_ROWS
+            if self.rows_per_file:
+                limit = min(limit, self.rows_per_file - self._part_rows)
+
+            chunk = list(islice(rows, limit))
+            if not chunk:
+                break
+
+            if self._file is None:
+                self._open_part()
+
+            self._writer.writerows(chunk)
+            self._part_rows += len(chunk)
+            written += len(chunk)
+
+        self.rows_written += written
+        return written
+
+    def close(self) -> None:
+        """Cierra la parte actual (sin filas escritas, deja un archivo solo con el encabezado)"""
+        if not self.paths:
+            self._open_part()
+        self._close_part()
+
+    def _part_path(self, number: int) -> str:
+        """Ruta de una parte: archivo.csv, o archivo_part001.csv si se divide"""
+        path = self.path
+        if self.rows_per_file:
+            base, extension = os.path.splitext(path)
+            path = f"{base}_part{number:03d}{extension}"
+        return path + COMPRESSION_EXTENSIONS[self.compression]
+
+    def _open_part(self) -> None:
+        """Abre la parte siguiente y escribe su encabezado"""
+        path = self._part_path(len(self.paths) + 1)
+
+        if self.compression == 'gzip':
+            self._file = gzip.open(path, 'wt', encoding=self.encoding, newline='')
+        elif self.compression == 'zstd':
+            stream = zstandard.ZstdCompressor().stream_writer(open(path, 'wb'))
+            self._file = io.TextIOWrapper(stream, encoding=self.encoding, newline='')
+        else:
+            self._file = open(path, 'w', encoding=self.encoding, newline='')
+
+        self._writer = csv.writer(self._file, lineterminator=os.linesep)
+        self._writer.writerow(self.columns)
+        self._part_rows = 0
+        self.paths.append(path)
+
+    def _close_part(self) -> None:
+        """Cierra la parte actual si hay una abierta"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+            self._part_rows = 0
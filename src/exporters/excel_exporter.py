@@ -2,16 +2,26 @@
 Exportador a formato Excel
 """
 import os
-from typing import List, Dict, Any
+from typing import Any, Iterator, List, Optional, Tuple
 import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
 from .base_exporter import BaseExporter
+from .registry import register_exporter
+from ..models import IssueRecord
 from ..config import EXPORT_CONFIG
 
 
+@register_exporter('excel')
 class ExcelExporter(BaseExporter):
     """Exportador especializado en formato Excel"""
     
-    def export(self, data: List[Dict[str, Any]], project_key: str, filename: str = None) -> bool:
+    uses_frame = True
+    
+    def export(self, data: List[IssueRecord], project_key: str, filename: str = None,
+               frame: Optional[pd.DataFrame] = None) -> bool:
         """
         Exporta los datos a formato Excel
         
@@ -19,6 +29,7 @@ class ExcelExporter(BaseExporter):
             data: Datos a exportar
             project_key: Clave del proyecto
             filename: Nombre del archivo (opcional, se genera automáticamente)
+            frame: DataFrame compartido (None = se arma a partir de data)
             
         Returns:
             True si la exportación fue exitosa
@@ -32,17 +43,12 @@ class ExcelExporter(BaseExporter):
             excel_path = os.path.join(reports_dir, filename)
             self.console.print(f"📊 [cyan]Generando Excel: {excel_path}[/cyan]")
             
-            # Preparar DataFrame
-            df = self.prepare_dataframe(data)
+            # DataFrame con las horas como números reales (el compartido, si lo hay)
+            df = frame if frame is not None else self.prepare_dataframe(data, numeric_times=True)
             
-            # Crear archivo Excel con formato
-            with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-                sheet_name = EXPORT_CONFIG['excel_sheet_name_template'].format(project_key=project_key)
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-                
-                # Formatear columnas
-                worksheet = writer.sheets[sheet_name]
-                self._format_excel_columns(worksheet)
+            # Escribir en modo write_only: las filas se vuelcan al archivo a medida que se agregan
+            sheet_name = EXPORT_CONFIG['excel_sheet_name_template'].format(project_key=project_key)
+            self._write_workbook(df, excel_path, sheet_name)
             
             self.console.print(f"✅ [green]Excel generado: {excel_path}[/green]")
             return True
@@ -51,34 +57,70 @@ class ExcelExporter(BaseExporter):
             self.console.print(f"❌ [red]Error generando Excel: {str(e)}[/red]")
             return False
     
-    def _format_excel_columns(self, worksheet) -> None:
+    def _write_workbook(self, df: pd.DataFrame, excel_path: str, sheet_name: str) -> None:
         """
-        Aplica formato a las columnas del Excel
+        Escribe el DataFrame en un libro de openpyxl en modo write_only
+        
+        En este modo las celdas no quedan en memoria y los anchos de columna
+        tienen que fijarse antes de escribir las filas, por eso se calculan
+        a partir de los datos (ver _column_widths).
         
         Args:
-            worksheet: Hoja de cálculo de Excel
+            df: DataFrame preparado
+            excel_path: Ruta del archivo
+            sheet_name: Nombre de la hoja
         """
-        try:
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                # Calcular el ancho óptimo de la columna
-                for cell in column:
-                    try:
-                        if cell.value:
-                            cell_length = len(str(cell.value))
-                            if cell_length > max_length:
-                                max_length = cell_length
-                    except Exception:
-                        pass
-                
-                # Aplicar ancho ajustado con límites
-                min_width = EXPORT_CONFIG['min_column_width']
-                max_width = EXPORT_CONFIG['max_column_width']
-                adjusted_width = max(min_width, min(max_length + 2, max_width))
-                
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-                
-        except Exception as e:
-            self.console.print(f"⚠️ [yellow]Advertencia al formatear Excel: {str(e)}[/yellow]")
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet(title=sheet_name)
+        
+        for index, width in enumerate(self._column_widths(df), start=1):
+            worksheet.column_dimensions[get_column_letter(index)].width = width
+        
+        header_font = Font(bold=True)
+        header = []
+        for column in df.columns:
+            cell = WriteOnlyCell(worksheet, value=str(column))
+            cell.font = header_font
+            header.append(cell)
+        worksheet.append(header)
+        
+        for row in self._iter_rows(df):
+            worksheet.append(row)
+        
+        workbook.save(excel_path)
+    
+    def _column_widths(self, df: pd.DataFrame) -> List[int]:
+        """
+        Calcula el ancho de cada columna según el valor más largo (incluido el encabezado)
+        
+        Se calcula por columna con operaciones vectorizadas de pandas, sin
+        recorrer las celdas de la hoja. Los valores vacíos no cuentan.
+        
+        Args:
+            df: DataFrame preparado
+            
+        Returns:
+            Anchos de columna en el orden del DataFrame
+        """
+        min_width = EXPORT_CONFIG['min_column_width']
+        max_width = EXPORT_CONFIG['max_column_width']
+        widths = []
+        
+        for column in df.columns:
+            values = df[column]
+            filled = values[values.notna() & values.astype(bool)]
+            max_length = int(filled.astype(str).str.len().max()) if len(filled) else 0
+            max_length = max(max_length, len(str(column)))
+            widths.append(max(min_width, min(max_length + 2, max_width)))
+        
+        return widths
+    
+    def _iter_rows(self, df: pd.DataFrame) -> Iterator[Tuple[Any, ...]]:
+        """Genera las filas del DataFrame con las celdas vacías (NaN) como None"""
+        na_columns = [column for column in df.columns if df[column].isna().any()]
+        if na_columns:
+            df = df.copy()
+            for column in na_columns:
+                df[column] = df[column].astype(object).where(df[column].notna(), None)
+        
+        return df.itertuples(index=False, name=None)
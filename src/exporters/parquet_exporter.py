@@ -0,0 +1,176 @@
+"""
+Exportador a formato Parquet (columnar, con tipos)
+"""
+import os
+from typing import Any, Dict, List, Optional, Sequence
+import pandas as pd
+from .base_exporter import BaseExporter
+from .registry import register_exporter
+from ..models import IssueRecord, SUBTASK_COLUMNS, TIME_COLUMNS
+from ..config import EXPORT_CONFIG
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Dependencia opcional: solo se usa con --format parquet
+    pa = None
+    pq = None
+
+# Columnas de texto con pocos valores distintos: se guardan con codificación de diccionario
+DICTIONARY_COLUMNS = (
+    'issue_type', 'status', 'priority', 'assignee', 'reporter',
+    'sprint_name', 'sprint_state', 'board_name'
+)
+
+# Fechas de Jira (ej: 2024-01-15T10:30:00.000+0000) guardadas como timestamp UTC
+TIMESTAMP_COLUMNS = ('created', 'updated')
+
+# Columnas por las que se puede particionar el dataset (estilo Hive: columna=valor/)
+PARTITION_COLUMNS = ('project_key', 'sprint_id')
+
+
+@register_exporter('parquet')
+class ParquetExporter(BaseExporter):
+    """
+    Exportador especializado en formato Parquet
+    
+    A diferencia de Excel y CSV los tiempos no se convierten a horas: las
+    columnas de tiempo (también las de subtareas por categoría) quedan en
+    segundos enteros, `created`/`updated` como timestamps y los textos
+    repetitivos con codificación de diccionario. La tabla se arma columna
+    por columna a partir de los registros, sin pasar por el DataFrame
+    compartido (que tiene las horas redondeadas).
+    
+    Requiere el paquete opcional pyarrow.
+    """
+    
+    def __init__(self, partition_cols: Optional[Sequence[str]] = None, compression: Optional[str] = None):
+        """
+        Args:
+            partition_cols: Columnas de partición, de PARTITION_COLUMNS (None = valor de configuración)
+            compression: Códec de Parquet: 'zstd', 'snappy', 'gzip', 'none'... (None = valor de configuración)
+        """
+        super().__init__()
+        self.partition_cols = list(partition_cols or EXPORT_CONFIG['parquet_partition_cols'] or [])
+        self.compression = compression or EXPORT_CONFIG['parquet_compression']
+        
+        unknown = [column for column in self.partition_cols if column not in PARTITION_COLUMNS]
+        if unknown:
+            raise ValueError(f"Columnas de partición no soportadas: {', '.join(unknown)}")
+    
+    @staticmethod
+    def is_available() -> bool:
+        """Indica si está instalado pyarrow"""
+        return pq is not None
+    
+    def export(self, data: List[IssueRecord], project_key: str, filename: str = None,
+               frame: Optional[pd.DataFrame] = None) -> bool:
+        """
+        Exporta los datos a formato Parquet
+        
+        Sin particiones se genera un único archivo .parquet; con particiones,
+        un directorio con un subdirectorio por valor (ej:
+        proyecto_data_<fecha>/project_key=DEV/sprint_id=42/...). Los issues
+        sin sprint quedan en la partición __HIVE_DEFAULT_PARTITION__.
+        
+        Args:
+            data: Datos a exportar
+            project_key: Clave del proyecto
+            filename: Nombre del archivo o directorio (opcional, se genera automáticamente)
+            frame: Ignorado (ver uses_frame)
+        
+        Returns:
+            True si la exportación fue exitosa
+        """
+        if not self.is_available():
+            self.console.print("❌ [red]La exportación Parquet requiere el paquete 'pyarrow' (pip install pyarrow)[/red]")
+            return False
+        
+        try:
+            reports_dir = self.ensure_reports_directory()
+            
+            if not filename:
+                filename = self.generate_filename(project_key, 'parquet')
+                if self.partition_cols:
+                    filename = os.path.splitext(filename)[0]
+            
+            parquet_path = os.path.join(reports_dir, filename)
+            self.console.print(f"🧱 [cyan]Generando Parquet: {parquet_path}[/cyan]")
+            
+            table = self.build_table(data)
+            
+            if self.partition_cols:
+                pq.write_to_dataset(table, parquet_path, partition_cols=self.partition_cols,
+                                    compression=self.compression)
+            else:
+                pq.write_table(table, parquet_path, compression=self.compression)
+            
+            self.console.print(f"✅ [green]Parquet generado: {parquet_path}[/green]")
+            if self.partition_cols:
+                self.console.print(f"   📂 [dim]Particionado por {', '.join(self.partition_cols)}[/dim]")
+            return True
+        
+        except Exception as e:
+            self.console.print(f"❌ [red]Error generando Parquet: {str(e)}[/red]")
+            return False
+    
+    def build_table(self, data: List[IssueRecord]) -> 'pa.Table':
+        """
+        Arma la tabla de Arrow con el orden de columnas de exportación
+        
+        Args:
+            data: Registros a exportar
+        
+        Returns:
+            Tabla con una columna tipada por campo
+        """
+        columns = self._collect_columns(data)
+        ordered = self.order_columns(columns)
+        return pa.table({name: self._to_array(name, columns[name]) for name in ordered})
+    
+    def _collect_columns(self, data: List[IssueRecord]) -> Dict[str, List[Any]]:
+        """Valores de cada columna, con los tiempos de subtareas convertidos a segundos"""
+        columns = {name: [getattr(record, name) for record in data] for name in IssueRecord.FIELDS}
+        
+        customs = [record.custom for record in data]
+        for name in dict.fromkeys(name for record in data for name in record.custom_names):
+            columns[name] = [custom.get(name) for custom in customs]
+        
+        # Totales de subtareas: décimas de hora → segundos (categoría sin subtareas = 0)
+        if any(record.subtask_totals is not None for record in data):
+            for index, name in enumerate(SUBTASK_COLUMNS):
+                columns[name] = [
+                    (record.subtask_totals[index] or 0) * 360 if record.subtask_totals is not None else None
+                    for record in data
+                ]
+        
+        return columns
+    
+    def _to_array(self, name: str, values: List[Any]) -> 'pa.Array':
+        """Convierte los valores de una columna al tipo de Arrow que le corresponde"""
+        if name in TIME_COLUMNS or name in SUBTASK_COLUMNS:
+            return pa.array(values, pa.int64())
+        
+        if name in TIMESTAMP_COLUMNS:
+            timestamps = pd.to_datetime(pd.Series(values, dtype=object), format='ISO8601',
+                                        utc=True, errors='coerce')
+            return pa.array(timestamps).cast(pa.timestamp('ms', tz='UTC'))
+        
+        if name == 'is_subtask':
+            return pa.array([bool(value) for value in values], pa.bool_())
+        
+        if name == 'sprint_id':
+            return pa.array([self._parse_int(value) for value in values], pa.int64())
+        
+        strings = pa.array([None if value is None else str(value) for value in values], pa.string())
+        if name in DICTIONARY_COLUMNS:
+            return strings.dictionary_encode()
+        return strings
+    
+    @staticmethod
+    def _parse_int(value: Any) -> Optional[int]:
+        """Convierte un ID a entero (None si no es numérico, ej: 'N/A')"""
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
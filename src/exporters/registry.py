@@ -0,0 +1,82 @@
+"""
+Registro de exportadores por formato
+"""
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from .base_exporter import BaseExporter
+
+# Exportadores registrados: formato → clase (en orden de registro)
+EXPORTERS: Dict[str, Type[BaseExporter]] = {}
+
+# Formatos compuestos aceptados por --format (None = todos los disponibles)
+FORMAT_ALIASES: Dict[str, Optional[List[str]]] = {
+    'both': ['excel', 'csv'],
+    'all': None
+}
+
+
+def register_exporter(name: str) -> Callable[[Type[BaseExporter]], Type[BaseExporter]]:
+    """
+    Decorador que registra un exportador bajo un nombre de formato
+
+    Args:
+        name: Nombre del formato (el que se usa en --format)
+    """
+    def decorator(exporter_class: Type[BaseExporter]) -> Type[BaseExporter]:
+        exporter_class.format_name = name
+        EXPORTERS[name] = exporter_class
+        return exporter_class
+
+    return decorator
+
+
+def get_format_choices() -> List[str]:
+    """Formatos aceptados: los registrados más los compuestos"""
+    return list(EXPORTERS) + list(FORMAT_ALIASES)
+
+
+def get_unavailable_formats() -> List[str]:
+    """Formatos registrados cuyas dependencias opcionales no están instaladas"""
+    return [name for name, exporter_class in EXPORTERS.items() if not exporter_class.is_available()]
+
+
+def resolve_formats(export_format: str) -> List[str]:
+    """
+    Convierte un formato (simple o compuesto) en la lista de formatos registrados
+
+    Los alias que abarcan todos los formatos omiten los no disponibles (ver
+    BaseExporter.is_available); un formato pedido explícitamente se respeta.
+
+    Args:
+        export_format: Formato pedido ('excel', 'csv', 'both', 'all', ...)
+
+    Returns:
+        Formatos a exportar, en orden de registro
+    """
+    if export_format in FORMAT_ALIASES:
+        formats = FORMAT_ALIASES[export_format]
+        if formats is None:
+            unavailable = get_unavailable_formats()
+            formats = [name for name in EXPORTERS if name not in unavailable]
+    else:
+        formats = [export_format]
+
+    unknown = [name for name in formats if name not in EXPORTERS]
+    if unknown:
+        raise ValueError(f"Formato de exportación desconocido: {', '.join(unknown)}")
+
+    return formats
+
+
+def create_exporters(options: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, BaseExporter]:
+    """
+    Crea una instancia de cada exportador registrado
+
+    Args:
+        options: Argumentos de construcción por formato (opcional)
+
+    Returns:
+        Exportadores por formato
+    """
+    options = options or {}
+    return {name: exporter_class(**options.get(name, {})) for name, exporter_class in EXPORTERS.items()}
@@ -0,0 +1,72 @@
+"""
+Exportador a una base SQLite local (actualizada en el lugar)
+"""
+import os
+from typing import List, Optional, Sequence
+import pandas as pd
+from .base_exporter import BaseExporter
+from .registry import register_exporter
+from ..models import IssueRecord
+from ..storage import Warehouse
+
+
+@register_exporter('sqlite')
+class SQLiteExporter(BaseExporter):
+    """
+    Exportador especializado en la base SQLite de reportes
+    
+    En lugar de generar un archivo por corrida, hace upsert de los datos en
+    una única base (ver Warehouse) con tablas de issues, subtareas, sprints
+    y corridas, indexada para las consultas de reportes.
+    """
+    
+    uses_subtasks = True
+    
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: Ruta de la base SQLite (None = valor de configuración)
+        """
+        super().__init__()
+        self.path = path
+    
+    def export(self, data: List[IssueRecord], project_key: str, filename: str = None,
+               frame: Optional[pd.DataFrame] = None,
+               subtasks: Optional[Sequence[IssueRecord]] = None) -> bool:
+        """
+        Actualiza la base SQLite con los datos
+        
+        Args:
+            data: Datos a exportar
+            project_key: Clave del proyecto
+            filename: Nombre de la base dentro del directorio de reportes
+                (opcional, por defecto la ruta de WAREHOUSE_CONFIG)
+            frame: Ignorado (ver uses_frame)
+            subtasks: Subtareas de la extracción, para la tabla de subtareas
+            
+        Returns:
+            True si la exportación fue exitosa
+        """
+        try:
+            path = self.path
+            if filename:
+                path = os.path.join(self.ensure_reports_directory(), filename)
+            
+            warehouse = Warehouse(path)
+            self.console.print(f"🗄️ [cyan]Actualizando base SQLite: {warehouse.path}[/cyan]")
+            
+            try:
+                summary = warehouse.write_run(project_key, list(data) + list(subtasks or []))
+            finally:
+                warehouse.close()
+            
+            self.console.print(f"✅ [green]Base SQLite actualizada: {warehouse.path}[/green]")
+            self.console.print(
+                f"   📦 [dim]Corrida {summary['run_id']}: {summary['issues']} issues, "
+                f"{summary['subtasks']} subtareas, {summary['sprints']} sprints[/dim]"
+            )
+            return True
+            
+        except Exception as e:
+            self.console.print(f"❌ [red]Error actualizando la base SQLite: {str(e)}[/red]")
+            return False
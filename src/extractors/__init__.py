@@ -1,14 +1,23 @@
 """
 Extractores de datos de Jira
 """
+from .accessors import AccessorPlan, compile_path
 from .base_extractor import BaseExtractor
+from .field_resolver import FieldResolver
 from .timetracking_extractor import TimetrackingExtractor
 from .metadata_extractor import MetadataExtractor
 from .structure_extractor import StructureExtractor
+from .issue_extractor import IssueExtractor
+from .parallel_extractor import ParallelExtractor
 
 __all__ = [
+    'AccessorPlan',
+    'compile_path',
     'BaseExtractor',
+    'FieldResolver',
     'TimetrackingExtractor', 
     'MetadataExtractor',
-    'StructureExtractor'
+    'StructureExtractor',
+    'IssueExtractor',
+    'ParallelExtractor'
 ]
@@ -0,0 +1,109 @@
+"""
+Accesores precompilados para los campos de los issues de Jira
+"""
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List
+
+
+@lru_cache(maxsize=None)
+def compile_path(path: str) -> Callable[[Any], Any]:
+    """
+    Compila una ruta de campos en un accesor reutilizable
+
+    La ruta se separa una sola vez; el accesor recorre diccionarios JSON u
+    objetos Resource y retorna None si algún tramo no existe o es None.
+
+    Args:
+        path: Ruta separada por puntos (ej: 'fields.issuetype.subtask')
+
+    Returns:
+        Función que recibe el issue y retorna el valor del campo
+    """
+    parts = tuple(path.split('.'))
+
+    def accessor(obj: Any) -> Any:
+        current = obj
+        for part in parts:
+            current = current.get(part) if isinstance(current, dict) else getattr(current, part, None)
+            if current is None:
+                return None
+        return current
+
+    return accessor
+
+
+class AccessorPlan:
+    """
+    Plan de acceso a un conjunto de rutas de campos, resuelto en una pasada
+
+    Las rutas se organizan en un árbol por prefijos comunes, de modo que
+    tramos compartidos como 'fields' o 'fields.issuetype' se obtienen una
+    sola vez por issue. El resultado es un diccionario {ruta: valor} que
+    solo contiene las rutas presentes (y no None) en el issue.
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        """
+        Args:
+            paths: Rutas separadas por puntos (se ignoran las repetidas)
+        """
+        self.paths: List[str] = list(dict.fromkeys(paths))
+        self._tree = self._compile(self.paths)
+
+    @staticmethod
+    def _compile(paths: List[str]) -> tuple:
+        """
+        Arma el árbol de prefijos
+
+        Cada nivel es una tupla (hojas, ramas): las hojas son pares
+        (campo, ruta) y las ramas ternas (campo, ruta o None, subárbol).
+        """
+        root: Dict[str, Any] = {}
+        for path in paths:
+            node = root
+            parts = path.split('.')
+            for index, part in enumerate(parts):
+                child = node.setdefault(part, {'path': None, 'children': {}})
+                if index == len(parts) - 1:
+                    child['path'] = path
+                node = child['children']
+
+        def freeze(nodes: Dict[str, Any]) -> tuple:
+            leaves = tuple((name, node['path']) for name, node in nodes.items() if not node['children'])
+            branches = tuple((name, node['path'], freeze(node['children']))
+                             for name, node in nodes.items() if node['children'])
+            return leaves, branches
+
+        return freeze(root)
+
+    def resolve(self, issue: Any) -> Dict[str, Any]:
+        """
+        Resuelve todas las rutas del plan para un issue
+
+        Args:
+            issue: Issue de Jira (diccionario JSON u objeto Resource)
+
+        Returns:
+            Diccionario {ruta: valor} (las rutas ausentes no se incluyen)
+        """
+        values: Dict[str, Any] = {}
+        self._walk(issue, self._tree, values)
+        return values
+
+    def _walk(self, obj: Any, tree: tuple, values: Dict[str, Any]) -> None:
+        """Recorre un nivel del árbol completando los valores encontrados"""
+        leaves, branches = tree
+        is_dict = isinstance(obj, dict)
+
+        for name, path in leaves:
+            value = obj.get(name) if is_dict else getattr(obj, name, None)
+            if value is not None:
+                values[path] = value
+
+        for name, path, subtree in branches:
+            value = obj.get(name) if is_dict else getattr(obj, name, None)
+            if value is None:
+                continue
+            if path is not None:
+                values[path] = value
+            self._walk(value, subtree, values)
@@ -2,76 +2,145 @@
 Extractor base para datos de Jira
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+
+from .accessors import AccessorPlan, compile_path
 
 
 class BaseExtractor(ABC):
     """Clase base para extractores de datos de Jira"""
     
+    # Campos de Jira que el extractor lee (se usan para proyectar la búsqueda)
+    required_fields: List[str] = []
+    
+    # Expansiones de Jira que el extractor necesita (ej: 'changelog')
+    required_expand: List[str] = []
+    
+    # Rutas de campos que lee el extractor (se compilan en un AccessorPlan)
+    field_paths: List[str] = []
+    
+    _plan: Optional[AccessorPlan] = None
+    
+    def get_required_fields(self) -> List[str]:
+        """
+        Retorna los campos de Jira que necesita el extractor
+        
+        Returns:
+            Lista de IDs de campos de Jira
+        """
+        return list(self.required_fields)
+    
+    def get_required_expand(self) -> List[str]:
+        """
+        Retorna las expansiones de Jira que necesita el extractor
+        
+        Returns:
+            Lista de expansiones (vacía si no necesita ninguna)
+        """
+        return list(self.required_expand)
+    
+    def get_field_paths(self) -> List[str]:
+        """
+        Retorna las rutas de campos que lee el extractor
+        
+        Returns:
+            Lista de rutas separadas por puntos (ej: 'fields.issuetype.subtask')
+        """
+        return list(self.field_paths)
+    
+    @property
+    def plan(self) -> AccessorPlan:
+        """Plan de acceso compilado a partir de get_field_paths (se arma una vez)"""
+        if self._plan is None:
+            self._plan = AccessorPlan(self.get_field_paths())
+        return self._plan
+    
     @abstractmethod
-    def extract(self, issue: Any) -> Dict[str, Any]:
+    def extract(self, issue: Any, values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Extrae datos del issue
         
         Args:
             issue: Issue de Jira
+            values: Valores ya resueltos {ruta: valor} por un plan que incluye
+                las rutas del extractor (None = resolver con el plan propio)
             
         Returns:
             Diccionario con datos extraídos
         """
         pass
     
+    def _resolve(self, issue: Any, values: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Retorna los valores recibidos o los resuelve con el plan del extractor"""
+        return values if values is not None else self.plan.resolve(issue)
+    
+    @staticmethod
+    def _value(values: Dict[str, Any], path: str, default: Any = None) -> Any:
+        """Valor resuelto de una ruta, o el valor por defecto si no existe"""
+        value = values.get(path)
+        return default if value is None else value
+    
     def _safe_get_attribute(self, obj: Any, attribute: str, default: Any = None) -> Any:
         """
         Obtiene un atributo de forma segura
         
         Args:
-            obj: Objeto del cual extraer el atributo
+            obj: Objeto (Resource de jira) o diccionario JSON del cual extraer el atributo
             attribute: Nombre del atributo
             default: Valor por defecto si no existe
             
         Returns:
             Valor del atributo o valor por defecto
         """
+        if isinstance(obj, dict):
+            return obj.get(attribute, default)
         try:
             return getattr(obj, attribute, default)
         except (AttributeError, TypeError):
             return default
     
-    def _safe_get_nested_attribute(self, obj: Any, path: str, default: Any = None) -> Any:
+    def _has_attribute(self, obj: Any, attribute: str) -> bool:
         """
-        Obtiene un atributo anidado de forma segura
+        Indica si el objeto (Resource o diccionario JSON) tiene el atributo
         
         Args:
-            obj: Objeto del cual extraer el atributo
-            path: Ruta del atributo separada por puntos (ej: 'fields.assignee.displayName')
-            default: Valor por defecto si no existe
+            obj: Objeto a consultar
+            attribute: Nombre del atributo
             
         Returns:
-            Valor del atributo anidado o valor por defecto
+            True si el atributo existe
         """
-        try:
-            current = obj
-            for attr in path.split('.'):
-                current = getattr(current, attr)
-                if current is None:
-                    return default
-            return current
-        except (AttributeError, TypeError):
-            return default
+        if isinstance(obj, dict):
+            return attribute in obj
+        return hasattr(obj, attribute)
     
-    def _convert_seconds_to_hours(self, seconds: int) -> str:
+    def _get_issue_key(self, issue: Any) -> str:
         """
-        Convierte segundos a horas con formato decimal usando coma
+        Obtiene la clave del issue (Resource o diccionario JSON)
         
         Args:
-            seconds: Tiempo en segundos
+            issue: Issue de Jira
             
         Returns:
-            Horas formateadas con coma decimal
+            Clave del issue
+        """
+        return issue['key'] if isinstance(issue, dict) else issue.key
+    
+    def _safe_get_nested_attribute(self, obj: Any, path: str, default: Any = None) -> Any:
         """
-        if not seconds:
-            return '0,0'
+        Obtiene un atributo anidado de forma segura
         
-        hours = round(seconds / 3600, 1)
-        return str(hours).replace('.', ',')
+        Con issues en formato JSON (búsqueda con raw=True) recorre los
+        diccionarios directamente, sin construir objetos Resource. La ruta
+        se compila una sola vez (ver accessors.compile_path).
+        
+        Args:
+            obj: Objeto del cual extraer el atributo
+            path: Ruta del atributo separada por puntos (ej: 'fields.assignee.displayName')
+            default: Valor por defecto si no existe
+            
+        Returns:
+            Valor del atributo anidado o valor por defecto
+        """
+        value = compile_path(path)(obj)
+        return default if value is None else value
@@ -0,0 +1,72 @@
+"""
+Resolución de IDs de campos de Jira según las definiciones de la instancia
+"""
+from typing import Any, Dict, List, Optional
+
+from ..config import FIELD_ROLES, CUSTOM_FIELDS
+
+
+class FieldResolver:
+    """
+    Traduce roles de campos (sprint, epic link, parent) y campos genéricos a IDs
+
+    Los IDs de campos personalizados cambian entre instancias de Jira. A
+    partir de la lista de /rest/api/2/field, cada rol de FIELD_ROLES se
+    resuelve por el tipo del campo (schema.custom) o por su nombre visible;
+    los campos genéricos de CUSTOM_FIELDS pueden indicarse por ID o por
+    nombre. Sin definiciones (o sin coincidencias) se usan los IDs por
+    defecto de la configuración.
+    """
+
+    def __init__(self, roles: Optional[Dict[str, Dict[str, Any]]] = None,
+                 custom_fields: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            roles: Rol → {'schema', 'names', 'default'} (None = FIELD_ROLES)
+            custom_fields: Columna → ID o nombre del campo (None = CUSTOM_FIELDS)
+        """
+        self.roles = FIELD_ROLES if roles is None else roles
+        self.custom_fields = CUSTOM_FIELDS if custom_fields is None else custom_fields
+
+    def resolve(self, definitions: Optional[List[Dict[str, Any]]] = None) -> Dict[str, List[str]]:
+        """
+        Resuelve los IDs de cada rol
+
+        Args:
+            definitions: Campos de la instancia (respuesta de /field; None = usar los IDs por defecto)
+
+        Returns:
+            Diccionario {rol: [IDs en orden de prioridad]}
+        """
+        field_ids = {}
+
+        for role, spec in self.roles.items():
+            names = {name.lower() for name in spec.get('names', [])}
+            matches = [
+                field['id'] for field in definitions or []
+                if (spec.get('schema') and (field.get('schema') or {}).get('custom') == spec['schema'])
+                or str(field.get('name', '')).lower() in names
+            ]
+            field_ids[role] = matches or list(spec['default'])
+
+        return field_ids
+
+    def resolve_custom(self, definitions: Optional[List[Dict[str, Any]]] = None) -> Dict[str, str]:
+        """
+        Resuelve los IDs de los campos genéricos personalizados
+
+        Args:
+            definitions: Campos de la instancia (None = usar los valores configurados)
+
+        Returns:
+            Diccionario {columna: ID del campo}
+        """
+        known_ids = {field['id'] for field in definitions or []}
+        ids_by_name = {}
+        for field in definitions or []:
+            ids_by_name.setdefault(str(field.get('name', '')).lower(), field['id'])
+
+        return {
+            column: field if field in known_ids else ids_by_name.get(field.lower(), field)
+            for column, field in self.custom_fields.items()
+        }
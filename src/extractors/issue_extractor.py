@@ -0,0 +1,141 @@
+"""
+Extractor de la fila completa de un issue
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from .accessors import AccessorPlan
+from .timetracking_extractor import TimetrackingExtractor
+from .metadata_extractor import MetadataExtractor
+from .structure_extractor import StructureExtractor
+from ..models import IssueRecord
+
+
+class IssueExtractor:
+    """
+    Combina los datos básicos del issue y los extractores especializados
+
+    Mantiene la proyección de campos de la búsqueda y el plan de acceso
+    fusionado de todos los extractores. No depende del servicio de Jira ni
+    de la consola, de modo que se puede enviar a procesos de trabajo (ver
+    ParallelExtractor).
+    """
+
+    # Campos leídos directamente en extract
+    BASE_FIELDS = [
+        'summary', 'issuetype', 'status', 'priority', 'assignee',
+        'reporter', 'created', 'updated', 'project'
+    ]
+
+    # Columna de salida → ruta del dato básico del issue
+    BASE_PATHS = {
+        'key': 'key',
+        'summary': 'fields.summary',
+        'issue_type': 'fields.issuetype.name',
+        'status': 'fields.status.name',
+        'priority': 'fields.priority.name',
+        'assignee': 'fields.assignee.displayName',
+        'reporter': 'fields.reporter.displayName',
+        'created': 'fields.created',
+        'updated': 'fields.updated',
+        'project_key': 'fields.project.key'
+    }
+
+    # Valores de los datos básicos opcionales cuando el issue no los tiene
+    BASE_DEFAULTS = {
+        'priority': 'Sin Prioridad',
+        'assignee': 'Sin Asignar',
+        'reporter': 'Desconocido'
+    }
+
+    def __init__(self, field_ids: Optional[Dict[str, List[str]]] = None,
+                 custom_fields: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            field_ids: IDs de sprint, epic link y padre (None = IDs por defecto)
+            custom_fields: Columna → ID de cada campo genérico (None = CUSTOM_FIELDS)
+        """
+        self.timetracking_extractor = TimetrackingExtractor()
+        self.structure_extractor = StructureExtractor(field_ids)
+        self.metadata_extractor = MetadataExtractor(custom_fields)
+        self._build()
+
+    @property
+    def extractors(self) -> list:
+        """Extractores especializados en el orden en que se aplican"""
+        return [self.timetracking_extractor, self.structure_extractor, self.metadata_extractor]
+
+    def set_fields(self, field_ids: Dict[str, List[str]], custom_fields: Dict[str, str]) -> None:
+        """
+        Establece los IDs de campos resueltos para la instancia (ver FieldResolver)
+
+        Args:
+            field_ids: Diccionario {rol: [IDs en orden de prioridad]}
+            custom_fields: Diccionario {columna: ID del campo genérico}
+        """
+        self.structure_extractor.set_field_ids(field_ids)
+        self.metadata_extractor.set_custom_fields(custom_fields)
+        self._build()
+
+    def _build(self) -> None:
+        """Reconstruye la proyección de la búsqueda y el plan de acceso"""
+        self.search_fields, self.search_expand = self._build_search_projection()
+        self.plan = self._build_plan()
+
+    def _build_search_projection(self) -> Tuple[List[str], Optional[str]]:
+        """
+        Construye la unión de campos y expansiones que leen los extractores
+
+        Returns:
+            Tupla (campos a solicitar, expansiones o None)
+        """
+        fields = list(self.BASE_FIELDS)
+        expand = []
+
+        for extractor in self.extractors:
+            for field in extractor.get_required_fields():
+                if field not in fields:
+                    fields.append(field)
+            for item in extractor.get_required_expand():
+                if item not in expand:
+                    expand.append(item)
+
+        return fields, ','.join(expand) if expand else None
+
+    def _build_plan(self) -> AccessorPlan:
+        """
+        Compila en un solo plan las rutas de los datos básicos y de los extractores
+
+        Returns:
+            Plan que resuelve todos los campos de un issue en una pasada
+        """
+        paths = list(self.BASE_PATHS.values())
+        for extractor in self.extractors:
+            paths.extend(extractor.get_field_paths())
+
+        return AccessorPlan(paths)
+
+    def extract(self, issue: Any) -> IssueRecord:
+        """
+        Extrae la fila de un issue
+
+        Args:
+            issue: Issue de Jira (diccionario JSON u objeto Resource)
+
+        Returns:
+            Registro del issue (los errores de extracción se propagan)
+        """
+        # Resolver en una sola pasada todos los campos que leen los extractores
+        values = self.plan.resolve(issue)
+
+        # Datos básicos del issue
+        data = {column: values.get(path) for column, path in self.BASE_PATHS.items()}
+        for column, default in self.BASE_DEFAULTS.items():
+            if data[column] is None:
+                data[column] = default
+
+        # Usar extractores especializados
+        data.update(self.timetracking_extractor.extract(issue, values))
+        data.update(self.structure_extractor.extract(issue, values))
+        data.update(self.metadata_extractor.extract(issue, values))
+
+        return IssueRecord(**data)
@@ -1,7 +1,7 @@
 """
 Extractor de metadatos de issues
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from .base_extractor import BaseExtractor
 from ..config import CUSTOM_FIELDS
 
@@ -9,27 +9,60 @@ from ..config import CUSTOM_FIELDS
 class MetadataExtractor(BaseExtractor):
     """Extractor especializado en metadatos de issues"""
     
-    def extract(self, issue: Any) -> Dict[str, Any]:
+    required_fields = ['components', 'labels', 'fixVersions']
+    
+    def __init__(self, custom_fields: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            custom_fields: Columna → ID de cada campo genérico (None = CUSTOM_FIELDS)
+        """
+        super().__init__()
+        self.set_custom_fields(CUSTOM_FIELDS if custom_fields is None else custom_fields)
+    
+    def set_custom_fields(self, custom_fields: Dict[str, str]):
+        """
+        Establece los IDs de los campos genéricos personalizados
+        
+        Args:
+            custom_fields: Diccionario {columna: ID del campo} (ver FieldResolver)
+        """
+        self.custom_fields = dict(custom_fields)
+        # Columna de salida → ruta de cada campo genérico personalizado
+        self.generic_paths = {name: f'fields.{field}' for name, field in self.custom_fields.items()}
+        self._plan = None
+    
+    def get_required_fields(self) -> List[str]:
+        """Incluye los campos genéricos personalizados configurados"""
+        return super().get_required_fields() + list(self.custom_fields.values())
+    
+    def get_field_paths(self) -> List[str]:
+        """Rutas de los campos propios y de los campos genéricos configurados"""
+        return [f'fields.{field}' for field in self.get_required_fields()]
+    
+    def extract(self, issue: Any, values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Extrae metadatos (componentes, labels, fix versions, campos genéricos, etc.)
         
         Args:
             issue: Issue de Jira
+            values: Valores ya resueltos por un plan (None = resolver con el plan propio)
             
         Returns:
             Diccionario con metadatos del issue
         """
+        values = self._resolve(issue, values)
+        
         # Componentes
-        components = self._extract_components(issue)
+        components = self._extract_components(values)
         
         # Labels
-        labels = self._extract_labels(issue)
+        labels = self._extract_labels(values)
         
         # Fix Versions
-        fix_versions = self._extract_fix_versions(issue)
+        fix_versions = self._extract_fix_versions(values)
         
         # Campos genéricos
-        generic_fields = self._extract_generic_fields(issue)
+        generic_fields = self._extract_generic_fields(values)
         
         return {
             'components': ', '.join(components) if components else 'Sin Componentes',
@@ -38,32 +71,33 @@ class MetadataExtractor(BaseExtractor):
             **generic_fields
         }
     
-    def _extract_components(self, issue: Any) -> List[str]:
+    def _extract_components(self, values: Dict[str, Any]) -> List[str]:
         """Extrae componentes del issue"""
-        components = self._safe_get_nested_attribute(issue, 'fields.components', [])
-        return [comp.name for comp in components if hasattr(comp, 'name')]
+        components = self._value(values, 'fields.components', [])
+        return [self._safe_get_attribute(comp, 'name') for comp in components if self._has_attribute(comp, 'name')]
     
-    def _extract_labels(self, issue: Any) -> List[str]:
+    def _extract_labels(self, values: Dict[str, Any]) -> List[str]:
         """Extrae labels del issue"""
-        return self._safe_get_nested_attribute(issue, 'fields.labels', [])
+        return self._value(values, 'fields.labels', [])
     
-    def _extract_fix_versions(self, issue: Any) -> List[str]:
+    def _extract_fix_versions(self, values: Dict[str, Any]) -> List[str]:
         """Extrae fix versions del issue"""
-        fix_versions = self._safe_get_nested_attribute(issue, 'fields.fixVersions', [])
-        return [version.name for version in fix_versions if hasattr(version, 'name')]
+        fix_versions = self._value(values, 'fields.fixVersions', [])
+        return [self._safe_get_attribute(version, 'name') for version in fix_versions
+                if self._has_attribute(version, 'name')]
     
-    def _extract_generic_fields(self, issue: Any) -> Dict[str, str]:
+    def _extract_generic_fields(self, values: Dict[str, Any]) -> Dict[str, str]:
         """Extrae campos genéricos personalizados"""
         generic_data = {}
         
-        for field_name, custom_field in CUSTOM_FIELDS.items():
-            field_value = self._safe_get_nested_attribute(issue, f'fields.{custom_field}')
+        for field_name, path in self.generic_paths.items():
+            field_value = values.get(path)
             
             if field_value:
-                if hasattr(field_value, 'name'):
-                    generic_data[field_name] = field_value.name
-                elif hasattr(field_value, 'value'):
-                    generic_data[field_name] = str(field_value.value)
+                if self._has_attribute(field_value, 'name'):
+                    generic_data[field_name] = self._safe_get_attribute(field_value, 'name')
+                elif self._has_attribute(field_value, 'value'):
+                    generic_data[field_name] = str(self._safe_get_attribute(field_value, 'value'))
                 else:
                     generic_data[field_name] = str(field_value)
             else:
@@ -0,0 +1,130 @@
+"""
+Extracción de issues repartida en un pool de procesos
+"""
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..config import EXTRACTION_CONFIG
+from ..models import IssueRecord
+from .issue_extractor import IssueExtractor
+
+# Límites del tamaño de lote con ajuste automático
+MIN_CHUNK_SIZE = 50
+MAX_CHUNK_SIZE = 5000
+INITIAL_CHUNK_SIZE = 250
+
+# Extractor de cada proceso de trabajo (se recibe una vez, al iniciar el proceso)
+_worker_extractor: Optional[IssueExtractor] = None
+
+
+def _init_worker(extractor: IssueExtractor) -> None:
+    """Inicializa un proceso de trabajo con el extractor configurado"""
+    global _worker_extractor
+    _worker_extractor = extractor
+
+
+def _extract_chunk(issues: List[Dict[str, Any]]) -> Tuple[List[Optional[IssueRecord]], List[Tuple[str, str]], int, float]:
+    """
+    Extrae un lote de issues en un proceso de trabajo
+
+    Returns:
+        Tupla (registros en el orden del lote con None si falló, errores
+        (key, mensaje), PID del proceso, segundos de extracción)
+    """
+    start = time.perf_counter()
+    records: List[Optional[IssueRecord]] = []
+    errors: List[Tuple[str, str]] = []
+
+    for issue in issues:
+        try:
+            records.append(_worker_extractor.extract(issue))
+        except Exception as e:
+            records.append(None)
+            errors.append((issue.get('key'), str(e)))
+
+    return records, errors, os.getpid(), time.perf_counter() - start
+
+
+class ParallelExtractor:
+    """
+    Reparte la extracción de issues JSON en lotes entre procesos de trabajo
+
+    Los issues llegan como iterable (por ejemplo, página a página) y se
+    agrupan en lotes. Solo hay `2 * workers` lotes en curso a la vez y los
+    registros se entregan en el orden de entrada, de modo que el resultado
+    (deduplicación y agregación de subtareas incluidas) es el mismo que con
+    la extracción secuencial.
+
+    Sin tamaño de lote fijo, el tamaño se ajusta con cada lote terminado
+    para que dure alrededor de `worker_chunk_seconds`: lotes chicos reparten
+    mejor la carga y lotes grandes amortizan el costo de enviarlos.
+    """
+
+    def __init__(self, workers: int, chunk_size: Optional[int] = None):
+        """
+        Args:
+            workers: Cantidad de procesos de trabajo
+            chunk_size: Issues por lote (None = valor de configuración o ajuste automático)
+        """
+        self.workers = workers
+        self.fixed_chunk_size = chunk_size or EXTRACTION_CONFIG['worker_chunk_size']
+        self.chunk_size = self.fixed_chunk_size or INITIAL_CHUNK_SIZE
+        self.errors: List[Tuple[str, str]] = []
+        self.stats: Dict[int, Dict[str, float]] = {}
+
+    def extract(self, extractor: IssueExtractor, issues: Iterable[Dict[str, Any]]) -> Iterator[Optional[IssueRecord]]:
+        """
+        Extrae los issues en el pool y genera sus registros en orden
+
+        Args:
+            extractor: Extractor configurado (se copia a cada proceso)
+            issues: Issues en formato JSON (se consumen una vez)
+
+        Yields:
+            Registro de cada issue, o None si su extracción falló (ver errors)
+        """
+        pending: Deque[Future] = deque()
+
+        # Procesos iniciados con spawn: el pool se crea cuando ya hay hilos de
+        # descarga activos y un fork copiaría locks tomados por esos hilos
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker, initargs=(extractor,)) as executor:
+            chunk: List[Dict[str, Any]] = []
+
+            for issue in issues:
+                chunk.append(issue)
+                if len(chunk) < self.chunk_size:
+                    continue
+
+                pending.append(executor.submit(_extract_chunk, chunk))
+                chunk = []
+
+                # Ventana acotada de lotes en curso
+                if len(pending) >= 2 * self.workers:
+                    yield from self._collect(pending.popleft())
+
+            if chunk:
+                pending.append(executor.submit(_extract_chunk, chunk))
+
+            while pending:
+                yield from self._collect(pending.popleft())
+
+    def _collect(self, future: Future) -> List[Optional[IssueRecord]]:
+        """Obtiene el resultado de un lote, registra sus métricas y ajusta el tamaño de lote"""
+        records, errors, pid, seconds = future.result()
+        self.errors.extend(errors)
+
+        counters = self.stats.setdefault(pid, {'chunks': 0, 'issues': 0, 'seconds': 0.0})
+        counters['chunks'] += 1
+        counters['issues'] += len(records)
+        counters['seconds'] += seconds
+
+        if not self.fixed_chunk_size and records and seconds > 0:
+            target = EXTRACTION_CONFIG['worker_chunk_seconds'] * len(records) / seconds
+            self.chunk_size = int(min(MAX_CHUNK_SIZE, max(MIN_CHUNK_SIZE, target)))
+
+        return records
@@ -1,17 +1,63 @@
 """
 Extractor de estructura de issues (relaciones, sprints, etc.)
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from .base_extractor import BaseExtractor
+from .field_resolver import FieldResolver
 
 
 class StructureExtractor(BaseExtractor):
     """Extractor especializado en estructura y relaciones de issues"""
     
-    def __init__(self):
+    def __init__(self, field_ids: Optional[Dict[str, List[str]]] = None):
+        """
+        Args:
+            field_ids: IDs de campos por rol (ver FieldResolver; None = IDs por defecto)
+        """
         super().__init__()
         self.sprint_context = {}  # Diccionario para almacenar información de sprints
+        self.set_field_ids(field_ids or FieldResolver().resolve())
+    
+    def set_field_ids(self, field_ids: Dict[str, List[str]]):
+        """
+        Establece los IDs de los campos de sprint, epic link y padre
+        
+        Args:
+            field_ids: Diccionario {rol: [IDs en orden de prioridad]}
+        """
+        self.field_ids = field_ids
+        self.sprint_paths = [f'fields.{field}' for field in field_ids.get('sprint', [])]
+        self.epic_paths = [f'fields.{field}' for field in field_ids.get('epic_link', [])]
+        self.parent_paths = [f'fields.{field}.key' for field in field_ids.get('parent', [])]
+        self._plan = None
         
+    def get_required_fields(self) -> List[str]:
+        """Campos fijos más los IDs resueltos de padre, sprint y epic link"""
+        fields = ['issuetype', *self.field_ids.get('parent', []), 'project',
+                  *self.field_ids.get('sprint', []), *self.field_ids.get('epic_link', [])]
+        return list(dict.fromkeys(fields))
+    
+    def get_field_paths(self) -> List[str]:
+        """Rutas de los campos fijos y de los resueltos"""
+        return [
+            'key',
+            'fields.issuetype.subtask',
+            'fields.issuetype.name',
+            'fields.project.key',
+            *self.parent_paths,
+            *self.sprint_paths,
+            *self.epic_paths
+        ]
+    
+    @staticmethod
+    def _first_value(values: Dict[str, Any], paths: List[str]) -> Any:
+        """Primer valor no vacío entre varias rutas candidatas"""
+        for path in paths:
+            value = values.get(path)
+            if value:
+                return value
+        return None
+    
     def set_sprint_context(self, sprints: Dict[int, Dict[str, Any]]):
         """
         Establece el contexto de sprints para la extracción
@@ -21,29 +67,32 @@ class StructureExtractor(BaseExtractor):
         """
         self.sprint_context = sprints
     
-    def extract(self, issue: Any) -> Dict[str, Any]:
+    def extract(self, issue: Any, values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Extrae datos de estructura (subtareas, padre, sprint, etc.)
         
         Args:
             issue: Issue de Jira
+            values: Valores ya resueltos por un plan (None = resolver con el plan propio)
             
         Returns:
             Diccionario con datos de estructura
         """
+        values = self._resolve(issue, values)
+        
         # Obtener información de sprint
-        sprint_info = self._extract_sprint_info(issue)
+        sprint_info = self._extract_sprint_info(values)
         
         # Determinar si es subtarea
-        is_subtask = self._safe_get_nested_attribute(issue, 'fields.issuetype.subtask', False)
-        parent_key = self._safe_get_nested_attribute(issue, 'fields.parent.key')
+        is_subtask = self._value(values, 'fields.issuetype.subtask', False)
+        parent_key = self._first_value(values, self.parent_paths)
         
         # Lógica para la columna Parent
         # Para subtareas: usar parent_key, para el resto: usar key del issue
-        parent_value = parent_key if is_subtask else issue.key
+        parent_value = parent_key if is_subtask else values.get('key')
         
         # Lógica para la columna Epic
-        epic_key = self._extract_epic_key(issue)
+        epic_key = self._extract_epic_key(values)
         
         return {
             'epic_key': epic_key,
@@ -53,15 +102,15 @@ class StructureExtractor(BaseExtractor):
             'sprint_name': sprint_info['name'],
             'sprint_id': sprint_info['id'],
             'sprint_state': sprint_info['state'],
-            'board_name': sprint_info.get('board_name', f'{self._safe_get_nested_attribute(issue, "fields.project.key", "UNKNOWN")} - Proyecto Principal')
+            'board_name': sprint_info.get('board_name', f'{self._value(values, "fields.project.key", "UNKNOWN")} - Proyecto Principal')
         }
     
-    def _extract_sprint_info(self, issue: Any) -> Dict[str, str]:
+    def _extract_sprint_info(self, values: Dict[str, Any]) -> Dict[str, str]:
         """
         Extrae información del sprint del issue
         
         Args:
-            issue: Issue de Jira
+            values: Valores resueltos del issue
             
         Returns:
             Diccionario con información del sprint
@@ -74,25 +123,25 @@ class StructureExtractor(BaseExtractor):
         }
         
         try:
-            # Obtener sprints del campo customfield_10007 (campo específico de sprint)
-            sprints = self._safe_get_nested_attribute(issue, 'fields.customfield_10007', [])
+            # Obtener sprints del campo de sprint resuelto para la instancia
+            sprints = self._first_value(values, self.sprint_paths) or []
             
             if sprints and isinstance(sprints, list):
                 # Tomar el último sprint (el más reciente)
                 last_sprint = sprints[-1]
                 
                 # Extraer información directamente del objeto sprint si está disponible
-                if hasattr(last_sprint, 'name'):
+                if self._has_attribute(last_sprint, 'name'):
                     # Información básica del sprint
-                    sprint_info['name'] = last_sprint.name
-                    sprint_id = getattr(last_sprint, 'id', None)
+                    sprint_info['name'] = self._safe_get_attribute(last_sprint, 'name')
+                    sprint_id = self._safe_get_attribute(last_sprint, 'id')
                     sprint_info['id'] = str(sprint_id) if sprint_id else 'N/A'
-                    sprint_info['state'] = getattr(last_sprint, 'state', 'N/A')
+                    sprint_info['state'] = self._safe_get_attribute(last_sprint, 'state', 'N/A')
                     
                     # Extraer board_name del sprint o del issue
-                    board_id = getattr(last_sprint, 'boardId', None)
+                    board_id = self._safe_get_attribute(last_sprint, 'boardId')
                     if board_id:
-                        sprint_info['board_name'] = f"{self._safe_get_nested_attribute(issue, 'fields.project.key', 'UNKNOWN')} Board {board_id}"
+                        sprint_info['board_name'] = f"{self._value(values, 'fields.project.key', 'UNKNOWN')} Board {board_id}"
                     
                     # Si tenemos contexto de sprints, complementar la información
                     if self.sprint_context and sprint_id:
@@ -101,46 +150,38 @@ class StructureExtractor(BaseExtractor):
                             # Actualizar board_name solo si es más específico que el default
                             if 'board_name' in context and context['board_name'] != 'Sin Board':
                                 sprint_info['board_name'] = context['board_name']
-                            print(f"DEBUG - Issue {issue.key}: Found sprint {sprint_info['name']} (ID: {sprint_info['id']}) in context")
                         else:
                             # Extraer más información del objeto sprint
-                            goal = getattr(last_sprint, 'goal', None)
+                            goal = self._safe_get_attribute(last_sprint, 'goal')
                             if goal:
                                 sprint_info['name'] = f"{sprint_info['name']} ({goal})"
-                            print(f"DEBUG - Issue {issue.key}: Using sprint object data for ID {sprint_id}")
                             
                 elif isinstance(last_sprint, str):
                     # Manejar el caso donde el sprint viene como string
                     sprint_info['name'] = last_sprint
-                    print(f"DEBUG - Issue {issue.key}: Sprint as string: {last_sprint}")
             
-        except Exception as e:
+        except Exception:
             # En caso de error, mantener valores por defecto
-            print(f"DEBUG - Issue {issue.key}: Error extracting sprint info: {e}")
             pass
         
         return sprint_info
     
-    def _extract_epic_key(self, issue: Any) -> str:
+    def _extract_epic_key(self, values: Dict[str, Any]) -> str:
         """
         Extrae la clave del Epic asociado al issue
         
         Args:
-            issue: Issue de Jira
+            values: Valores resueltos del issue
             
         Returns:
             Clave del Epic o 'Sin Epic'
         """
         # Estrategias para encontrar el Epic
         strategies = [
-            # 1. Campo Epic Link directo
-            lambda: self._safe_get_nested_attribute(issue, 'fields.customfield_10014'),
-            # 2. Campo Epic Key
-            lambda: self._safe_get_nested_attribute(issue, 'fields.customfield_10008'), 
-            # 3. Si el issue mismo es un Epic
-            lambda: issue.key if self._safe_get_nested_attribute(issue, 'fields.issuetype.name', '').lower() == 'epic' else None,
-            # 4. Buscar en campos personalizados que contengan 'epic'
-            lambda: self._search_epic_in_custom_fields(issue)
+            # 1. Campos Epic Link resueltos, en orden de prioridad
+            lambda: self._first_value(values, self.epic_paths),
+            # 2. Si el issue mismo es un Epic
+            lambda: values.get('key') if self._value(values, 'fields.issuetype.name', '').lower() == 'epic' else None
         ]
         
         for strategy in strategies:
@@ -152,21 +193,3 @@ class StructureExtractor(BaseExtractor):
                 continue
         
         return 'Sin Epic'
-    
-    def _search_epic_in_custom_fields(self, issue: Any) -> str:
-        """Busca Epic en campos personalizados"""
-        try:
-            fields = self._safe_get_nested_attribute(issue, 'fields.__dict__', {})
-            
-            for field_name, field_value in fields.items():
-                if 'epic' in field_name.lower() and field_value:
-                    if isinstance(field_value, str):
-                        return field_value
-                    elif hasattr(field_value, 'key'):
-                        return field_value.key
-                    elif hasattr(field_value, 'name'):
-                        return field_value.name
-        except Exception:
-            pass
-        
-        return 'Sin Epic'
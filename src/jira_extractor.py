@@ -1,61 +1,155 @@
 """
 Extractor principal de datos de Jira - Versión refactorizada
 """
+import queue
+import threading
 import time
-from typing import List, Dict, Any, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Callable, Optional, Set, Tuple, Iterable, Iterator
+from zoneinfo import ZoneInfo
 from rich.progress import track
 
-from .config import EXTRACTION_CONFIG, get_jql_strategies
+from .config import EXTRACTION_CONFIG, EXPORT_CONFIG, ISSUE_STORE_CONFIG, get_jql_strategies
 from .services import JiraService  
-from .extractors import TimetrackingExtractor, MetadataExtractor, StructureExtractor
+from .extractors import IssueExtractor, ParallelExtractor, AccessorPlan, FieldResolver
 from .utils import SprintManager, SubtaskProcessor, DisplayUtils
-from .exporters import ExcelExporter, CSVExporter
+from .exporters import BaseExporter, FORMAT_ALIASES, create_exporters, get_unavailable_formats, resolve_formats
+from .storage import IssueStore
+from .models import IssueRecord
 
 
 class JiraDataExtractor:
     """Extractor principal de datos de proyectos Jira con timetracking"""
     
-    def __init__(self):
-        """Inicializa el extractor con todos sus componentes"""
-        # Servicios
-        self.jira_service = JiraService()
+    def __init__(self, concurrency: Optional[int] = None, refresh_metadata: bool = False,
+                 http_mode: Optional[str] = None, http_store: Optional[str] = None,
+                 raw_json: Optional[bool] = None, workers: Optional[int] = None,
+                 csv_compression: Optional[str] = None, csv_rows_per_file: Optional[int] = None,
+                 parquet_partition_cols: Optional[List[str]] = None):
+        """
+        Inicializa el extractor con todos sus componentes
+        
+        Args:
+            concurrency: Páginas a descargar en paralelo (None = valor de configuración)
+            refresh_metadata: Si True, ignora el cache persistente de boards y sprints
+            http_mode: 'record' graba las respuestas de Jira, 'replay' las
+                reproduce sin red (None = acceso normal)
+            http_store: Directorio de la grabación (None = valor de configuración)
+            raw_json: Si True, procesa los issues como JSON sin construir objetos
+                de la librería jira (None = valor de configuración)
+            workers: Procesos que extraen los issues en paralelo; requiere
+                raw_json (None = valor de configuración, 1 = en este proceso)
+            csv_compression: Compresión del CSV, 'gzip' o 'zstd' (None = valor de configuración)
+            csv_rows_per_file: Filas por archivo CSV, dividiendo en partes
+                (None = valor de configuración)
+            parquet_partition_cols: Columnas de partición del Parquet, ej:
+                ['project_key', 'sprint_id'] (None = valor de configuración)
+        """
+        self.concurrency = max(1, concurrency or EXTRACTION_CONFIG['concurrency'])
+        self.refresh_metadata = refresh_metadata
+        self.raw_json = EXTRACTION_CONFIG['raw_json'] if raw_json is None else raw_json
+        self.workers = max(1, workers or EXTRACTION_CONFIG['workers'])
         
-        # Extractores especializados
-        self.timetracking_extractor = TimetrackingExtractor()
-        self.metadata_extractor = MetadataExtractor()
-        self.structure_extractor = StructureExtractor()
+        # Servicios
+        self.jira_service = JiraService(
+            pool_size=self.concurrency,
+            http_mode=http_mode,
+            http_store=http_store
+        )
+        
+        # Extracción de la fila de cada issue (datos básicos y extractores especializados)
+        self.issue_extractor = IssueExtractor()
+        self.timetracking_extractor = self.issue_extractor.timetracking_extractor
+        self.metadata_extractor = self.issue_extractor.metadata_extractor
+        self.structure_extractor = self.issue_extractor.structure_extractor
         
         # Utilidades
         self.sprint_manager = SprintManager(self.jira_service)
         self.subtask_processor = SubtaskProcessor()
         self.display_utils = DisplayUtils()
         
-        # Exportadores
-        self.excel_exporter = ExcelExporter()
-        self.csv_exporter = CSVExporter()
+        # Exportadores registrados, por formato
+        self.exporters = create_exporters({
+            'csv': {'compression': csv_compression, 'rows_per_file': csv_rows_per_file},
+            'parquet': {'partition_cols': parquet_partition_cols}
+        })
+        self.excel_exporter = self.exporters['excel']
+        self.csv_exporter = self.exporters['csv']
+        
+        # Subtareas de la última extracción (agregadas en sus padres); solo se
+        # conservan si algún formato pedido las usa (exportadores con uses_subtasks)
+        self.subtasks: List[IssueRecord] = []
+        self._keep_subtasks = False
+        
+        # Sincronización incremental
+        self.issue_store = IssueStore()
+        self.incremental = False
+        self._sync_state: Optional[Dict[str, Any]] = None
+    
+    @property
+    def issue_plan(self) -> AccessorPlan:
+        """Plan de acceso fusionado de los datos básicos y todos los extractores"""
+        return self.issue_extractor.plan
+    
+    def _resolve_fields(self) -> None:
+        """
+        Resuelve los IDs de sprint, epic link, padre y campos genéricos de la instancia
+        
+        Usa las definiciones de /rest/api/2/field (con cache persistente) y
+        reconstruye la proyección de la búsqueda y el plan de acceso para que
+        los extractores lean solo los campos resueltos.
+        """
+        definitions = self.jira_service.get_field_definitions()
+        resolver = FieldResolver()
+        field_ids = resolver.resolve(definitions)
+        
+        self.issue_extractor.set_fields(field_ids, resolver.resolve_custom(definitions))
+        
+        source = "instancia" if definitions is not None else "valores por defecto"
+        resolved = ', '.join(f"{role}: {'/'.join(ids)}" for role, ids in field_ids.items())
+        self.jira_service.console.print(f"🧩 [cyan]Campos resueltos ({source}): {resolved}[/cyan]")
     
     def run(self, project_key: str, export_format: str = 'both', 
-            max_results: int = None, use_sprints: bool = True) -> bool:
+            max_results: int = None, use_sprints: bool = True,
+            incremental: bool = False) -> bool:
         """
         Ejecuta el proceso completo de extracción
         
         Args:
             project_key: Clave del proyecto
-            export_format: Formato de exportación ('excel', 'csv', 'both')
+            export_format: Formato de exportación registrado o compuesto
+                ('excel', 'csv', 'both', 'all', ...)
             max_results: Límite máximo de issues (None = extraer todos)
             use_sprints: Si True, permite seleccionar sprints específicos
+            incremental: Si True, descarga solo los issues actualizados desde
+                la última sincronización y exporta desde el almacén local
             
         Returns:
             True si el proceso fue exitoso
         """
+        self.incremental = incremental
+        self._keep_subtasks = any(
+            self.exporters[name].uses_subtasks for name in resolve_formats(export_format)
+        )
+        
         # Mostrar encabezado
         mode_description = self._get_mode_description(max_results, use_sprints)
         self.display_utils.show_extraction_header(project_key, mode_description)
         
+        # Invalidar metadatos cacheados si se pidió refrescarlos
+        # (al grabar o reproducir el servicio ya usa un cache propio y vacío)
+        if self.refresh_metadata and not self.jira_service.http_mode:
+            self.jira_service.refresh_metadata()
+        
         # Conectar a Jira
         if not self.jira_service.connect():
             return False
         
+        # Resolver los IDs de campos personalizados de la instancia
+        self._resolve_fields()
+        
         # Procesar datos del proyecto
         data = self._process_project_data(project_key, max_results, use_sprints)
         
@@ -70,13 +164,17 @@ class JiraDataExtractor:
         if not self._export_data(data, project_key, export_format):
             return False
         
+        # Mostrar uso del cache de metadatos
+        self.display_utils.show_cache_stats(self.jira_service.metadata_cache.get_stats())
+        self.display_utils.show_http_stats(self.jira_service.get_http_stats())
+        
         # Mostrar mensaje de finalización
         self.display_utils.show_completion_message(len(data))
         
         return True
     
     def _process_project_data(self, project_key: str, max_results: int = None, 
-                             use_sprints: bool = True) -> List[Dict[str, Any]]:
+                             use_sprints: bool = True) -> List[IssueRecord]:
         """
         Procesa todos los datos de un proyecto
         
@@ -88,19 +186,20 @@ class JiraDataExtractor:
         Returns:
             Lista de datos procesados
         """
+        # Las búsquedas ya retornan filas extraídas página a página
         if use_sprints:
-            issues = self._get_sprint_issues(project_key, max_results)
+            rows = self._get_sprint_issues(project_key, max_results)
         else:
-            issues = self._search_project_issues(project_key, max_results)
+            rows = self._search_project_issues(project_key, max_results)
         
-        if not issues:
+        if not rows and not self._is_synced_scope():
             self.jira_service.console.print("❌ [red]No se encontraron issues para procesar[/red]")
             return []
         
-        return self._process_issues(issues)
+        return self._process_rows(rows)
     
-    def _get_sprint_issues(self, project_key: str, max_results: int = None) -> List[Any]:
-        """Obtiene issues de sprints seleccionados"""
+    def _get_sprint_issues(self, project_key: str, max_results: int = None) -> List[IssueRecord]:
+        """Obtiene las filas extraídas de los issues de sprints seleccionados"""
         # Obtener sprints activos y cerrados recientes
         self.jira_service.console.print("🏃‍♂️ [cyan]Obteniendo sprints activos y cerrados recientes del proyecto...[/cyan]")
         available_sprints = self.sprint_manager.get_active_project_sprints(project_key)
@@ -119,7 +218,7 @@ class JiraDataExtractor:
         else:
             return self._search_sprint_issues(project_key, sprint_ids, max_results)
     
-    def _search_project_issues(self, project_key: str, max_results: int = None) -> List[Any]:
+    def _search_project_issues(self, project_key: str, max_results: int = None) -> List[IssueRecord]:
         """
         Busca TODOS los issues del proyecto usando paginación automática
         
@@ -128,7 +227,7 @@ class JiraDataExtractor:
             max_results: Límite opcional (None = extraer todos los issues)
             
         Returns:
-            Lista completa de issues encontrados
+            Filas extraídas de los issues encontrados (sin duplicados)
         """
         self.jira_service.console.print(f"🔍 [cyan]Buscando issues del proyecto {project_key}...[/cyan]")
         
@@ -146,11 +245,15 @@ class JiraDataExtractor:
             try:
                 self.jira_service.console.print(f"   📋 [dim]Estrategia {i}: {strategy['description']}[/dim]")
                 
-                issues = self._paginated_search(strategy['jql'], safety_limit, extract_all)
+                rows = self._search_issues(strategy['jql'], safety_limit, extract_all)
+                
+                if self._is_synced_scope():
+                    self.jira_service.console.print(f"   ✅ [bold green]Estrategia {i} sincronizada: {len(rows)} issues actualizados[/bold green]")
+                    return rows
                 
-                if issues:
-                    self.jira_service.console.print(f"   ✅ [bold green]Estrategia {i} exitosa: {len(issues)} issues totales[/bold green]")
-                    return self._remove_duplicates(issues)
+                if rows:
+                    self.jira_service.console.print(f"   ✅ [bold green]Estrategia {i} exitosa: {len(rows)} issues totales[/bold green]")
+                    return rows
                 else:
                     self.jira_service.console.print(f"   ⚠️ [yellow]Sin resultados con estrategia {i}[/yellow]")
                     
@@ -162,8 +265,8 @@ class JiraDataExtractor:
         return []
     
     def _search_sprint_issues(self, project_key: str, sprint_ids: List[int], 
-                             max_results: int = None) -> List[Any]:
-        """Busca issues de sprints específicos"""
+                             max_results: int = None) -> List[IssueRecord]:
+        """Busca issues de sprints específicos y retorna sus filas extraídas"""
         self.jira_service.console.print(f"🔍 [cyan]Buscando issues de {len(sprint_ids)} sprint(s)...[/cyan]")
         
         # Obtener información detallada de los sprints seleccionados
@@ -188,82 +291,467 @@ class JiraDataExtractor:
         self.jira_service.console.print(f"   🎯 [dim]Sprint IDs: {', '.join(map(str, sprint_ids))}[/dim]")
         
         # Buscar issues
-        issues = self._paginated_search(jql, safety_limit, extract_all)
+        rows = self._search_issues(jql, safety_limit, extract_all)
         
-        if issues:
-            final_issues = self._remove_duplicates(issues)
-            self.jira_service.console.print(f"📊 [bold blue]TOTAL ENCONTRADO: {len(final_issues)} issues de sprints[/bold blue]")
-            return final_issues
+        if self._is_synced_scope():
+            self.jira_service.console.print(f"📊 [bold blue]ACTUALIZADOS: {len(rows)} issues de sprints desde la última sincronización[/bold blue]")
+            return rows
+        
+        if rows:
+            self.jira_service.console.print(f"📊 [bold blue]TOTAL ENCONTRADO: {len(rows)} issues de sprints[/bold blue]")
+            return rows
         else:
             self.jira_service.console.print("❌ [red]No se encontraron issues en los sprints seleccionados[/red]")
             return []
     
+    def _search_issues(self, jql: str, safety_limit: int, extract_all: bool) -> List[IssueRecord]:
+        """
+        Busca issues completos o, en modo incremental, solo los actualizados
+        
+        Cada página se procesa a medida que llega: solo se retienen las filas
+        extraídas, no los objetos Issue de Jira.
+        
+        En modo incremental el alcance (JQL sin ORDER BY) identifica la
+        sincronización: si ya tiene marca de agua, la búsqueda se limita a
+        `updated >= marca de agua`.
+        """
+        self._sync_state = None
+        
+        if self.incremental:
+            scope = self.issue_store.scope_for(jql)
+            last_sync = self.issue_store.get_last_sync(scope)
+            self._sync_state = {'scope': scope, 'last_sync': last_sync, 'truncated': False}
+            
+            if last_sync:
+                jql = self._build_incremental_jql(jql, last_sync)
+                self.jira_service.console.print(f"   🔄 [cyan]Sincronización incremental desde {last_sync}[/cyan]")
+                self.jira_service.console.print(f"   📋 [dim]JQL: {jql}[/dim]")
+            else:
+                self.jira_service.console.print("   🆕 [cyan]Primera sincronización de este alcance: descarga completa[/cyan]")
+        
+        self.jira_service.console.print("⚙️ [cyan]Procesando datos de timetracking por página...[/cyan]")
+        pages = self._prefetch_pages(self._iter_pages(jql, safety_limit, extract_all))
+        rows, fetched = self._extract_pages(pages)
+        
+        if self._sync_state is not None:
+            truncated = fetched >= safety_limit
+            self._sync_state['truncated'] = truncated
+            
+            # Keys vigentes del alcance, para eliminar del almacén los issues que
+            # salieron de él (ej: resueltos) o se borraron en Jira
+            if truncated:
+                scope_keys = None
+            elif self._sync_state['last_sync']:
+                scope_keys = self._search_scope_keys(self._sync_state['scope'], safety_limit)
+            else:
+                scope_keys = {row.key for row in rows}
+            self._sync_state['scope_keys'] = scope_keys
+        
+        return rows
+    
+    def _search_scope_keys(self, scope: str, safety_limit: int) -> Optional[Set[str]]:
+        """
+        Busca solo las keys de los issues del alcance (sin el filtro de marca de agua)
+        
+        Se ejecuta después de la búsqueda de actualizados: un issue que entra al
+        alcance entre ambas búsquedas figura en las dos y no se elimina. Usa la
+        misma paginación que la búsqueda de issues (en paralelo según
+        concurrency) con páginas de `key_page_size`, ya que cada issue pesa
+        apenas su key.
+        
+        Returns:
+            Keys del alcance, o None si la búsqueda alcanzó el límite de seguridad
+        """
+        self.jira_service.console.print("   🔑 [cyan]Buscando las keys vigentes del alcance...[/cyan]")
+        keys: Set[str] = set()
+        fetched = 0
+        
+        pages = self._iter_pages(scope, safety_limit, extract_all=False, fetch_page=self._fetch_key_page,
+                                 page_size=EXTRACTION_CONFIG['key_page_size'])
+        for page in pages:
+            fetched += len(page)
+            keys.update(issue['key'] for issue in page)
+        
+        if fetched >= safety_limit:
+            return None
+        
+        self.jira_service.console.print(f"   🔑 [dim]Keys vigentes del alcance: {len(keys)}[/dim]")
+        return keys
+    
+    def _is_synced_scope(self) -> bool:
+        """Indica si la última búsqueda fue incremental sobre un alcance ya sincronizado"""
+        return bool(self._sync_state and self._sync_state['last_sync'])
+    
+    def _build_incremental_jql(self, jql: str, last_sync: str) -> str:
+        """
+        Agrega el filtro `updated >= marca de agua` a un JQL conservando su ORDER BY
+        
+        Las fechas JQL se interpretan en la zona horaria del usuario de Jira;
+        si no se conoce, la ventana se amplía para cubrir cualquier desfase.
+        """
+        since = datetime.fromisoformat(last_sync) - timedelta(minutes=ISSUE_STORE_CONFIG['overlap_minutes'])
+        
+        try:
+            user_timezone = ZoneInfo(self.jira_service.get_user_timezone())
+        except Exception:
+            user_timezone = None
+        
+        if user_timezone is None:
+            since -= timedelta(hours=14)
+            user_timezone = timezone.utc
+        
+        jql_filter, order_by = self.issue_store.split_order_by(jql)
+        since_text = since.astimezone(user_timezone).strftime('%Y/%m/%d %H:%M')
+        
+        return f'({jql_filter}) AND updated >= "{since_text}"{order_by}'
+    
+    def _sync_issue_rows(self, rows: List[IssueRecord]) -> List[IssueRecord]:
+        """
+        Guarda las filas descargadas en el almacén local y retorna todas las del alcance
+        
+        Args:
+            rows: Filas extraídas en esta ejecución (actualizadas)
+            
+        Returns:
+            Todas las filas del alcance (actualizadas + almacenadas)
+        """
+        scope = self._sync_state['scope']
+        truncated = self._sync_state['truncated']
+        
+        if truncated:
+            self.jira_service.console.print("   ⚠️ [yellow]Búsqueda truncada por el límite de seguridad: no se avanza la marca de agua[/yellow]")
+        
+        watermark = self.issue_store.upsert_rows(
+            scope, [row.to_storage() for row in rows], advance_watermark=not truncated
+        )
+        
+        scope_keys = self._sync_state['scope_keys']
+        if scope_keys is not None:
+            removed = self.issue_store.delete_missing(scope, scope_keys)
+            if removed:
+                self.jira_service.console.print(
+                    f"   🧹 [cyan]{removed} issues ya no están en el alcance: eliminados del almacén[/cyan]"
+                )
+        
+        stored_rows = [IssueRecord.from_storage(row) for row in self.issue_store.load_rows(scope)]
+        
+        self.jira_service.console.print(
+            f"   💾 [cyan]Almacén local: {len(rows)} issues actualizados, "
+            f"{len(stored_rows)} en total (marca de agua: {watermark})[/cyan]"
+        )
+        
+        return stored_rows
+    
     def _paginated_search(self, jql: str, safety_limit: int, extract_all: bool) -> List[Any]:
-        """Realiza búsqueda paginada"""
-        start_at = 0
-        page_size = EXTRACTION_CONFIG['page_size']
-        all_issues = []
+        """Realiza búsqueda paginada y retorna todos los issues (materializados en memoria)"""
+        return [issue for page in self._iter_pages(jql, safety_limit, extract_all) for issue in page]
+    
+    def _iter_pages(self, jql: str, safety_limit: int, extract_all: bool,
+                    fetch_page: Optional[Callable[[str, int, int], List[Any]]] = None,
+                    page_size: Optional[int] = None) -> Iterator[List[Any]]:
+        """
+        Genera las páginas de una búsqueda en orden (en paralelo si concurrency > 1)
+        
+        Args:
+            fetch_page: Descarga de una página (None = _fetch_page, con la proyección de campos configurada)
+            page_size: Tamaño de página pedido (None = valor de configuración)
+        """
+        fetch_page = fetch_page or self._fetch_page
+        page_size = page_size or EXTRACTION_CONFIG['page_size']
+        if self.concurrency > 1:
+            return self._iter_parallel_pages(jql, safety_limit, extract_all, fetch_page, page_size)
+        return self._iter_serial_pages(jql, safety_limit, extract_all, fetch_page, page_size)
+    
+    def _prefetch_pages(self, pages: Iterator[List[Any]]) -> Iterator[List[Any]]:
+        """
+        Descarga las páginas en un hilo propio mientras se extraen las anteriores
+        
+        La descarga (espera de red) y la extracción (CPU) se solapan a través
+        de una cola acotada a `prefetch_pages` páginas: si la extracción se
+        atrasa, la descarga se detiene hasta que haya lugar, de modo que la
+        memoria no crece con el tamaño del proyecto. Las páginas se entregan
+        en orden y los errores de la descarga se propagan al consumidor.
+        
+        Args:
+            pages: Generador de páginas (se consume en el hilo de descarga)
+            
+        Yields:
+            Páginas de issues en el orden original
+        """
+        depth = EXTRACTION_CONFIG['prefetch_pages']
+        if depth <= 0:
+            yield from pages
+            return
+        
+        buffer: queue.Queue = queue.Queue(maxsize=depth)
+        stop = threading.Event()
+        
+        def put(item: Tuple[str, Any]) -> bool:
+            """Encola respetando la cota; False si el consumidor abandonó la búsqueda"""
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce() -> None:
+            try:
+                for page in pages:
+                    if not put(('page', page)):
+                        return
+                put(('end', None))
+            except Exception as e:
+                put(('error', e))
+            finally:
+                # Cerrar el generador en su hilo (libera el pool de descargas en paralelo)
+                close = getattr(pages, 'close', None)
+                if close is not None:
+                    close()
+        
+        producer = threading.Thread(target=produce, name='jira-page-prefetch', daemon=True)
+        producer.start()
+        
+        try:
+            while True:
+                kind, item = buffer.get()
+                if kind == 'end':
+                    break
+                if kind == 'error':
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join()
+    
+    def _iter_serial_pages(self, jql: str, safety_limit: int, extract_all: bool,
+                           fetch_page: Callable[[str, int, int], List[Any]], page_size: int,
+                           start_at: int = 0) -> Iterator[List[Any]]:
+        """Genera las páginas de una búsqueda secuencial (continuando desde start_at si se indica)"""
+        fetched = start_at
         
         while True:
             # Verificar límite de seguridad
-            if len(all_issues) >= safety_limit:
+            if fetched >= safety_limit:
                 self.jira_service.console.print(f"   🛡️ [yellow]Límite de seguridad alcanzado: {safety_limit} issues[/yellow]")
                 break
             
             # Calcular tamaño de página actual
-            remaining = safety_limit - len(all_issues)
+            remaining = safety_limit - fetched
             current_page_size = min(page_size, remaining) if not extract_all else page_size
             
             self.jira_service.console.print(f"   📄 [dim]Página: desde {start_at}, tamaño {current_page_size}[/dim]")
             
             # Hacer búsqueda
-            page_issues = self.jira_service.search_issues(jql, start_at, current_page_size)
+            page_issues = fetch_page(jql, start_at, current_page_size)
             
             if not page_issues:
                 self.jira_service.console.print(f"   🏁 [green]Última página: 0 < {current_page_size}[/green]")
                 break
             
-            all_issues.extend(page_issues)
-            self.jira_service.console.print(f"   📊 [green]+{len(page_issues)} issues (total: {len(all_issues)})[/green]")
+            fetched += len(page_issues)
+            self.jira_service.console.print(f"   📊 [green]+{len(page_issues)} issues (total: {fetched})[/green]")
+            
+            yield page_issues
             
-            # Verificar si es la última página
-            if len(page_issues) < current_page_size:
+            # Verificar si es la última página (una página corta no lo es si el
+            # servidor limitó maxResults y el total indica que quedan issues)
+            total = getattr(page_issues, 'total', None)
+            if len(page_issues) < current_page_size and (total is None or fetched >= total):
                 self.jira_service.console.print(f"   🏁 [green]Última página: {len(page_issues)} < {current_page_size}[/green]")
                 break
             
             start_at += len(page_issues)
+    
+    def _iter_parallel_pages(self, jql: str, safety_limit: int, extract_all: bool,
+                             fetch_page: Callable[[str, int, int], List[Any]],
+                             page_size: int) -> Iterator[List[Any]]:
+        """
+        Genera las páginas de una búsqueda descargándolas en paralelo
+        
+        La primera página se pide sola para conocer el total; el resto de
+        offsets se reparte en un pool acotado por `concurrency`. Solo se
+        adelantan `2 * concurrency` páginas respecto de la que se está
+        procesando, de modo que la memoria no crece con el tamaño del
+        proyecto. Las páginas se entregan en orden y respetan el límite de
+        seguridad.
+        """
+        first_page_size = page_size if extract_all else min(page_size, safety_limit)
+        
+        self.jira_service.console.print(f"   📄 [dim]Página: desde 0, tamaño {first_page_size}[/dim]")
+        first_page = fetch_page(jql, 0, first_page_size)
+        
+        if not first_page:
+            self.jira_service.console.print(f"   🏁 [green]Última página: 0 < {first_page_size}[/green]")
+            return
+        
+        fetched = len(first_page)
+        total = getattr(first_page, 'total', None)
+        self.jira_service.console.print(f"   📊 [green]+{fetched} issues (total: {fetched})[/green]")
+        yield first_page
+        
+        if total is None:
+            # Sin total no se pueden calcular los offsets: continuar en modo secuencial
+            if fetched < first_page_size:
+                return
+            self.jira_service.console.print("   ⚠️ [yellow]Jira no informó el total, continuando en modo secuencial[/yellow]")
+            yield from self._iter_serial_pages(jql, safety_limit, extract_all, fetch_page, page_size,
+                                               start_at=fetched)
+            return
+        
+        if fetched >= total:
+            self.jira_service.console.print(f"   🏁 [green]Última página: {fetched} de {total}[/green]")
+            return
+        
+        # El servidor puede limitar maxResults: usar el tamaño real de la primera página
+        stride = fetched
+        end = min(total, safety_limit)
+        offsets = iter(range(stride, end, stride))
+        remaining_pages = len(range(stride, end, stride))
+        
+        if total > safety_limit:
+            self.jira_service.console.print(f"   🛡️ [yellow]Límite de seguridad: {safety_limit} de {total} issues[/yellow]")
+        
+        self.jira_service.console.print(
+            f"   ⚡ [cyan]{total} issues en Jira: {remaining_pages} páginas restantes "
+            f"con {self.concurrency} descargas en paralelo[/cyan]"
+        )
+        
+        def fetch(start_at: int) -> List[Any]:
+            current_page_size = stride if extract_all else min(stride, safety_limit - start_at)
+            return fetch_page(jql, start_at, current_page_size)
+        
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            # Ventana acotada de descargas en curso, consumidas en el orden de los offsets
+            pending = deque()
+            for start_at in offsets:
+                pending.append((start_at, executor.submit(fetch, start_at)))
+                if len(pending) >= 2 * self.concurrency:
+                    break
             
-            # Pausa para evitar rate limiting
-            if EXTRACTION_CONFIG['page_delay'] > 0:
-                time.sleep(EXTRACTION_CONFIG['page_delay'])
+            while pending:
+                start_at, future = pending.popleft()
+                page_issues = future.result()
+                
+                next_start_at = next(offsets, None)
+                if next_start_at is not None:
+                    pending.append((next_start_at, executor.submit(fetch, next_start_at)))
+                
+                fetched += len(page_issues)
+                self.jira_service.console.print(
+                    f"   📊 [green]Página desde {start_at}: +{len(page_issues)} issues (total: {fetched})[/green]"
+                )
+                yield page_issues
+    
+    def _fetch_page(self, jql: str, start_at: int, page_size: int) -> List[Any]:
+        """Descarga una página de resultados con la proyección de campos configurada"""
+        return self.jira_service.search_issues(
+            jql, start_at, page_size,
+            fields=self.issue_extractor.search_fields, expand=self.issue_extractor.search_expand,
+            raw=self.raw_json
+        )
+    
+    def _fetch_key_page(self, jql: str, start_at: int, page_size: int) -> List[Any]:
+        """Descarga una página de resultados solo con la key de cada issue (JSON)"""
+        return self.jira_service.search_issues(jql, start_at, page_size, fields=['key'], raw=True)
+    
+    def _extract_pages(self, pages: Iterable[Iterable[Any]]) -> Tuple[List[IssueRecord], int]:
+        """
+        Extrae las filas de cada página a medida que llega, sin retener los issues
+        
+        Los duplicados (un issue que se movió de página durante la paginación)
+        se detectan por key: la fila conserva la posición de la primera
+        aparición y los datos de la última.
         
-        return all_issues
+        Args:
+            pages: Páginas de issues de Jira (iterables, se consumen una vez)
+            
+        Returns:
+            Tupla (filas extraídas, cantidad de issues recibidos)
+        """
+        rows: List[IssueRecord] = []
+        positions: Dict[str, int] = {}
+        fetched = 0
+        duplicates = 0
+        
+        issues = (issue for page in pages for issue in page)
+        parallel = self._create_parallel_extractor()
+        
+        # Con varios procesos los registros llegan en el mismo orden que los issues
+        if parallel is not None:
+            records = parallel.extract(self.issue_extractor, issues)
+        else:
+            records = map(self._extract_issue_data, issues)
+        
+        for record in records:
+            fetched += 1
+            if record is None:
+                continue
+            
+            position = positions.get(record.key)
+            if position is None:
+                positions[record.key] = len(rows)
+                rows.append(record)
+            else:
+                rows[position] = record
+                duplicates += 1
+        
+        if parallel is not None:
+            for key, error in parallel.errors:
+                self.jira_service.console.print(f"⚠️ [yellow]Error procesando {key}: {error}[/yellow]")
+            self.display_utils.show_worker_stats(parallel.stats)
+        
+        if duplicates > 0:
+            self.jira_service.console.print(f"   🔄 [yellow]Duplicados eliminados: {duplicates}[/yellow]")
+        
+        return rows, fetched
     
-    def _remove_duplicates(self, issues: List[Any]) -> List[Any]:
-        """Elimina issues duplicados"""
-        unique_issues = {issue.key: issue for issue in issues}
-        final_issues = list(unique_issues.values())
+    def _create_parallel_extractor(self) -> Optional[ParallelExtractor]:
+        """
+        Crea el extractor en procesos si se pidieron varios workers
         
-        duplicates_removed = len(issues) - len(final_issues)
-        if duplicates_removed > 0:
-            self.jira_service.console.print(f"   🔄 [yellow]Duplicados eliminados: {duplicates_removed}[/yellow]")
+        Los objetos Resource de la librería jira no se pueden enviar a otros
+        procesos: sin raw_json la extracción sigue en el proceso principal.
         
-        return final_issues
+        Returns:
+            Extractor en procesos, o None para extraer en el proceso principal
+        """
+        if self.workers <= 1:
+            return None
+        
+        if not self.raw_json:
+            self.jira_service.console.print("   ⚠️ [yellow]--workers requiere issues en JSON (raw_json): extracción en el proceso principal[/yellow]")
+            return None
+        
+        self.jira_service.console.print(f"   ⚡ [cyan]Extracción repartida en {self.workers} procesos[/cyan]")
+        return ParallelExtractor(self.workers)
     
-    def _process_issues(self, issues: List[Any]) -> List[Dict[str, Any]]:
+    def _process_issues(self, issues: List[Any]) -> List[IssueRecord]:
         """Procesa lista de issues extrayendo todos los datos"""
         self.jira_service.console.print("⚙️ [cyan]Procesando datos de timetracking...[/cyan]")
         
-        # Procesar todos los issues
-        all_issues_data = []
-        for issue in track(issues, description="Procesando issues..."):
-            issue_data = self._extract_issue_data(issue)
-            if issue_data:
-                all_issues_data.append(issue_data)
+        rows, _ = self._extract_pages([track(issues, description="Procesando issues...")])
+        return self._process_rows(rows)
+    
+    def _process_rows(self, rows: List[IssueRecord]) -> List[IssueRecord]:
+        """
+        Completa las filas extraídas con la agregación de subtareas
+        
+        Args:
+            rows: Filas extraídas (issues principales y subtareas)
+            
+        Returns:
+            Issues principales con los tiempos de sus subtareas
+        """
+        # En modo incremental, combinar con las filas del almacén local
+        if self._sync_state is not None:
+            rows = self._sync_issue_rows(rows)
         
         # Separar subtareas de issues principales
-        main_issues = [issue for issue in all_issues_data if not issue.get('is_subtask', False)]
-        subtasks = [issue for issue in all_issues_data if issue.get('is_subtask', False)]
+        main_issues = [issue for issue in rows if not issue.is_subtask]
+        subtasks = [issue for issue in rows if issue.is_subtask]
+        self.subtasks = subtasks if self._keep_subtasks else []
         
         # Procesar relaciones de subtareas
         self.jira_service.console.print("🔗 [cyan]Procesando relaciones de subtareas...[/cyan]")
@@ -271,53 +759,73 @@ class JiraDataExtractor:
         
         return final_data
     
-    def _extract_issue_data(self, issue: Any) -> Dict[str, Any]:
-        """Extrae todos los datos relevantes de un issue usando extractores especializados"""
+    def _extract_issue_data(self, issue: Any) -> Optional[IssueRecord]:
+        """Extrae todos los datos relevantes de un issue usando extractores especializados (None si falla)"""
         try:
-            # Datos básicos del issue
-            data = {
-                'key': issue.key,
-                'summary': issue.fields.summary,
-                'issue_type': issue.fields.issuetype.name,
-                'status': issue.fields.status.name,
-                'priority': issue.fields.priority.name if issue.fields.priority else 'Sin Prioridad',
-                'assignee': issue.fields.assignee.displayName if issue.fields.assignee else 'Sin Asignar',
-                'reporter': issue.fields.reporter.displayName if issue.fields.reporter else 'Desconocido',
-                'created': issue.fields.created,
-                'updated': issue.fields.updated,
-                'project_key': issue.fields.project.key
-            }
-            
-            # Usar extractores especializados
-            data.update(self.timetracking_extractor.extract(issue))
-            data.update(self.structure_extractor.extract(issue))
-            data.update(self.metadata_extractor.extract(issue))
-            
-            return data
+            return self.issue_extractor.extract(issue)
             
         except Exception as e:
-            self.jira_service.console.print(f"⚠️ [yellow]Error procesando {issue.key}: {str(e)}[/yellow]")
-            return {}
+            key = self.structure_extractor._get_issue_key(issue)
+            self.jira_service.console.print(f"⚠️ [yellow]Error procesando {key}: {str(e)}[/yellow]")
+            return None
     
-    def _export_data(self, data: List[Dict[str, Any]], project_key: str, 
+    def _export_data(self, data: List[IssueRecord], project_key: str, 
                     export_format: str) -> bool:
-        """Exporta los datos usando los exportadores especializados"""
+        """
+        Exporta los datos usando los exportadores registrados
+        
+        El DataFrame con columnas ordenadas y horas numéricas se arma una sola
+        vez y se comparte (solo lectura) entre los exportadores que lo usan;
+        los que declaran uses_subtasks reciben además las filas de subtareas.
+        Cada formato se escribe en su propio hilo y se muestra su duración.
+        """
         if not data:
             self.jira_service.console.print("❌ [red]No hay datos para exportar[/red]")
             return False
         
-        success = True
+        exporters = [self.exporters[name] for name in resolve_formats(export_format)]
+        
+        # Los alias que abarcan todos los formatos omiten los que no tienen sus dependencias
+        if export_format in FORMAT_ALIASES and FORMAT_ALIASES[export_format] is None:
+            for name in get_unavailable_formats():
+                self.jira_service.console.print(
+                    f"⚠️ [yellow]Formato '{name}' omitido: faltan sus dependencias opcionales[/yellow]"
+                )
+        
+        timings: Dict[str, Dict[str, Any]] = {}
+        
+        # Tabla compartida, solo si algún formato la necesita
+        frame = None
+        if any(exporter.uses_frame for exporter in exporters):
+            start = time.perf_counter()
+            frame = BaseExporter.prepare_dataframe(data, numeric_times=True)
+            timings['tabla compartida'] = {'seconds': time.perf_counter() - start, 'success': True}
         
-        # Exportar según el formato solicitado
-        if export_format in ['excel', 'both']:
-            if not self.excel_exporter.export(data, project_key):
-                success = False
+        # Escribir los formatos en paralelo
+        workers = max(1, min(len(exporters), EXPORT_CONFIG['export_workers']))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._run_exporter, exporter, data, project_key, frame)
+                for exporter in exporters
+            ]
+            results = [future.result() for future in futures]
         
-        if export_format in ['csv', 'both']:
-            if not self.csv_exporter.export(data, project_key):
-                success = False
+        for exporter, (success, seconds) in zip(exporters, results):
+            timings[exporter.format_name] = {'seconds': seconds, 'success': success}
         
-        return success
+        self.display_utils.show_export_stats(timings)
+        
+        return all(success for success, _ in results)
+    
+    def _run_exporter(self, exporter: BaseExporter, data: List[IssueRecord], project_key: str,
+                      frame: Optional[Any]) -> Tuple[bool, float]:
+        """Ejecuta un exportador y retorna (éxito, segundos)"""
+        start = time.perf_counter()
+        if exporter.uses_subtasks:
+            success = exporter.export(data, project_key, frame=frame, subtasks=self.subtasks)
+        else:
+            success = exporter.export(data, project_key, frame=frame)
+        return success, time.perf_counter() - start
     
     def _get_mode_description(self, max_results: int, use_sprints: bool) -> str:
         """Genera descripción del modo de ejecución"""
@@ -326,4 +834,6 @@ class JiraDataExtractor:
             mode_description += " - SELECCIÓN DE SPRINTS"
         else:
             mode_description += " - BÚSQUEDA TRADICIONAL"
+        if self.incremental:
+            mode_description += " - INCREMENTAL"
         return mode_description
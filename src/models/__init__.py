@@ -0,0 +1,6 @@
+"""
+Modelos de datos internos del extractor
+"""
+from .issue_record import IssueRecord, SUBTASK_COLUMNS, TIME_COLUMNS, format_hours, hours, seconds_to_tenths
+
+__all__ = ['IssueRecord', 'SUBTASK_COLUMNS', 'TIME_COLUMNS', 'format_hours', 'hours', 'seconds_to_tenths']
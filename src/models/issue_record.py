@@ -0,0 +1,180 @@
+"""
+Registro compacto de un issue procesado
+"""
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+from ..config import COLUMN_ORDER
+
+# Columnas de tiempo del issue, guardadas en segundos
+TIME_COLUMNS = COLUMN_ORDER['time'] + COLUMN_ORDER['aggregate_time']
+
+# Columnas de tiempo agregado de subtareas por categoría, en décimas de hora
+SUBTASK_COLUMNS = tuple(COLUMN_ORDER['subtask'])
+
+# Columnas de texto con pocos valores distintos (se comparte una sola copia)
+INTERNED_COLUMNS = (
+    'status', 'priority', 'assignee', 'reporter', 'sprint_name', 'sprint_id',
+    'sprint_state', 'board_name', 'components', 'labels', 'fixversion'
+)
+
+# Tuplas de nombres de campos genéricos compartidas entre registros
+_CUSTOM_NAMES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def hours(seconds: Optional[int]) -> float:
+    """
+    Convierte segundos a horas redondeadas a un decimal
+
+    Args:
+        seconds: Tiempo en segundos
+
+    Returns:
+        Horas (ej: 45000 s → 12.5)
+    """
+    if not seconds:
+        return 0.0
+    return round(seconds / 3600, 1)
+
+
+def format_hours(seconds: Optional[int]) -> str:
+    """
+    Convierte segundos a horas con formato decimal usando coma
+
+    Args:
+        seconds: Tiempo en segundos
+
+    Returns:
+        Horas formateadas con coma decimal (ej: '12,5')
+    """
+    return str(hours(seconds)).replace('.', ',')
+
+
+def seconds_to_tenths(seconds: Optional[int]) -> int:
+    """
+    Convierte segundos a décimas de hora, con el mismo redondeo que format_hours
+
+    Args:
+        seconds: Tiempo en segundos
+
+    Returns:
+        Décimas de hora (ej: 45000 s → 125)
+    """
+    if not seconds:
+        return 0
+    return round(round(seconds / 3600, 1) * 10)
+
+
+class IssueRecord:
+    """
+    Fila de un issue procesado con tiempos numéricos
+
+    Los tiempos del issue se guardan en segundos enteros y los totales de
+    subtareas por categoría en décimas de hora (cada subtarea aporta sus
+    horas redondeadas a un decimal, igual que en su propia fila). El formato
+    con coma decimal se aplica solo al exportar (to_dict). Los campos
+    genéricos personalizados (CUSTOM_FIELDS) se guardan como una tupla de
+    valores y una tupla de nombres compartida por todos los registros.
+    """
+
+    # Campos en el orden de las columnas exportadas
+    FIELDS = (
+        # Datos básicos
+        'key', 'summary', 'issue_type', 'status', 'priority', 'assignee',
+        'reporter', 'created', 'updated', 'project_key',
+        # Timetracking (segundos)
+        *TIME_COLUMNS,
+        # Estructura
+        'epic_key', 'feature', 'is_subtask', 'parent_key', 'sprint_name',
+        'sprint_id', 'sprint_state', 'board_name',
+        # Metadatos
+        'components', 'labels', 'fixversion'
+    )
+
+    __slots__ = FIELDS + ('custom_names', 'custom_values', 'subtask_totals')
+
+    def __init__(self, **values: Any):
+        """
+        Args:
+            **values: Valores de los campos; los que no están en FIELDS se
+                guardan como campos genéricos personalizados
+        """
+        for name in self.FIELDS:
+            setattr(self, name, values.pop(name, None))
+
+        for name in TIME_COLUMNS:
+            if getattr(self, name) is None:
+                setattr(self, name, 0)
+
+        for name in INTERNED_COLUMNS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+
+        names = tuple(values)
+        self.custom_names: Tuple[str, ...] = _CUSTOM_NAMES.setdefault(names, names)
+        self.custom_values: Tuple[Any, ...] = tuple(values.values())
+        self.subtask_totals: Optional[Tuple[Optional[int], ...]] = None
+
+    @property
+    def custom(self) -> Dict[str, Any]:
+        """Campos genéricos personalizados {columna: valor}"""
+        return dict(zip(self.custom_names, self.custom_values))
+
+    def to_dict(self, numeric_times: bool = False) -> Dict[str, Any]:
+        """
+        Fila para exportar, con los tiempos en horas
+
+        Las columnas de subtareas solo se incluyen si se procesaron
+        subtareas (ver SubtaskProcessor). En un issue con subtareas, una
+        categoría sin ninguna se escribe '0' (no '0,0'), como en la salida
+        original del procesador de subtareas.
+
+        Args:
+            numeric_times: Si True, las horas quedan como números (ej: 12.5);
+                si no, como texto con coma decimal (ej: '12,5')
+
+        Returns:
+            Diccionario {columna: valor}
+        """
+        row = {name: getattr(self, name) for name in self.FIELDS}
+        convert = hours if numeric_times else format_hours
+        for name in TIME_COLUMNS:
+            row[name] = convert(row[name])
+        row.update(self.custom)
+
+        if self.subtask_totals is not None:
+            for name, tenths in zip(SUBTASK_COLUMNS, self.subtask_totals):
+                if tenths is None:
+                    row[name] = 0.0 if numeric_times else '0'
+                else:
+                    row[name] = tenths / 10 if numeric_times else str(tenths / 10).replace('.', ',')
+
+        return row
+
+    def to_storage(self) -> Dict[str, Any]:
+        """
+        Fila para el almacén local, con los tiempos en segundos
+
+        Returns:
+            Diccionario serializable a JSON
+        """
+        row = {name: getattr(self, name) for name in self.FIELDS}
+        row.update(self.custom)
+        return row
+
+    @classmethod
+    def from_storage(cls, row: Dict[str, Any]) -> 'IssueRecord':
+        """
+        Reconstruye un registro guardado con to_storage
+
+        Args:
+            row: Fila del almacén local
+
+        Returns:
+            Registro del issue
+        """
+        return cls(**row)
+
+    def __repr__(self) -> str:
+        return f"IssueRecord(key={self.key!r}, issue_type={self.issue_type!r})"
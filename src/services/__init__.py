@@ -2,5 +2,6 @@
 Servicios para comunicación con APIs externas
 """
 from .jira_service import JiraService
+from .rate_limiter import RateLimiter
 
-__all__ = ['JiraService']
+__all__ = ['JiraService', 'RateLimiter']
@@ -3,20 +3,131 @@ Servicio de conexión y comunicación con Jira
 """
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, List, Dict, Any
-from jira import JIRA
+from jira import JIRA, JIRAError
+from jira.client import ResultList
 from rich.console import Console
 
-from ..config import JIRA_CONFIG, validate_config
+from ..config import JIRA_CONFIG, HTTP_CONFIG, RECORDING_CONFIG, validate_config
+from .rate_limiter import RateLimiter, THROTTLE_STATUS_CODES
+from .recording_adapter import RecordReplayAdapter, RECORD_MODE, REPLAY_MODE
+from ..storage import MetadataCache, ResponseStore
 
 
 class JiraService:
     """Servicio para manejar la conexión y comunicación con Jira"""
     
-    def __init__(self):
+    def __init__(self, pool_size: Optional[int] = None, http_mode: Optional[str] = None,
+                 http_store: Optional[str] = None):
+        """
+        Args:
+            pool_size: Conexiones keep-alive por host (None = valor de configuración)
+            http_mode: 'record' para grabar las respuestas, 'replay' para
+                reproducirlas sin red (None = acceso normal a Jira)
+            http_store: Directorio de la grabación (None = valor de configuración)
+        """
         self.console = Console()
         self.jira: Optional[JIRA] = None
         self._boards_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self.http_mode = http_mode
+        
+        # Pool de conexiones compartido por la API Agile y el cliente JIRA
+        self.pool_size = max(pool_size or 0, HTTP_CONFIG['pool_maxsize'])
+        
+        if http_mode:
+            # Grabación/reproducción: cache de metadatos propio de la grabación y
+            # vacío, para que todas las llamadas pasen por el almacén
+            self.response_store = ResponseStore(http_store)
+            self.metadata_cache = MetadataCache(os.path.join(self.response_store.path, 'metadata.sqlite3'))
+            self.metadata_cache.invalidate()
+            self._http_adapter = RecordReplayAdapter(
+                self.response_store,
+                http_mode,
+                pool_connections=HTTP_CONFIG['pool_connections'],
+                pool_maxsize=self.pool_size
+            )
+        else:
+            self.response_store = None
+            self.metadata_cache = MetadataCache()
+            self._http_adapter = HTTPAdapter(
+                pool_connections=HTTP_CONFIG['pool_connections'],
+                pool_maxsize=self.pool_size
+            )
+        
+        # Limitador de tasa compartido por todos los hilos que usan el servicio
+        # (al reproducir no hay servidor al que proteger)
+        self.rate_limiter = RateLimiter(enabled=http_mode != REPLAY_MODE)
+        
+        self.session = self._create_session()
+    
+    def _create_session(self) -> requests.Session:
+        """
+        Crea la sesión HTTP para las llamadas a la API Agile
+        
+        Returns:
+            Sesión con keep-alive, compresión y el pool compartido montado
+        """
+        session = requests.Session()
+        session.headers['Accept'] = 'application/json'
+        self._configure_session(session)
+        return session
+    
+    def _configure_session(self, session: requests.Session) -> None:
+        """Monta el pool compartido, la compresión gzip y el limitador de tasa en una sesión"""
+        session.mount('https://', self._http_adapter)
+        session.mount('http://', self._http_adapter)
+        session.headers['Accept-Encoding'] = HTTP_CONFIG['accept_encoding']
+        session.hooks['response'].append(self._on_response)
+    
+    def _attach_client(self, client: JIRA) -> None:
+        """
+        Conecta un cliente JIRA a la sesión compartida y completa su versión
+        
+        Es el único lugar que usa atributos internos de la librería jira: el
+        constructor no acepta una sesión externa (`_session`) y, creado con
+        get_server_info=False, deja la versión en (0, 0, 0) (`_version`).
+        Probado con jira 3.8 a 3.10; la versión está acotada en requirements.txt.
+        
+        Args:
+            client: Cliente recién creado, antes de cualquier request
+        """
+        self._configure_session(client._session)
+        
+        server_info = client.server_info()
+        client._version = tuple(server_info['versionNumbers'])
+        client.deploymentType = server_info.get('deploymentType')
+    
+    def _on_response(self, response: requests.Response, *args, **kwargs) -> None:
+        """Hook de requests: informa cada respuesta al limitador de tasa"""
+        self.rate_limiter.record_response(response)
+    
+    def _agile_get(self, url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Realiza un GET a la API Agile respetando el limitador de tasa
+        
+        Reintenta ante 429/503; la espera la impone el limitador según
+        Retry-After / X-RateLimit-* o backoff exponencial.
+        
+        Args:
+            url: URL completa del endpoint
+            params: Parámetros de query
+            
+        Returns:
+            Respuesta HTTP (la última, si se agotaron los reintentos)
+        """
+        max_retries = self.rate_limiter.max_retries
+        
+        for attempt in range(max_retries + 1):
+            self.rate_limiter.acquire()
+            response = self.session.get(url, params=params)
+            
+            if not self.rate_limiter.is_throttled(response) or attempt == max_retries:
+                return response
+            
+            self.console.print(f"   ⏳ [yellow]HTTP {response.status_code}: reintentando ({attempt + 1}/{max_retries})...[/yellow]")
+        
+        return response
     
     def connect(self) -> bool:
         """
@@ -26,6 +137,9 @@ class JiraService:
             bool: True si la conexión es exitosa, False en caso contrario
         """
         try:
+            if self.http_mode == REPLAY_MODE:
+                self._prepare_replay_config()
+            
             validation = validate_config()
             
             if not validation['valid']:
@@ -35,11 +149,27 @@ class JiraService:
             
             self.console.print("🔄 [cyan]Conectando a Jira...[/cyan]")
             
+            auth = (JIRA_CONFIG['email'], JIRA_CONFIG['token'])
+            self.session.auth = auth
+            
+            # Sin reintentos internos: los 429 los gestiona el limitador del servicio.
+            # La información del servidor se pide después de configurar la sesión
+            # para que también pase por el pool compartido (y por la grabación)
             self.jira = JIRA(
                 server=JIRA_CONFIG['server'],
-                basic_auth=(JIRA_CONFIG['email'], JIRA_CONFIG['token'])
+                basic_auth=auth,
+                max_retries=0,
+                get_server_info=False
             )
             
+            # El cliente JIRA crea su propia sesión: compartir el mismo pool de conexiones
+            self._attach_client(self.jira)
+            
+            if self.http_mode == RECORD_MODE:
+                self.response_store.set_meta('server', JIRA_CONFIG['server'])
+            elif self.http_mode == REPLAY_MODE:
+                self.console.print(f"📼 [cyan]Reproduciendo respuestas grabadas de {self.response_store.path} (sin red)[/cyan]")
+            
             # Verificar conexión
             current_user = self.jira.current_user()
             self.console.print(f"✅ [green]Conectado como: {current_user}[/green]")
@@ -50,8 +180,50 @@ class JiraService:
             self.console.print(f"❌ [red]Error de conexión: {str(e)}[/red]")
             return False
     
+    def _prepare_replay_config(self) -> None:
+        """
+        Completa la configuración de conexión para reproducir sin credenciales
+        
+        El host no forma parte de la clave de las respuestas grabadas: si falta
+        el servidor se usa el registrado en la grabación, y las credenciales
+        faltantes se reemplazan por valores de relleno que nunca se envían.
+        """
+        if not JIRA_CONFIG['server']:
+            JIRA_CONFIG['server'] = self.response_store.get_meta('server') or RECORDING_CONFIG['placeholder_server']
+        JIRA_CONFIG['email'] = JIRA_CONFIG['email'] or 'replay'
+        JIRA_CONFIG['token'] = JIRA_CONFIG['token'] or 'replay'
+    
+    def get_http_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Retorna los contadores de grabación/reproducción
+        
+        Returns:
+            Diccionario con requests grabados, reproducidos y faltantes, o None
+            si el servicio accede a Jira normalmente
+        """
+        if not self.http_mode:
+            return None
+        return self._http_adapter.get_stats()
+    
+    def get_user_timezone(self) -> Optional[str]:
+        """
+        Obtiene la zona horaria del usuario conectado (las fechas JQL se interpretan en ella)
+        
+        Returns:
+            Nombre IANA de la zona horaria (ej: America/Argentina/Buenos_Aires) o None
+        """
+        if not self.jira:
+            raise RuntimeError("No hay conexión activa con Jira")
+        
+        try:
+            return self.jira.myself().get('timeZone')
+        except Exception:
+            return None
+    
     def search_issues(self, jql: str, start_at: int = 0, max_results: int = 100, 
-                     expand: str = 'changelog') -> List[Any]:
+                     fields: Optional[List[str]] = None, 
+                     expand: Optional[str] = None,
+                     raw: bool = False) -> List[Any]:
         """
         Busca issues usando JQL
         
@@ -59,25 +231,88 @@ class JiraService:
             jql: Query JQL
             start_at: Índice de inicio para paginación
             max_results: Máximo número de resultados por página
-            expand: Campos adicionales a expandir
+            fields: Campos a solicitar (None = todos los campos)
+            expand: Campos adicionales a expandir (None = sin expansión)
+            raw: Si True, retorna los issues como diccionarios JSON sin
+                construir objetos Issue de la librería jira
             
         Returns:
-            Lista de issues encontrados
+            Lista de issues encontrados (con el total de la búsqueda en `.total`)
         """
         if not self.jira:
             raise RuntimeError("No hay conexión activa con Jira")
         
-        return self.jira.search_issues(
-            jql,
-            startAt=start_at,
-            maxResults=max_results,
-            expand=expand
-        )
+        if not raw:
+            return self._search_with_retry(jql, start_at, max_results, fields, expand, json_result=False)
+        
+        # Un solo request por página, igual que la búsqueda con objetos (la
+        # librería no completa maxResults si el servidor devuelve menos): la
+        # paginación usa el total para seguir cuando la página viene corta
+        result = self._search_with_retry(jql, start_at, max_results, fields, expand, json_result=True)
+        
+        # Misma interfaz que la búsqueda con objetos: lista con el total de resultados
+        return ResultList(result.get('issues', []), _startAt=start_at, _maxResults=max_results,
+                          _total=result.get('total'))
+    
+    def _search_with_retry(self, jql: str, start_at: int, max_results: int,
+                           fields: Optional[List[str]], expand: Optional[str],
+                           json_result: bool) -> Any:
+        """Ejecuta una búsqueda respetando el rate limit y reintentando ante 429/503"""
+        max_retries = self.rate_limiter.max_retries
+        
+        for attempt in range(max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                return self.jira.search_issues(
+                    jql,
+                    startAt=start_at,
+                    maxResults=max_results,
+                    fields=','.join(fields) if fields else '*all',
+                    expand=expand,
+                    json_result=json_result
+                )
+            except JIRAError as e:
+                if e.status_code not in THROTTLE_STATUS_CODES or attempt == max_retries:
+                    raise
+                self.console.print(f"   ⏳ [yellow]HTTP {e.status_code} en búsqueda: reintentando ({attempt + 1}/{max_retries})...[/yellow]")
+    
+    def get_field_definitions(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Obtiene las definiciones de campos de la instancia (usando el cache persistente)
+        
+        Returns:
+            Lista de campos de /rest/api/2/field ({id, name, custom, schema}),
+            o None si no se pudo consultar
+        """
+        cached_fields = self.metadata_cache.get('fields', 'definitions')
+        if cached_fields is not None:
+            return cached_fields
+        
+        try:
+            response = self._agile_get(f"{JIRA_CONFIG['server']}/rest/api/2/field")
+            if response.status_code != 200:
+                self.console.print(f"⚠️ [yellow]No se pudieron obtener los campos de la instancia (HTTP {response.status_code})[/yellow]")
+                return None
+            
+            definitions = [
+                {key: field.get(key) for key in ('id', 'name', 'custom', 'schema')}
+                for field in response.json()
+            ]
+            self.metadata_cache.set('fields', 'definitions', definitions)
+            return definitions
+        
+        except Exception as e:
+            self.console.print(f"⚠️ [yellow]Error obteniendo campos de la instancia: {str(e)}[/yellow]")
+            return None
     
     def get_project_boards(self, project_key: str) -> List[Dict[str, Any]]:
         """
         Obtiene los boards asociados al proyecto con cache para optimizar
         
+        Usa el filtro `projectKeyOrId` de la API Agile y solo recorre todos
+        los boards de la instancia si el filtro no está soportado. El
+        resultado se guarda en el cache persistente de metadatos.
+        
         Args:
             project_key: Clave del proyecto
             
@@ -89,39 +324,28 @@ class JiraService:
             self.console.print(f"💾 [green]Usando boards en cache para {project_key}[/green]")
             return self._boards_cache[project_key]
         
+        cached_boards = self.metadata_cache.get('boards', project_key)
+        if cached_boards is not None:
+            self.console.print(f"💾 [green]Usando boards en cache persistente para {project_key}[/green]")
+            self._boards_cache[project_key] = cached_boards
+            return cached_boards
+        
         try:
-            all_boards = []
-            start_at = 0
-            max_results = 50
+            all_boards = None
+            filter_supported = self.metadata_cache.get('capabilities', 'board_project_filter') is not False
             
-            self.console.print("🔄 [cyan]Obteniendo todos los boards con paginación completa...[/cyan]")
+            if filter_supported:
+                self.console.print(f"🔄 [cyan]Obteniendo boards del proyecto {project_key} (filtro en servidor)...[/cyan]")
+                all_boards = self._fetch_boards({'projectKeyOrId': project_key})
             
-            while True:
-                url = f"{JIRA_CONFIG['server']}/rest/agile/1.0/board"
-                params = {
-                    'startAt': start_at,
-                    'maxResults': max_results
-                }
-                auth = (JIRA_CONFIG['email'], JIRA_CONFIG['token'])
+            filter_failed = filter_supported and all_boards is None
+            
+            if all_boards is None:
+                self.console.print("🔄 [cyan]Obteniendo todos los boards con paginación completa...[/cyan]")
+                all_boards = self._fetch_boards({})
                 
-                response = requests.get(url, auth=auth, params=params)
-                if response.status_code != 200:
-                    self.console.print(f"⚠️ [yellow]API Agile no disponible (HTTP {response.status_code})[/yellow]")
+                if all_boards is None:
                     return []
-                
-                data = response.json()
-                boards = data.get('values', [])
-                
-                if not boards:
-                    break
-                
-                all_boards.extend(boards)
-                self.console.print(f"   📄 [dim]Página {start_at//max_results + 1}: +{len(boards)} boards (total: {len(all_boards)})[/dim]")
-                
-                if len(boards) < max_results:
-                    break
-                    
-                start_at += max_results
             
             # Filtrar por proyecto
             project_boards = []
@@ -135,10 +359,15 @@ class JiraService:
                         })
                         self.console.print(f"   ✅ [green]Board encontrado: {board['name']} (ID: {board['id']})[/green]")
             
-            self.console.print(f"📋 [cyan]Encontrados {len(all_boards)} boards totales, {len(project_boards)} del proyecto {project_key}[/cyan]")
+            self.console.print(f"📋 [cyan]Encontrados {len(all_boards)} boards consultados, {len(project_boards)} del proyecto {project_key}[/cyan]")
+            
+            # Si el filtro falló pero la búsqueda completa encontró boards, la instancia no lo soporta
+            if filter_failed and project_boards:
+                self.metadata_cache.set('capabilities', 'board_project_filter', False)
             
             # Guardar en cache
             self._boards_cache[project_key] = project_boards
+            self.metadata_cache.set('boards', project_key, project_boards)
             
             return project_boards
                 
@@ -146,9 +375,61 @@ class JiraService:
             self.console.print(f"⚠️ [yellow]Error obteniendo boards: {str(e)}[/yellow]")
             return []
     
+    def _fetch_boards(self, filters: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Recorre todas las páginas de /rest/agile/1.0/board con los filtros indicados
+        
+        Args:
+            filters: Parámetros de filtro de la API Agile (ej: projectKeyOrId)
+            
+        Returns:
+            Lista de boards, o None si la API rechazó la consulta
+        """
+        url = f"{JIRA_CONFIG['server']}/rest/agile/1.0/board"
+        all_boards = []
+        start_at = 0
+        max_results = 50
+        
+        while True:
+            params = {
+                **filters,
+                'startAt': start_at,
+                'maxResults': max_results
+            }
+            
+            response = self._agile_get(url, params=params)
+            if response.status_code != 200:
+                if filters:
+                    self.console.print(f"   ⚠️ [yellow]Filtro de boards no soportado (HTTP {response.status_code})[/yellow]")
+                else:
+                    self.console.print(f"⚠️ [yellow]API Agile no disponible (HTTP {response.status_code})[/yellow]")
+                return None
+            
+            data = response.json()
+            boards = data.get('values', [])
+            
+            if not boards:
+                break
+            
+            all_boards.extend(boards)
+            self.console.print(f"   📄 [dim]Página {start_at//max_results + 1}: +{len(boards)} boards (total: {len(all_boards)})[/dim]")
+            
+            if len(boards) < max_results:
+                break
+                
+            start_at += max_results
+        
+        return all_boards
+    
+    def refresh_metadata(self) -> None:
+        """Invalida el cache persistente de metadatos para forzar su descarga"""
+        self._boards_cache.clear()
+        deleted = self.metadata_cache.invalidate()
+        self.console.print(f"🧹 [cyan]Cache de metadatos invalidado ({deleted} entradas)[/cyan]")
+    
     def get_board_sprints(self, board_id: int, state: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        Obtiene sprints de un board específico
+        Obtiene sprints de un board específico (usando el cache persistente)
         
         Args:
             board_id: ID del board
@@ -157,13 +438,18 @@ class JiraService:
         Returns:
             Lista de sprints del board
         """
+        cache_key = f"{board_id}:{state or 'all'}"
+        cached_sprints = self.metadata_cache.get('sprints', cache_key)
+        if cached_sprints is not None:
+            return cached_sprints
+        
         try:
             url = f"{JIRA_CONFIG['server']}/rest/agile/1.0/board/{board_id}/sprint"
-            auth = (JIRA_CONFIG['email'], JIRA_CONFIG['token'])
             
             start_at = 0
             max_results = 50
             all_sprints = []
+            complete = True
             
             while True:
                 params = {
@@ -173,9 +459,10 @@ class JiraService:
                 if state:
                     params['state'] = state
                 
-                response = requests.get(url, auth=auth, params=params)
+                response = self._agile_get(url, params=params)
                 if response.status_code != 200:
                     self.console.print(f"   ⚠️ [dim]Error HTTP {response.status_code} en board {board_id}[/dim]")
+                    complete = False
                     break
                 
                 data = response.json()
@@ -191,6 +478,10 @@ class JiraService:
                     
                 start_at += max_results
             
+            # Solo cachear listas completas (no resultados parciales por errores)
+            if complete:
+                self.metadata_cache.set('sprints', cache_key, all_sprints)
+            
             return all_sprints
             
         except Exception as e:
@@ -199,7 +490,7 @@ class JiraService:
     
     def get_sprint_details(self, sprint_ids: List[int]) -> List[Dict[str, Any]]:
         """
-        Obtiene detalles de sprints específicos
+        Obtiene detalles de sprints específicos (usando el cache persistente)
         
         Args:
             sprint_ids: Lista de IDs de sprints
@@ -210,14 +501,19 @@ class JiraService:
         sprint_details = []
         
         for sprint_id in sprint_ids:
+            cached_detail = self.metadata_cache.get('sprint_details', sprint_id)
+            if cached_detail is not None:
+                sprint_details.append(cached_detail)
+                continue
+            
             try:
                 url = f"{JIRA_CONFIG['server']}/rest/agile/1.0/sprint/{sprint_id}"
-                auth = (JIRA_CONFIG['email'], JIRA_CONFIG['token'])
                 
-                response = requests.get(url, auth=auth)
+                response = self._agile_get(url)
                 if response.status_code == 200:
                     sprint_data = response.json()
                     sprint_details.append(sprint_data)
+                    self.metadata_cache.set('sprint_details', sprint_id, sprint_data)
                 else:
                     self.console.print(f"   ⚠️ [yellow]Sprint {sprint_id} no encontrado (HTTP {response.status_code})[/yellow]")
                     
@@ -0,0 +1,206 @@
+"""
+Limitador de tasa adaptativo para las llamadas a Jira
+"""
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Mapping, Dict, Any
+
+from ..config import RATE_LIMIT_CONFIG
+
+# Códigos HTTP que indican que el servidor pide bajar el ritmo
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+class RateLimiter:
+    """
+    Token bucket adaptativo compartido por todos los hilos del servicio
+
+    La tasa sube de forma aditiva con cada respuesta exitosa hasta `max_rate`
+    y se reduce de forma multiplicativa cuando el servidor responde 429/503
+    o avisa que está cerca del límite. Tras un rechazo el bucket queda
+    bloqueado durante el tiempo indicado por `Retry-After` / `X-RateLimit-Reset`
+    o, si no hay headers, con backoff exponencial con jitter.
+    """
+
+    def __init__(self, initial_rate: float = None, min_rate: float = None,
+                 max_rate: float = None, burst: int = None, enabled: bool = True):
+        """
+        Args:
+            initial_rate: Requests por segundo al inicio
+            min_rate: Tasa mínima tras reducciones
+            max_rate: Tasa máxima alcanzable
+            burst: Capacidad del bucket (requests consecutivos sin espera)
+            enabled: Si False, acquire() no espera (ej: reproducción sin red)
+        """
+        self.rate = initial_rate or RATE_LIMIT_CONFIG['initial_rate']
+        self.min_rate = min_rate or RATE_LIMIT_CONFIG['min_rate']
+        self.max_rate = max_rate or RATE_LIMIT_CONFIG['max_rate']
+        self.burst = burst or RATE_LIMIT_CONFIG['burst']
+        self.max_retries = RATE_LIMIT_CONFIG['max_retries']
+        self.enabled = enabled
+
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._consecutive_throttles = 0
+        self._lock = threading.Lock()
+
+        self.stats = {'requests': 0, 'throttled': 0, 'wait_seconds': 0.0}
+
+    def acquire(self) -> None:
+        """Bloquea hasta que haya un token disponible y no haya un bloqueo activo"""
+        if not self.enabled:
+            with self._lock:
+                self.stats['requests'] += 1
+            return
+
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    self.stats['requests'] += 1
+                    self.stats['wait_seconds'] += waited
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
+
+    def record_response(self, response: Any) -> None:
+        """
+        Ajusta la tasa según la respuesta recibida
+
+        Args:
+            response: Respuesta HTTP (requests.Response o similar con status_code y headers)
+        """
+        status_code = getattr(response, 'status_code', None)
+        headers = getattr(response, 'headers', None) or {}
+
+        with self._lock:
+            if status_code in THROTTLE_STATUS_CODES:
+                self.stats['throttled'] += 1
+                self._consecutive_throttles += 1
+                self.rate = max(self.min_rate, self.rate * RATE_LIMIT_CONFIG['decrease_factor'])
+                self._tokens = 0.0
+
+                delay = self._retry_delay(headers, self._consecutive_throttles)
+                self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+                return
+
+            self._consecutive_throttles = 0
+
+            if self._is_near_limit(headers):
+                # El servidor avisa que quedan pocos requests: no seguir acelerando
+                self.rate = max(self.min_rate, self.rate * RATE_LIMIT_CONFIG['decrease_factor'])
+                reset_delay = self._parse_reset(headers)
+                if reset_delay and self._remaining(headers) == 0:
+                    self._blocked_until = max(self._blocked_until, time.monotonic() + reset_delay)
+            else:
+                self.rate = min(self.max_rate, self.rate + RATE_LIMIT_CONFIG['increase_step'])
+
+    def is_throttled(self, response: Any) -> bool:
+        """Indica si la respuesta es un rechazo por rate limiting"""
+        return getattr(response, 'status_code', None) in THROTTLE_STATUS_CODES
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna contadores de uso y la tasa actual"""
+        with self._lock:
+            return {**self.stats, 'rate': round(self.rate, 2)}
+
+    def _refill(self, now: float) -> None:
+        """Recarga tokens según el tiempo transcurrido (requiere el lock)"""
+        elapsed = now - self._last_refill
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    def _retry_delay(self, headers: Mapping[str, str], attempt: int) -> float:
+        """
+        Calcula la espera tras un rechazo
+
+        Usa Retry-After / X-RateLimit-Reset si el servidor los informa (con un
+        pequeño jitter para no reintentar todos a la vez); si no, backoff
+        exponencial con jitter limitado por `backoff_max`.
+        """
+        base = RATE_LIMIT_CONFIG['backoff_base']
+        backoff = min(RATE_LIMIT_CONFIG['backoff_max'], base * (2 ** (attempt - 1)))
+
+        server_delay = self._parse_retry_after(headers)
+        if server_delay is None:
+            server_delay = self._parse_reset(headers)
+
+        if server_delay is not None:
+            return server_delay + random.uniform(0, base)
+
+        return random.uniform(backoff / 2, backoff)
+
+    def _parse_retry_after(self, headers: Mapping[str, str]) -> Optional[float]:
+        """Interpreta Retry-After en segundos o como fecha HTTP"""
+        value = headers.get('Retry-After')
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_date = parsedate_to_datetime(value)
+            return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    def _parse_reset(self, headers: Mapping[str, str]) -> Optional[float]:
+        """Interpreta X-RateLimit-Reset como epoch, segundos restantes o fecha ISO 8601"""
+        value = headers.get('X-RateLimit-Reset')
+        if not value:
+            return None
+
+        try:
+            number = float(value)
+            # Valores grandes son epoch; pequeños, segundos hasta el reset
+            return max(0.0, number - time.time()) if number > 1e9 else max(0.0, number)
+        except ValueError:
+            pass
+
+        try:
+            reset_date = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            if reset_date.tzinfo is None:
+                reset_date = reset_date.replace(tzinfo=timezone.utc)
+            return max(0.0, (reset_date - datetime.now(timezone.utc)).total_seconds())
+        except ValueError:
+            return None
+
+    def _remaining(self, headers: Mapping[str, str]) -> Optional[int]:
+        """Retorna X-RateLimit-Remaining si el servidor lo informa"""
+        try:
+            return int(headers.get('X-RateLimit-Remaining'))
+        except (TypeError, ValueError):
+            return None
+
+    def _is_near_limit(self, headers: Mapping[str, str]) -> bool:
+        """Detecta si el servidor avisa que se está cerca del límite"""
+        if str(headers.get('X-RateLimit-NearLimit', '')).lower() == 'true':
+            return True
+
+        remaining = self._remaining(headers)
+        if remaining is None:
+            return False
+
+        try:
+            limit = int(headers.get('X-RateLimit-Limit'))
+        except (TypeError, ValueError):
+            return remaining == 0
+
+        return remaining <= max(1, limit * RATE_LIMIT_CONFIG['near_limit_ratio'])
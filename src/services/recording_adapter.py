@@ -0,0 +1,96 @@
+"""
+Adaptador HTTP que graba o reproduce las respuestas de Jira
+"""
+import threading
+from typing import Dict
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from ..storage import ResponseStore
+from .rate_limiter import THROTTLE_STATUS_CODES
+
+# Modos soportados por el adaptador
+RECORD_MODE = 'record'
+REPLAY_MODE = 'replay'
+
+# Headers que dejan de ser válidos al guardar el cuerpo ya descomprimido
+_TRANSPORT_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+
+class RecordReplayAdapter(HTTPAdapter):
+    """
+    HTTPAdapter de requests con modo grabación y modo reproducción
+
+    En modo 'record' envía cada request al servidor y guarda la respuesta en
+    el ResponseStore (excepto los rechazos 429/503, que se reintentan). En
+    modo 'replay' no abre conexiones: responde desde el almacén y falla con
+    ConnectionError si el request no fue grabado.
+    """
+
+    def __init__(self, store: ResponseStore, mode: str, **kwargs):
+        """
+        Args:
+            store: Almacén de respuestas
+            mode: 'record' o 'replay'
+            **kwargs: Argumentos de HTTPAdapter (pool_connections, pool_maxsize...)
+        """
+        if mode not in (RECORD_MODE, REPLAY_MODE):
+            raise ValueError(f"Modo HTTP no soportado: {mode}")
+
+        super().__init__(**kwargs)
+        self.store = store
+        self.mode = mode
+        self.stats = {'recorded': 0, 'replayed': 0, 'missing': 0}
+        self._stats_lock = threading.Lock()
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        """Envía (y graba) o reproduce un request según el modo"""
+        key = ResponseStore.request_key(request.method, request.url, request.body)
+
+        if self.mode == REPLAY_MODE:
+            return self._replay(request, key)
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code not in THROTTLE_STATUS_CODES:
+            headers = {name: value for name, value in response.headers.items()
+                       if name.lower() not in _TRANSPORT_HEADERS}
+            self.store.save(key, response.status_code, headers, response.content)
+            self._count('recorded')
+
+        return response
+
+    def _replay(self, request: PreparedRequest, key: str) -> Response:
+        """Construye la respuesta grabada de un request"""
+        recorded = self.store.load(key)
+
+        if recorded is None:
+            self._count('missing')
+            raise ConnectionError(f"No hay respuesta grabada para {key}", request=request)
+
+        response = Response()
+        response.status_code = recorded['status']
+        response.headers = CaseInsensitiveDict(recorded['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = recorded['content']
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        self._count('replayed')
+
+        return response
+
+    def get_stats(self) -> Dict[str, int]:
+        """Copia de los contadores de requests grabados, reproducidos y sin grabación"""
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def _count(self, name: str) -> None:
+        """Incrementa un contador (el adaptador lo comparten los hilos de páginas y de boards)"""
+        with self._stats_lock:
+            self.stats[name] += 1
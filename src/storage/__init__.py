@@ -0,0 +1,9 @@
+"""
+Almacenamiento local persistente (caches y datos sincronizados)
+"""
+from .metadata_cache import MetadataCache
+from .issue_store import IssueStore
+from .response_store import ResponseStore
+from .warehouse import Warehouse
+
+__all__ = ['MetadataCache', 'IssueStore', 'ResponseStore', 'Warehouse']
@@ -0,0 +1,206 @@
+"""
+Almacén local de issues procesados para sincronización incremental
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..config import ISSUE_STORE_CONFIG
+
+# Separa el filtro JQL de su cláusula ORDER BY
+ORDER_BY_PATTERN = re.compile(r'\s+ORDER\s+BY\s+', re.IGNORECASE)
+
+
+class IssueStore:
+    """
+    Almacén SQLite de filas normalizadas por alcance de búsqueda
+
+    Cada alcance (el filtro JQL sin ORDER BY) guarda las filas producidas por
+    IssueRecord.to_storage (tiempos en segundos), indexadas por key, y la marca de
+    agua del campo `updated` de la última sincronización. La columna `updated`
+    se guarda normalizada a UTC para que el orden sea cronológico aunque Jira
+    informe las fechas con distintos desfases horarios.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: Ruta del archivo SQLite (None = valor de configuración)
+        """
+        self.path = path or ISSUE_STORE_CONFIG['path']
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def split_order_by(jql: str) -> Tuple[str, str]:
+        """
+        Separa un JQL en filtro y cláusula ORDER BY
+
+        Args:
+            jql: Query JQL
+
+        Returns:
+            Tupla (filtro, cláusula ORDER BY con su espacio inicial o '')
+        """
+        match = ORDER_BY_PATTERN.search(jql)
+        if not match:
+            return jql, ''
+        return jql[:match.start()], jql[match.start():]
+
+    @staticmethod
+    def scope_for(jql: str) -> str:
+        """
+        Normaliza un JQL al alcance que identifica la sincronización
+
+        Args:
+            jql: Query JQL (con o sin ORDER BY)
+
+        Returns:
+            Filtro JQL sin ORDER BY y con espacios normalizados
+        """
+        jql_filter = IssueStore.split_order_by(jql)[0]
+        return ' '.join(jql_filter.split())
+
+    def get_last_sync(self, scope: str) -> Optional[str]:
+        """
+        Retorna la marca de agua (`updated` máximo, ISO 8601 UTC) de un alcance
+
+        Args:
+            scope: Alcance de la sincronización
+
+        Returns:
+            Marca de agua o None si el alcance nunca se sincronizó
+        """
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT last_updated FROM sync_state WHERE scope = ?', (scope,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def upsert_rows(self, scope: str, rows: List[Dict[str, Any]],
+                    advance_watermark: bool = True) -> Optional[str]:
+        """
+        Inserta o actualiza filas y avanza la marca de agua del alcance
+
+        Args:
+            scope: Alcance de la sincronización
+            rows: Filas normalizadas (deben incluir 'key' y 'updated')
+            advance_watermark: Si False, guarda las filas sin mover la marca
+                de agua (ej: búsqueda truncada por el límite de seguridad)
+
+        Returns:
+            Marca de agua vigente del alcance
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.executemany(
+                'INSERT OR REPLACE INTO issues (scope, key, updated, data) VALUES (?, ?, ?, ?)',
+                [(scope, row['key'], self._to_utc_iso(row.get('updated')), json.dumps(row)) for row in rows]
+            )
+
+            row = connection.execute(
+                'SELECT last_updated FROM sync_state WHERE scope = ?', (scope,)
+            ).fetchone()
+            watermark = row[0] if row else None
+
+            if advance_watermark:
+                for candidate in (self._to_utc_iso(r.get('updated')) for r in rows):
+                    if candidate and (watermark is None or candidate > watermark):
+                        watermark = candidate
+
+                connection.execute(
+                    'INSERT OR REPLACE INTO sync_state (scope, last_updated, synced_at) VALUES (?, ?, ?)',
+                    (scope, watermark, time.time())
+                )
+
+            connection.commit()
+
+        return watermark
+
+    def delete_missing(self, scope: str, keys: Iterable[str]) -> int:
+        """
+        Elimina las filas del alcance cuya key ya no está en Jira (o salió del filtro)
+
+        Args:
+            scope: Alcance de la sincronización
+            keys: Keys vigentes del alcance
+
+        Returns:
+            Cantidad de filas eliminadas
+        """
+        keys = set(keys)
+        with self._lock:
+            connection = self._connect()
+            stored = [key for (key,) in connection.execute('SELECT key FROM issues WHERE scope = ?', (scope,))]
+            missing = [(scope, key) for key in stored if key not in keys]
+            if missing:
+                connection.executemany('DELETE FROM issues WHERE scope = ? AND key = ?', missing)
+                connection.commit()
+        return len(missing)
+
+    def load_rows(self, scope: str) -> List[Dict[str, Any]]:
+        """
+        Carga todas las filas de un alcance
+
+        Args:
+            scope: Alcance de la sincronización
+
+        Returns:
+            Filas normalizadas ordenadas por `updated` (UTC) descendente
+        """
+        with self._lock:
+            cursor = self._connect().execute(
+                'SELECT data FROM issues WHERE scope = ? ORDER BY updated DESC, key', (scope,)
+            )
+            return [json.loads(data) for (data,) in cursor]
+
+    def close(self) -> None:
+        """Cierra la conexión con la base de datos"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _to_utc_iso(self, updated: Optional[str]) -> Optional[str]:
+        """Convierte un `updated` de Jira (ej: 2024-01-02T10:00:00.000+0000) a ISO 8601 UTC"""
+        if not updated:
+            return None
+        try:
+            parsed = datetime.strptime(updated, '%Y-%m-%dT%H:%M:%S.%f%z')
+        except ValueError:
+            try:
+                parsed = datetime.fromisoformat(updated.replace('Z', '+00:00'))
+            except ValueError:
+                return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc).isoformat()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Abre la base de datos la primera vez que se usa (requiere el lock)"""
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.executescript(
+                'CREATE TABLE IF NOT EXISTS issues ('
+                ' scope TEXT NOT NULL,'
+                ' key TEXT NOT NULL,'
+                ' updated TEXT,'
+                ' data TEXT NOT NULL,'
+                ' PRIMARY KEY (scope, key));'
+                'CREATE TABLE IF NOT EXISTS sync_state ('
+                ' scope TEXT PRIMARY KEY,'
+                ' last_updated TEXT,'
+                ' synced_at REAL NOT NULL);'
+            )
+            self._connection.commit()
+
+        return self._connection
@@ -0,0 +1,141 @@
+"""
+Cache persistente en disco para metadatos de Jira
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional, Dict
+
+from ..config import CACHE_CONFIG
+
+
+class MetadataCache:
+    """
+    Cache clave-valor con TTL por entidad, persistido en SQLite
+
+    Las entradas se agrupan por entidad (ej: 'boards', 'sprints') y se
+    guardan como JSON. Cada entidad tiene su propio TTL en
+    CACHE_CONFIG['ttl'] y contadores de aciertos/fallos. Es seguro usarla
+    desde varios hilos.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: Ruta del archivo SQLite (None = valor de configuración)
+        """
+        self.path = path or CACHE_CONFIG['path']
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def get(self, entity: str, key: str) -> Optional[Any]:
+        """
+        Obtiene un valor si existe y no expiró
+
+        Args:
+            entity: Tipo de entidad (define el TTL)
+            key: Clave dentro de la entidad
+
+        Returns:
+            Valor almacenado o None si no existe o expiró
+        """
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT value, stored_at FROM entries WHERE entity = ? AND key = ?',
+                (entity, str(key))
+            ).fetchone()
+
+            counters = self.stats.setdefault(entity, {'hits': 0, 'misses': 0})
+            if row is None or time.time() - row[1] > self._ttl(entity):
+                counters['misses'] += 1
+                return None
+
+            counters['hits'] += 1
+
+        return json.loads(row[0])
+
+    def set(self, entity: str, key: str, value: Any) -> None:
+        """
+        Guarda un valor (reemplaza el anterior)
+
+        Args:
+            entity: Tipo de entidad
+            key: Clave dentro de la entidad
+            value: Valor serializable a JSON
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                'INSERT OR REPLACE INTO entries (entity, key, value, stored_at) VALUES (?, ?, ?, ?)',
+                (entity, str(key), json.dumps(value), time.time())
+            )
+            connection.commit()
+
+    def invalidate(self, entity: Optional[str] = None, key: Optional[str] = None) -> int:
+        """
+        Elimina entradas del cache
+
+        Args:
+            entity: Entidad a invalidar (None = todas)
+            key: Clave concreta dentro de la entidad (None = todas)
+
+        Returns:
+            Cantidad de entradas eliminadas
+        """
+        if entity is None:
+            query, params = 'DELETE FROM entries', ()
+        elif key is None:
+            query, params = 'DELETE FROM entries WHERE entity = ?', (entity,)
+        else:
+            query, params = 'DELETE FROM entries WHERE entity = ? AND key = ?', (entity, str(key))
+
+        with self._lock:
+            connection = self._connect()
+            deleted = connection.execute(query, params).rowcount
+            connection.commit()
+
+        return deleted
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Retorna los contadores de aciertos y fallos por entidad
+
+        Returns:
+            Diccionario {entidad: {'hits': n, 'misses': n}}
+        """
+        with self._lock:
+            return {entity: dict(counters) for entity, counters in self.stats.items()}
+
+    def close(self) -> None:
+        """Cierra la conexión con la base de datos"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _ttl(self, entity: str) -> float:
+        """Retorna el TTL en segundos de una entidad"""
+        return CACHE_CONFIG['ttl'].get(entity, CACHE_CONFIG['default_ttl'])
+
+    def _connect(self) -> sqlite3.Connection:
+        """Abre la base de datos la primera vez que se usa (requiere el lock)"""
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                ' entity TEXT NOT NULL,'
+                ' key TEXT NOT NULL,'
+                ' value TEXT NOT NULL,'
+                ' stored_at REAL NOT NULL,'
+                ' PRIMARY KEY (entity, key))'
+            )
+            self._connection.commit()
+
+        return self._connection
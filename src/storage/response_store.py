@@ -0,0 +1,159 @@
+"""
+Almacén de respuestas HTTP grabadas para reproducir extracciones sin red
+"""
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+from ..config import RECORDING_CONFIG
+
+
+class ResponseStore:
+    """
+    Almacén de respuestas REST comprimido y direccionado por contenido
+
+    Cada cuerpo de respuesta se guarda comprimido con gzip en
+    `objects/<hash[:2]>/<hash>.gz`, donde el nombre es el SHA-256 del
+    contenido (cuerpos idénticos se guardan una sola vez). Un índice SQLite
+    asocia cada request (método, ruta, query ordenada y cuerpo) con su
+    status, headers y hash de contenido. El host no forma parte de la clave,
+    por lo que una grabación puede reproducirse contra cualquier servidor.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: Directorio del almacén (None = valor de configuración)
+        """
+        self.path = path or RECORDING_CONFIG['path']
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def request_key(method: str, url: str, body: Optional[bytes] = None) -> str:
+        """
+        Calcula la clave estable de un request
+
+        Args:
+            method: Método HTTP
+            url: URL completa (se ignoran esquema y host)
+            body: Cuerpo del request, si tiene
+
+        Returns:
+            Clave normalizada (método, ruta y query ordenada, más hash del cuerpo)
+        """
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        key = f"{method.upper()} {parts.path}?{query}"
+
+        if body:
+            if isinstance(body, str):
+                body = body.encode('utf-8')
+            key += f" #{hashlib.sha256(body).hexdigest()}"
+
+        return key
+
+    def save(self, key: str, status: int, headers: Dict[str, str], content: bytes) -> str:
+        """
+        Guarda una respuesta (reemplaza la anterior del mismo request)
+
+        Args:
+            key: Clave del request (ver request_key)
+            status: Código HTTP
+            headers: Headers de la respuesta
+            content: Cuerpo ya descomprimido
+
+        Returns:
+            Hash del contenido guardado
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(content_hash)
+
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            temp_path = f"{object_path}.{threading.get_ident()}.tmp"
+            with gzip.open(temp_path, 'wb') as file:
+                file.write(content)
+            os.replace(temp_path, object_path)
+
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                'INSERT OR REPLACE INTO responses (request_key, status, headers, content_hash) VALUES (?, ?, ?, ?)',
+                (key, status, json.dumps(headers), content_hash)
+            )
+            connection.commit()
+
+        return content_hash
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene una respuesta grabada
+
+        Args:
+            key: Clave del request (ver request_key)
+
+        Returns:
+            Diccionario con status, headers y content, o None si no está grabada
+        """
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT status, headers, content_hash FROM responses WHERE request_key = ?', (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        status, headers, content_hash = row
+        with gzip.open(self._object_path(content_hash), 'rb') as file:
+            content = file.read()
+
+        return {'status': status, 'headers': json.loads(headers), 'content': content}
+
+    def get_meta(self, name: str) -> Optional[str]:
+        """Obtiene un metadato de la grabación (ej: servidor grabado)"""
+        with self._lock:
+            row = self._connect().execute('SELECT value FROM meta WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, name: str, value: str) -> None:
+        """Guarda un metadato de la grabación"""
+        with self._lock:
+            connection = self._connect()
+            connection.execute('INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)', (name, value))
+            connection.commit()
+
+    def close(self) -> None:
+        """Cierra el índice"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _object_path(self, content_hash: str) -> str:
+        """Ruta del archivo comprimido de un contenido"""
+        return os.path.join(self.path, 'objects', content_hash[:2], f"{content_hash}.gz")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Abre el índice la primera vez que se usa (requiere el lock)"""
+        if self._connection is None:
+            os.makedirs(self.path, exist_ok=True)
+            self._connection = sqlite3.connect(os.path.join(self.path, 'index.sqlite3'), check_same_thread=False)
+            self._connection.executescript(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                ' request_key TEXT PRIMARY KEY,'
+                ' status INTEGER NOT NULL,'
+                ' headers TEXT NOT NULL,'
+                ' content_hash TEXT NOT NULL);'
+                'CREATE TABLE IF NOT EXISTS meta ('
+                ' name TEXT PRIMARY KEY,'
+                ' value TEXT);'
+            )
+            self._connection.commit()
+
+        return self._connection
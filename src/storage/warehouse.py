@@ -0,0 +1,248 @@
+"""
+Base SQLite local con los datos exportados, actualizada en cada corrida
+"""
+import os
+import sqlite3
+import threading
+from operator import attrgetter
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..config import WAREHOUSE_CONFIG
+from ..models import IssueRecord, SUBTASK_COLUMNS, TIME_COLUMNS
+
+# Columnas enteras (tiempos en segundos, flags e IDs); el resto se guarda como texto
+INTEGER_COLUMNS = set(TIME_COLUMNS) | set(SUBTASK_COLUMNS) | {'is_subtask', 'sprint_id'}
+
+# Índices para las consultas de reportes (key es la clave primaria de cada tabla)
+INDEXES = {
+    'issues': ('project_key', 'parent_key', 'epic_key', 'sprint_id'),
+    'subtasks': ('project_key', 'parent_key', 'epic_key', 'sprint_id')
+}
+
+# Tablas con filas por proyecto que se depuran al final de cada corrida
+PROJECT_TABLES = ('issues', 'subtasks', 'sprints')
+
+# Valores de los campos fijos de un registro, en el orden de IssueRecord.FIELDS
+_get_fields = attrgetter(*IssueRecord.FIELDS)
+_SPRINT_ID_INDEX = IssueRecord.FIELDS.index('sprint_id')
+
+# Columnas de la tabla de sprints; un sprint de un board con varios proyectos
+# tiene una fila por proyecto (clave primaria sprint_id + project_key)
+SPRINT_COLUMNS = ('sprint_id', 'sprint_name', 'sprint_state', 'board_name', 'project_key')
+SPRINT_KEY = ('sprint_id', 'project_key')
+
+
+class Warehouse:
+    """
+    Base SQLite con tablas de issues, subtareas, sprints y corridas
+
+    Cada corrida registra una fila en `runs` y hace upsert de los registros
+    por key (issues principales en `issues`, subtareas en `subtasks`) y de
+    los sprints por (ID, proyecto), de modo que la base se actualiza en el lugar en vez
+    de acumular archivos. Las filas guardan el `run_id` de la última corrida
+    que las vio, y al terminar se eliminan las del mismo proyecto con un
+    `run_id` anterior: las tablas reflejan la última exportación de cada
+    proyecto, sin los issues que salieron de ella (resueltos fuera del
+    filtro, borrados en Jira o de sprints que no se exportaron esta vez).
+
+    `run_id` es global a todos los proyectos: la última corrida de un
+    proyecto es `MAX(run_id)` de `runs` filtrado por `project_key`.
+
+    Los tiempos quedan en segundos enteros (los totales de subtareas por
+    categoría también). Las columnas que no existen todavía (campos
+    genéricos o categorías de subtareas nuevas) se agregan al escribir.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: Ruta del archivo SQLite (None = valor de configuración)
+        """
+        self.path = path or WAREHOUSE_CONFIG['path']
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def write_run(self, project_key: str, records: Sequence[IssueRecord]) -> Dict[str, int]:
+        """
+        Registra una corrida y actualiza issues, subtareas y sprints en una transacción
+
+        Args:
+            project_key: Clave del proyecto exportado
+            records: Registros procesados (issues y subtareas)
+
+        Returns:
+            Resumen {'run_id', 'issues', 'subtasks', 'sprints'}
+        """
+        issues = [record for record in records if not record.is_subtask]
+        subtasks = [record for record in records if record.is_subtask]
+        sprints = self._collect_sprints(project_key, records)
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                run_id = connection.execute(
+                    'INSERT INTO runs (project_key, created_at, issues, subtasks, sprints) VALUES (?, ?, ?, ?, ?)',
+                    (project_key, datetime.now(timezone.utc).isoformat(), len(issues), len(subtasks), len(sprints))
+                ).lastrowid
+
+                self._upsert_records(connection, 'issues', issues, run_id, with_totals=True)
+                self._upsert_records(connection, 'subtasks', subtasks, run_id, with_totals=False)
+                self._upsert(connection, 'sprints', SPRINT_COLUMNS + ('run_id',),
+                             [values + (run_id,) for values in sprints], SPRINT_KEY)
+
+                # Un issue convertido en subtarea (o al revés) queda solo en su tabla actual
+                connection.executemany('DELETE FROM subtasks WHERE key = ?', [(r.key,) for r in issues])
+                connection.executemany('DELETE FROM issues WHERE key = ?', [(r.key,) for r in subtasks])
+
+                # Filas del proyecto que esta corrida ya no incluyó
+                for table in PROJECT_TABLES:
+                    connection.execute(
+                        f'DELETE FROM {table} WHERE project_key = ? AND run_id < ?', (project_key, run_id)
+                    )
+
+        return {'run_id': run_id, 'issues': len(issues), 'subtasks': len(subtasks), 'sprints': len(sprints)}
+
+    def close(self) -> None:
+        """Cierra la conexión con la base de datos"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _upsert_records(self, connection: sqlite3.Connection, table: str, records: List[IssueRecord],
+                        run_id: int, with_totals: bool) -> None:
+        """Hace upsert de los registros en `table` por key"""
+        if not records:
+            return
+
+        custom_names = list(dict.fromkeys(name for record in records for name in record.custom_names))
+        total_names = list(SUBTASK_COLUMNS) if with_totals else []
+        columns = list(IssueRecord.FIELDS) + custom_names + total_names + ['run_id']
+        self._ensure_columns(connection, table, columns)
+
+        # Los campos fijos ya tienen tipos de SQLite (texto, enteros, bool o None);
+        # solo sprint_id puede venir como texto ('N/A') y se normaliza
+        rows = []
+        for record in records:
+            row = list(_get_fields(record))
+            row[_SPRINT_ID_INDEX] = self._to_column('sprint_id', row[_SPRINT_ID_INDEX])
+            if custom_names:
+                custom = record.custom
+                row.extend(self._to_column(name, custom.get(name)) for name in custom_names)
+
+            # Totales de subtareas: décimas de hora → segundos (categoría sin subtareas = 0)
+            if total_names and record.subtask_totals is not None:
+                row.extend((tenths or 0) * 360 for tenths in record.subtask_totals)
+            else:
+                row.extend([None] * len(total_names))
+
+            row.append(run_id)
+            rows.append(row)
+
+        self._upsert(connection, table, columns, rows, ('key',))
+
+    def _upsert(self, connection: sqlite3.Connection, table: str, columns: Sequence[str],
+                rows: Iterable[Sequence[Any]], conflict_columns: Sequence[str]) -> None:
+        """INSERT ... ON CONFLICT DO UPDATE de las filas (en el orden de `columns`)"""
+        quoted = [f'"{column}"' for column in columns]
+        updates = ', '.join(f'"{column}" = excluded."{column}"' for column in columns if column not in conflict_columns)
+        conflict = ', '.join(f'"{column}"' for column in conflict_columns)
+        connection.executemany(
+            f'INSERT INTO {table} ({", ".join(quoted)}) VALUES ({", ".join("?" * len(columns))}) '
+            f'ON CONFLICT({conflict}) DO UPDATE SET {updates}',
+            rows
+        )
+
+    def _ensure_columns(self, connection: sqlite3.Connection, table: str, columns: Sequence[str]) -> None:
+        """Agrega a la tabla las columnas que todavía no tiene"""
+        existing = {row[1] for row in connection.execute(f'PRAGMA table_info({table})')}
+        for column in columns:
+            if column not in existing:
+                column_type = 'INTEGER' if column in INTEGER_COLUMNS or column == 'run_id' else 'TEXT'
+                connection.execute(f'ALTER TABLE {table} ADD COLUMN "{column}" {column_type}')
+
+    def _collect_sprints(self, project_key: str, records: Sequence[IssueRecord]) -> List[Tuple[Any, ...]]:
+        """Sprints distintos de los registros por (ID, proyecto) (los que tienen un ID numérico)"""
+        sprints: Dict[Tuple[int, str], Tuple[Any, ...]] = {}
+        for record in records:
+            sprint_id = self._to_column('sprint_id', record.sprint_id)
+            key = (sprint_id, record.project_key or project_key)
+            if sprint_id is not None and key not in sprints:
+                sprints[key] = (sprint_id, record.sprint_name, record.sprint_state,
+                                record.board_name, key[1])
+        return list(sprints.values())
+
+    @staticmethod
+    def _to_column(name: str, value: Any) -> Any:
+        """Convierte un valor al tipo de su columna (IDs no numéricos como 'N/A' → NULL)"""
+        if value is None:
+            return None
+        if name == 'sprint_id':
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return None
+        if name in INTEGER_COLUMNS:
+            return int(value)
+        return value if isinstance(value, str) else str(value)
+
+    def _ensure_sprints_table(self, connection: sqlite3.Connection) -> None:
+        """Crea la tabla de sprints, migrando la de clave solo por sprint_id si existe"""
+        primary_key = [row[1] for row in sorted(connection.execute('PRAGMA table_info(sprints)'),
+                                                key=lambda row: row[5]) if row[5]]
+        if primary_key == list(SPRINT_KEY):
+            return
+
+        if primary_key:
+            connection.execute('ALTER TABLE sprints RENAME TO sprints_old')
+
+        connection.execute(
+            'CREATE TABLE sprints ('
+            ' sprint_id INTEGER NOT NULL,'
+            ' sprint_name TEXT,'
+            ' sprint_state TEXT,'
+            ' board_name TEXT,'
+            ' project_key TEXT NOT NULL,'
+            ' run_id INTEGER,'
+            ' PRIMARY KEY (sprint_id, project_key))'
+        )
+
+        if primary_key:
+            columns = ', '.join(SPRINT_COLUMNS + ('run_id',))
+            connection.execute(
+                f'INSERT INTO sprints ({columns}) SELECT {columns} FROM sprints_old WHERE project_key IS NOT NULL'
+            )
+            connection.execute('DROP TABLE sprints_old')
+
+    def _connect(self) -> sqlite3.Connection:
+        """Abre la base de datos y crea el esquema la primera vez que se usa (requiere el lock)"""
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.executescript(
+                'CREATE TABLE IF NOT EXISTS runs ('
+                ' run_id INTEGER PRIMARY KEY AUTOINCREMENT,'
+                ' project_key TEXT NOT NULL,'
+                ' created_at TEXT NOT NULL,'
+                ' issues INTEGER NOT NULL,'
+                ' subtasks INTEGER NOT NULL,'
+                ' sprints INTEGER NOT NULL);'
+                'CREATE TABLE IF NOT EXISTS issues (key TEXT PRIMARY KEY);'
+                'CREATE TABLE IF NOT EXISTS subtasks (key TEXT PRIMARY KEY);'
+            )
+            self._ensure_sprints_table(self._connection)
+
+            # Columnas fijas e índices de las tablas de registros
+            for table, indexed_columns in INDEXES.items():
+                self._ensure_columns(self._connection, table, list(IssueRecord.FIELDS) + ['run_id'])
+                for column in indexed_columns:
+                    self._connection.execute(
+                        f'CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table} ("{column}")'
+                    )
+            self._connection.commit()
+
+        return self._connection
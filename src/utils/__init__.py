@@ -3,10 +3,12 @@ Utilidades para el extractor de Jira
 """
 from .sprint_manager import SprintManager
 from .subtask_processor import SubtaskProcessor
+from .subtask_classifier import SubtaskClassifier
 from .display_utils import DisplayUtils
 
 __all__ = [
     'SprintManager',
     'SubtaskProcessor', 
+    'SubtaskClassifier',
     'DisplayUtils'
 ]
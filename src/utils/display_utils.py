@@ -1,11 +1,13 @@
 """
 Utilidades para mostrar información en consola
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+from ..models import IssueRecord, seconds_to_tenths
+
 
 class DisplayUtils:
     """Utilidades para mostrar información formateada en consola"""
@@ -13,7 +15,7 @@ class DisplayUtils:
     def __init__(self):
         self.console = Console()
     
-    def show_extraction_summary(self, data: List[Dict[str, Any]]) -> None:
+    def show_extraction_summary(self, data: List[IssueRecord]) -> None:
         """
         Muestra resumen de los datos extraídos
         
@@ -62,13 +64,99 @@ class DisplayUtils:
             border_style="green"
         ))
     
-    def _show_general_metrics(self, data: List[Dict[str, Any]]) -> None:
+    def show_cache_stats(self, stats: Dict[str, Dict[str, int]]) -> None:
+        """
+        Muestra los aciertos y fallos del cache de metadatos
+        
+        Args:
+            stats: Contadores por entidad {entidad: {'hits': n, 'misses': n}}
+        """
+        if not stats:
+            return
+        
+        cache_table = Table(title="💾 Cache de Metadatos", show_header=True)
+        cache_table.add_column("Entidad", style="cyan")
+        cache_table.add_column("Aciertos", style="green")
+        cache_table.add_column("Fallos", style="yellow")
+        
+        for entity, counters in sorted(stats.items()):
+            cache_table.add_row(entity, str(counters['hits']), str(counters['misses']))
+        
+        self.console.print(cache_table)
+    
+    def show_worker_stats(self, stats: Dict[int, Dict[str, float]]) -> None:
+        """
+        Muestra el rendimiento de cada proceso de la extracción en paralelo (--workers)
+        
+        Args:
+            stats: Métricas por PID {pid: {'chunks': n, 'issues': n, 'seconds': s}}
+        """
+        if not stats:
+            return
+        
+        worker_table = Table(title="⚡ Extracción en Paralelo", show_header=True)
+        worker_table.add_column("Proceso", style="cyan")
+        worker_table.add_column("Lotes", style="green")
+        worker_table.add_column("Issues", style="green")
+        worker_table.add_column("Segundos", style="yellow")
+        worker_table.add_column("Issues/s", style="magenta")
+        
+        for pid, counters in sorted(stats.items()):
+            seconds = counters['seconds']
+            throughput = f"{counters['issues'] / seconds:,.0f}" if seconds else '-'
+            worker_table.add_row(str(pid), str(counters['chunks']), str(counters['issues']),
+                                 f"{seconds:.2f}", throughput)
+        
+        self.console.print(worker_table)
+    
+    def show_export_stats(self, timings: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Muestra la duración de cada formato exportado
+        
+        Args:
+            timings: Métricas por formato {formato: {'seconds': s, 'success': bool}}
+        """
+        if not timings:
+            return
+        
+        export_table = Table(title="📦 Exportación", show_header=True)
+        export_table.add_column("Formato", style="cyan")
+        export_table.add_column("Segundos", style="yellow")
+        export_table.add_column("Estado", style="green")
+        
+        for name, result in timings.items():
+            status = "✅" if result['success'] else "❌"
+            export_table.add_row(name, f"{result['seconds']:.2f}", status)
+        
+        self.console.print(export_table)
+    
+    def show_http_stats(self, stats: Optional[Dict[str, int]]) -> None:
+        """
+        Muestra los requests grabados o reproducidos (modos --record / --replay)
+        
+        Args:
+            stats: Contadores {'recorded': n, 'replayed': n, 'missing': n} o None
+        """
+        if not stats:
+            return
+        
+        http_table = Table(title="📼 Grabación HTTP", show_header=True)
+        http_table.add_column("Requests", style="cyan")
+        http_table.add_column("Cantidad", style="green")
+        
+        http_table.add_row("Grabados", str(stats['recorded']))
+        http_table.add_row("Reproducidos", str(stats['replayed']))
+        http_table.add_row("Sin grabación", str(stats['missing']))
+        
+        self.console.print(http_table)
+    
+    def _show_general_metrics(self, data: List[IssueRecord]) -> None:
         """Muestra métricas generales"""
         total_issues = len(data)
         
-        # Convertir valores con coma a float para cálculos
-        total_time_spent = sum(self._parse_time_value(item.get('time_spent', '0,0')) for item in data)
-        total_estimated = sum(self._parse_time_value(item.get('original_estimate', '0,0')) for item in data)
+        # Sumar las horas de cada issue (redondeadas a un decimal, como en la exportación)
+        total_time_spent = sum(seconds_to_tenths(item.time_spent) for item in data) / 10
+        total_estimated = sum(seconds_to_tenths(item.original_estimate) for item in data) / 10
         
         # Tabla de métricas
         metrics_table = Table(title="📈 Métricas Generales", show_header=True)
@@ -85,13 +173,13 @@ class DisplayUtils:
         
         self.console.print(metrics_table)
     
-    def _show_type_distribution(self, data: List[Dict[str, Any]]) -> None:
+    def _show_type_distribution(self, data: List[IssueRecord]) -> None:
         """Muestra distribución por tipo de issue"""
         total_issues = len(data)
         type_counts = {}
         
         for item in data:
-            issue_type = item.get('issue_type', 'Sin Tipo')
+            issue_type = item.issue_type
             type_counts[issue_type] = type_counts.get(issue_type, 0) + 1
         
         if type_counts:
@@ -106,14 +194,14 @@ class DisplayUtils:
             
             self.console.print(type_table)
     
-    def _show_sprint_distribution(self, data: List[Dict[str, Any]]) -> None:
+    def _show_sprint_distribution(self, data: List[IssueRecord]) -> None:
         """Muestra distribución por sprint si hay información disponible"""
         total_issues = len(data)
         sprint_counts = {}
         has_sprint_info = False
         
         for item in data:
-            sprint_name = item.get('sprint_name', 'Sin Sprint')
+            sprint_name = item.sprint_name
             if sprint_name and sprint_name != 'Sin Sprint':
                 has_sprint_info = True
                 sprint_counts[sprint_name] = sprint_counts.get(sprint_name, 0) + 1
@@ -129,10 +217,4 @@ class DisplayUtils:
                 sprint_table.add_row(sprint_name, str(count), f"{percentage:.1f}%")
             
             self.console.print(sprint_table)
-    
-    def _parse_time_value(self, time_str: str) -> float:
-        """Convierte un valor de tiempo con formato de coma a float"""
-        try:
-            return float(str(time_str).replace(',', '.'))
-        except (ValueError, TypeError):
-            return 0.0
+
@@ -2,6 +2,7 @@
 Gestor de sprints y selección de usuario
 """
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from rich.console import Console
@@ -18,6 +19,7 @@ class SprintManager:
     def __init__(self, jira_service: JiraService):
         self.jira_service = jira_service
         self.console = Console()
+        self._project_sprints: Dict[str, List[Dict[str, Any]]] = {}
     
     def get_active_project_sprints(self, project_key: str) -> List[Dict[str, Any]]:
         """
@@ -29,6 +31,10 @@ class SprintManager:
         Returns:
             Lista de sprints (activos + últimos 2 cerrados) ordenados por fecha de creación
         """
+        # Reutilizar los sprints ya descubiertos en esta ejecución
+        if project_key in self._project_sprints:
+            return self._project_sprints[project_key]
+        
         try:
             # Calcular fecha límite para optimización
             cutoff_date = datetime.now() - timedelta(days=EXTRACTION_CONFIG['recent_sprint_days'])
@@ -45,86 +51,30 @@ class SprintManager:
             
             self.console.print(f"📋 [cyan]Encontrados {len(boards)} boards: {[b['name'] for b in boards]}[/cyan]")
             
-            all_sprints = []
+            # Obtener sprints activos y cerrados de todos los boards en paralelo
+            workers = max(1, min(EXTRACTION_CONFIG['board_workers'], len(boards)))
+            self.console.print(f"⚡ [cyan]Consultando {len(boards)} boards con {workers} hilos en paralelo...[/cyan]")
             
-            # Obtener sprints activos y cerrados de todos los boards
-            for board in boards:
-                self.console.print(f"   📊 [dim]Obteniendo sprints del board: {board['name']} (ID: {board['id']})[/dim]")
-                
-                # Obtener sprints activos
-                active_sprints = self.jira_service.get_board_sprints(board['id'], state='active')
-                # Obtener sprints cerrados
-                closed_sprints = self.jira_service.get_board_sprints(board['id'], state='closed')
-                
-                board_active_sprints = 0
-                board_closed_sprints = 0
-                
-                # Procesar sprints activos
-                for sprint in active_sprints:
-                    sprint_created = sprint.get('createdDate', '')
-                    sprint_name = sprint.get('name', 'Sin nombre')
-                    
-                    # Verificar si el sprint fue creado dentro del rango
-                    is_recent = self._is_sprint_recent(sprint_created, cutoff_date)
-                    
-                    self.console.print(f"   � [dim]Sprint activo: {sprint_name[:20]} - Reciente: {is_recent}[/dim]")
-                    
-                    # Solo incluir sprints activos Y recientes
-                    if is_recent:
-                        sprint_data = {
-                            'id': sprint['id'],
-                            'name': sprint['name'],
-                            'state': sprint['state'],
-                            'startDate': sprint.get('startDate', 'No definida'),
-                            'endDate': sprint.get('endDate', 'No definida'),
-                            'goal': sprint.get('goal', 'Sin objetivo'),
-                            'board_name': board['name'],
-                            'board_id': board['id'],
-                            'type': 'active'
-                        }
-                        all_sprints.append(sprint_data)
-                        board_active_sprints += 1
-                        self.console.print(f"   ✅ [green]Sprint activo encontrado: {sprint['name']}[/green]")
-                
-                # Procesar sprints cerrados - obtener los 2 más recientes
-                if closed_sprints:
-                    # Filtrar y ordenar sprints cerrados por fecha de finalización
-                    recent_closed = []
-                    for sprint in closed_sprints:
-                        sprint_created = sprint.get('createdDate', '')
-                        sprint_name = sprint.get('name', 'Sin nombre')
-                        
-                        # Solo incluir sprints cerrados recientes
-                        if self._is_sprint_recent(sprint_created, cutoff_date):
-                            recent_closed.append(sprint)
-                    
-                    # Ordenar por fecha de finalización (más recientes primero)
-                    recent_closed.sort(key=lambda x: x.get('completeDate', x.get('endDate', '')), reverse=True)
-                    
-                    # Tomar solo los 2 más recientes
-                    last_2_closed = recent_closed[:2]
-                    
-                    for sprint in last_2_closed:
-                        sprint_name = sprint.get('name', 'Sin nombre')
-                        self.console.print(f"   🔴 [dim]Sprint cerrado reciente: {sprint_name[:20]}[/dim]")
-                        
-                        sprint_data = {
-                            'id': sprint['id'],
-                            'name': sprint['name'],
-                            'state': sprint['state'],
-                            'startDate': sprint.get('startDate', 'No definida'),
-                            'endDate': sprint.get('endDate', 'No definida'),
-                            'completeDate': sprint.get('completeDate', 'No definida'),
-                            'goal': sprint.get('goal', 'Sin objetivo'),
-                            'board_name': board['name'],
-                            'board_id': board['id'],
-                            'type': 'closed'
-                        }
-                        all_sprints.append(sprint_data)
-                        board_closed_sprints += 1
-                        self.console.print(f"   ✅ [blue]Sprint cerrado encontrado: {sprint['name']}[/blue]")
+            start_time = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # map() conserva el orden de los boards: el resultado es el mismo que en serie
+                board_results = list(executor.map(
+                    lambda board: self._collect_board_sprints(board, cutoff_date), boards
+                ))
+            elapsed = time.perf_counter() - start_time
+            
+            all_sprints = []
+            for board, result in zip(boards, board_results):
+                for message in result['messages']:
+                    self.console.print(message)
                 
-                self.console.print(f"   📊 [blue]Board {board['name']}: {board_active_sprints} activos, {board_closed_sprints} cerrados recientes[/blue]")
+                all_sprints.extend(result['sprints'])
+                self.console.print(
+                    f"   📊 [blue]Board {board['name']}: {result['active']} activos, "
+                    f"{result['closed']} cerrados recientes ({result['elapsed']:.2f}s)[/blue]"
+                )
+            
+            self.console.print(f"⏱️ [dim]Sprints de {len(boards)} boards obtenidos en {elapsed:.2f}s[/dim]")
             
             # Mostrar resumen total
             active_count = len([s for s in all_sprints if s['type'] == 'active'])
@@ -137,6 +87,7 @@ class SprintManager:
             
             # Eliminar duplicados y ordenar
             unique_sprints = self._remove_duplicates_and_sort(all_sprints)
+            self._project_sprints[project_key] = unique_sprints
             
             return unique_sprints
             
@@ -144,6 +95,103 @@ class SprintManager:
             self.console.print(f"⚠️ [yellow]Error obteniendo sprints activos del proyecto: {str(e)}[/yellow]")
             return []
     
+    def _collect_board_sprints(self, board: Dict[str, Any], cutoff_date: datetime) -> Dict[str, Any]:
+        """
+        Obtiene los sprints activos y los últimos 2 cerrados de un board
+        
+        Se ejecuta en hilos del pool: no imprime directamente, devuelve los
+        mensajes para que se muestren en el orden de los boards.
+        
+        Args:
+            board: Datos del board (id, name)
+            cutoff_date: Fecha límite para considerar un sprint reciente
+            
+        Returns:
+            Diccionario con sprints, contadores, mensajes y tiempo empleado
+        """
+        start_time = time.perf_counter()
+        messages = [f"   📊 [dim]Obteniendo sprints del board: {board['name']} (ID: {board['id']})[/dim]"]
+        board_sprints = []
+        board_active_sprints = 0
+        board_closed_sprints = 0
+        
+        # Obtener sprints activos
+        active_sprints = self.jira_service.get_board_sprints(board['id'], state='active')
+        # Obtener sprints cerrados
+        closed_sprints = self.jira_service.get_board_sprints(board['id'], state='closed')
+        
+        # Procesar sprints activos
+        for sprint in active_sprints:
+            sprint_created = sprint.get('createdDate', '')
+            sprint_name = sprint.get('name', 'Sin nombre')
+            
+            # Verificar si el sprint fue creado dentro del rango
+            is_recent = self._is_sprint_recent(sprint_created, cutoff_date)
+            
+            messages.append(f"   � [dim]Sprint activo: {sprint_name[:20]} - Reciente: {is_recent}[/dim]")
+            
+            # Solo incluir sprints activos Y recientes
+            if is_recent:
+                sprint_data = {
+                    'id': sprint['id'],
+                    'name': sprint['name'],
+                    'state': sprint['state'],
+                    'startDate': sprint.get('startDate', 'No definida'),
+                    'endDate': sprint.get('endDate', 'No definida'),
+                    'goal': sprint.get('goal', 'Sin objetivo'),
+                    'board_name': board['name'],
+                    'board_id': board['id'],
+                    'type': 'active'
+                }
+                board_sprints.append(sprint_data)
+                board_active_sprints += 1
+                messages.append(f"   ✅ [green]Sprint activo encontrado: {sprint['name']}[/green]")
+        
+        # Procesar sprints cerrados - obtener los 2 más recientes
+        if closed_sprints:
+            # Filtrar y ordenar sprints cerrados por fecha de finalización
+            recent_closed = []
+            for sprint in closed_sprints:
+                sprint_created = sprint.get('createdDate', '')
+                
+                # Solo incluir sprints cerrados recientes
+                if self._is_sprint_recent(sprint_created, cutoff_date):
+                    recent_closed.append(sprint)
+            
+            # Ordenar por fecha de finalización (más recientes primero)
+            recent_closed.sort(key=lambda x: x.get('completeDate', x.get('endDate', '')), reverse=True)
+            
+            # Tomar solo los 2 más recientes
+            last_2_closed = recent_closed[:2]
+            
+            for sprint in last_2_closed:
+                sprint_name = sprint.get('name', 'Sin nombre')
+                messages.append(f"   🔴 [dim]Sprint cerrado reciente: {sprint_name[:20]}[/dim]")
+                
+                sprint_data = {
+                    'id': sprint['id'],
+                    'name': sprint['name'],
+                    'state': sprint['state'],
+                    'startDate': sprint.get('startDate', 'No definida'),
+                    'endDate': sprint.get('endDate', 'No definida'),
+                    'completeDate': sprint.get('completeDate', 'No definida'),
+                    'goal': sprint.get('goal', 'Sin objetivo'),
+                    'board_name': board['name'],
+                    'board_id': board['id'],
+                    'type': 'closed'
+                }
+                board_sprints.append(sprint_data)
+                board_closed_sprints += 1
+                messages.append(f"   ✅ [blue]Sprint cerrado encontrado: {sprint['name']}[/blue]")
+        
+        return {
+            'sprints': board_sprints,
+            'active': board_active_sprints,
+            'closed': board_closed_sprints,
+            'messages': messages,
+            'elapsed': time.perf_counter() - start_time
+        }
+    
     def display_active_sprints_table(self, sprints: List[Dict[str, Any]]) -> None:
         """
         Muestra una tabla con los sprints disponibles (activos y cerrados recientes)
@@ -0,0 +1,58 @@
+"""
+Clasificador de subtareas por palabras clave
+"""
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from ..config import SUBTASK_MAPPING, SUBTASK_DEFAULT_CATEGORY
+
+# Combinaciones (tipo, resumen) memorizadas por clasificador
+CLASSIFIER_CACHE_SIZE = 65536
+
+
+class SubtaskClassifier:
+    """
+    Clasifica subtareas en categorías según palabras clave en su tipo y resumen
+
+    Las palabras clave de cada categoría se compilan una sola vez en una
+    expresión regular de alternancia. Las categorías se evalúan en el orden
+    del mapeo, de modo que una subtarea que coincide con varias queda en la
+    primera (la misma prioridad que la búsqueda palabra por palabra). Los
+    resultados se memorizan por (tipo, resumen), que se repiten mucho entre
+    las subtareas de un sprint.
+    """
+
+    def __init__(self, mapping: Optional[Dict[str, List[str]]] = None,
+                 default_category: Optional[str] = None):
+        """
+        Args:
+            mapping: Categoría → palabras clave en orden de prioridad (None = SUBTASK_MAPPING)
+            default_category: Categoría sin coincidencias (None = SUBTASK_DEFAULT_CATEGORY)
+        """
+        self.mapping = SUBTASK_MAPPING if mapping is None else mapping
+        self.default_category = default_category or SUBTASK_DEFAULT_CATEGORY
+        self._patterns = [
+            (category, re.compile('|'.join(re.escape(keyword.lower()) for keyword in keywords)))
+            for category, keywords in self.mapping.items() if keywords
+        ]
+        self.classify = lru_cache(maxsize=CLASSIFIER_CACHE_SIZE)(self._classify)
+
+    def _classify(self, issue_type: str, summary: str) -> str:
+        """
+        Categoriza una subtarea (usar classify, que memoriza el resultado)
+
+        Args:
+            issue_type: Tipo de issue de la subtarea
+            summary: Resumen de la subtarea
+
+        Returns:
+            Categoría de la subtarea
+        """
+        text_to_analyze = f"{issue_type.lower()} {summary.lower()}"
+
+        for category, pattern in self._patterns:
+            if pattern.search(text_to_analyze):
+                return category
+
+        return self.default_category
@@ -1,10 +1,20 @@
 """
 Procesador de subtareas y relaciones padre-hijo
 """
-from typing import List, Dict, Any
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
 from rich.console import Console
 
-from ..config import SUBTASK_MAPPING
+from ..config import SUBTASK_CATEGORIES
+from ..models import IssueRecord, SUBTASK_COLUMNS, seconds_to_tenths
+from .subtask_classifier import SubtaskClassifier
+
+# Métricas de los totales de subtareas por categoría (orden de SUBTASK_COLUMNS)
+SUBTASK_METRICS = ('time_spent', 'original_estimate', 'remaining')
+
+# Totales de un issue principal sin subtareas (todas las columnas en 0,0)
+EMPTY_TOTALS = (0,) * len(SUBTASK_COLUMNS)
 
 
 class SubtaskProcessor:
@@ -12,9 +22,10 @@ class SubtaskProcessor:
     
     def __init__(self):
         self.console = Console()
+        self.classifier = SubtaskClassifier()
     
-    def process_subtask_relationships(self, main_issues: List[Dict[str, Any]], 
-                                    subtasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def process_subtask_relationships(self, main_issues: List[IssueRecord], 
+                                    subtasks: List[IssueRecord]) -> List[IssueRecord]:
         """
         Procesa las relaciones entre issues principales y sus subtareas
         
@@ -29,123 +40,75 @@ class SubtaskProcessor:
             self.console.print("   📝 [dim]No hay subtareas para procesar[/dim]")
             return main_issues
         
-        # Agrupar subtareas por issue padre
-        subtasks_by_parent = {}
-        for subtask in subtasks:
-            parent_key = subtask.get('parent_key')
-            if parent_key:
-                if parent_key not in subtasks_by_parent:
-                    subtasks_by_parent[parent_key] = []
-                subtasks_by_parent[parent_key].append(subtask)
+        # Totales por issue padre (solo subtareas con padre)
+        totals_by_parent = self._aggregate_subtask_data([subtask for subtask in subtasks if subtask.parent_key])
         
-        self.console.print(f"   🔗 [cyan]Procesando {len(subtasks)} subtareas para {len(subtasks_by_parent)} issues padre[/cyan]")
+        self.console.print(f"   🔗 [cyan]Procesando {len(subtasks)} subtareas para {len(totals_by_parent)} issues padre[/cyan]")
         
-        # Procesar cada issue principal
+        # Asignar los totales a cada issue principal (en 0,0 si no tiene subtareas)
+        with_subtasks = 0
         for issue in main_issues:
-            issue_key = issue['key']
-            
-            # Inicializar campos de subtareas
-            self._initialize_subtask_fields(issue)
-            
-            # Procesar subtareas de este issue
-            if issue_key in subtasks_by_parent:
-                issue_subtasks = subtasks_by_parent[issue_key]
-                self._aggregate_subtask_data(issue, issue_subtasks)
-                
-                self.console.print(f"     📎 [dim]{issue_key}: {len(issue_subtasks)} subtareas procesadas[/dim]")
+            totals = totals_by_parent.get(issue.key)
+            if totals is None:
+                issue.subtask_totals = EMPTY_TOTALS
+            else:
+                issue.subtask_totals = totals
+                with_subtasks += 1
         
-        return main_issues
-    
-    def _initialize_subtask_fields(self, issue: Dict[str, Any]) -> None:
-        """Inicializa los campos de subtareas en un issue"""
-        subtask_fields = [
-            'analisis_time_spent', 'analisis_original_estimate', 'analisis_remaining',
-            'testing_time_spent', 'testing_original_estimate', 'testing_remaining',
-            'desarrollo_time_spent', 'desarrollo_original_estimate', 'desarrollo_remaining'
-        ]
+        self.console.print(f"     📎 [dim]{with_subtasks} issues con subtareas agregadas[/dim]")
         
-        for field in subtask_fields:
-            issue[field] = '0,0'
+        return main_issues
     
-    def _aggregate_subtask_data(self, parent_issue: Dict[str, Any], 
-                               subtasks: List[Dict[str, Any]]) -> None:
+    def _aggregate_subtask_data(self, subtasks: List[IssueRecord]) -> Dict[str, Tuple[int, ...]]:
         """
-        Agrega datos de timetracking de subtareas al issue padre
-        
-        Args:
-            parent_issue: Issue padre donde agregar los datos
-            subtasks: Lista de subtareas del issue padre
-        """
-        # Inicializar acumuladores por categoría
-        categories = {
-            'analisis': {'time_spent': 0, 'original_estimate': 0, 'remaining': 0},
-            'testing': {'time_spent': 0, 'original_estimate': 0, 'remaining': 0},
-            'desarrollo': {'time_spent': 0, 'original_estimate': 0, 'remaining': 0}
-        }
-        
-        # Procesar cada subtarea
-        for subtask in subtasks:
-            category = self._categorize_subtask(subtask)
-            
-            # Agregar tiempos a la categoría correspondiente
-            categories[category]['time_spent'] += self._parse_time_value(subtask.get('time_spent', '0,0'))
-            categories[category]['original_estimate'] += self._parse_time_value(subtask.get('original_estimate', '0,0'))
-            categories[category]['remaining'] += self._parse_time_value(subtask.get('remaining_estimate', '0,0'))
+        Agrega los tiempos de las subtareas por issue padre y categoría
         
-        # Asignar totales al issue padre
-        for category, times in categories.items():
-            parent_issue[f'{category}_time_spent'] = self._format_time_value(times['time_spent'])
-            parent_issue[f'{category}_original_estimate'] = self._format_time_value(times['original_estimate'])
-            parent_issue[f'{category}_remaining'] = self._format_time_value(times['remaining'])
-    
-    def _categorize_subtask(self, subtask: Dict[str, Any]) -> str:
-        """
-        Categoriza una subtarea según su tipo o resumen
+        Arma un DataFrame columnar de subtareas (padre, categoría y tiempos en
+        décimas de hora), suma con un groupby por (padre, categoría) y pivotea
+        las categorías a columnas. Cada subtarea aporta sus horas redondeadas
+        a un decimal, las que muestra su propia fila. Las categorías sin
+        subtareas del padre quedan en None (ver IssueRecord.to_dict).
         
         Args:
-            subtask: Datos de la subtarea
+            subtasks: Subtareas con issue padre
             
         Returns:
-            Categoría de la subtarea ('analisis', 'testing', 'desarrollo')
+            Diccionario {clave del padre: totales en el orden de SUBTASK_COLUMNS (None = sin subtareas)}
         """
-        # Obtener texto para categorizar (tipo de issue + resumen)
-        issue_type = subtask.get('issue_type', '').lower()
-        summary = subtask.get('summary', '').lower()
+        if not subtasks:
+            return {}
         
-        text_to_analyze = f"{issue_type} {summary}"
+        classify = self.classifier.classify
         
-        # Buscar coincidencias con los mapeos configurados
-        for category, keywords in SUBTASK_MAPPING.items():
-            for keyword in keywords:
-                if keyword.lower() in text_to_analyze:
-                    return category
+        frame = pd.DataFrame({
+            'parent_key': [subtask.parent_key for subtask in subtasks],
+            'category': [classify(subtask.issue_type or '', subtask.summary or '') for subtask in subtasks],
+            'time_spent': self._to_tenths([subtask.time_spent for subtask in subtasks]),
+            'original_estimate': self._to_tenths([subtask.original_estimate for subtask in subtasks]),
+            'remaining': self._to_tenths([subtask.remaining_estimate for subtask in subtasks])
+        })
         
-        # Si no hay coincidencia, usar desarrollo como categoría por defecto
-        return 'desarrollo'
-    
-    def _parse_time_value(self, time_str: str) -> float:
-        """
-        Convierte un valor de tiempo con formato de coma a float
+        totals = (
+            frame.groupby(['parent_key', 'category'], sort=False)[list(SUBTASK_METRICS)].sum()
+            .unstack('category')
+            .swaplevel(axis=1)
+            .reindex(columns=pd.MultiIndex.from_product([SUBTASK_CATEGORIES, SUBTASK_METRICS]))
+        )
         
-        Args:
-            time_str: Tiempo en formato string con coma
-            
-        Returns:
-            Valor numérico del tiempo
-        """
-        try:
-            return float(str(time_str).replace(',', '.'))
-        except (ValueError, TypeError):
-            return 0.0
+        # Las combinaciones (padre, categoría) sin subtareas quedan en NaN
+        return {
+            parent_key: tuple(None if value != value else int(value) for value in row)
+            for parent_key, row in zip(totals.index, totals.to_numpy().tolist())
+        }
     
-    def _format_time_value(self, time_float: float) -> str:
+    def _to_tenths(self, seconds: List[int]) -> np.ndarray:
         """
-        Convierte un valor float a formato string con coma
+        Convierte tiempos en segundos a décimas de hora
         
-        Args:
-            time_float: Tiempo en formato float
-            
-        Returns:
-            Tiempo formateado con coma
+        El redondeo de numpy no coincide siempre con el de round() de Python,
+        así que se convierte cada valor distinto con seconds_to_tenths y se
+        expande con una tabla de búsqueda.
         """
-        return str(round(time_float, 1)).replace('.', ',')
+        unique, inverse = np.unique(np.asarray(seconds, dtype=np.int64), return_inverse=True)
+        table = np.array([seconds_to_tenths(int(value)) for value in unique], dtype=np.int64)
+        return table[inverse]
@@ -0,0 +1,84 @@
+"""
+Pruebas de los accesores precompilados de campos
+"""
+from types import SimpleNamespace
+
+from src.extractors.accessors import AccessorPlan, compile_path
+
+PATHS = [
+    'key',
+    'fields.summary',
+    'fields.issuetype.name',
+    'fields.issuetype.subtask',
+    'fields.parent',
+    'fields.parent.key',
+    'fields.status.name',
+    'fields.customfield_10014'
+]
+
+ISSUE = {
+    'key': 'DEV-1',
+    'fields': {
+        'summary': 'Resumen',
+        'issuetype': {'name': 'Sub-task', 'subtask': True},
+        'parent': {'key': 'DEV-0'},
+        'status': None,
+        'customfield_10014': 'DEV-100'
+    }
+}
+
+
+def as_resource(value):
+    """Convierte un issue JSON en objetos con atributos, como los Resource de la librería jira"""
+    if isinstance(value, dict):
+        return SimpleNamespace(**{name: as_resource(item) for name, item in value.items()})
+    return value
+
+
+class TestAccessorPlan:
+
+    def test_resolves_dict_issue(self):
+        values = AccessorPlan(PATHS).resolve(ISSUE)
+
+        assert values['key'] == 'DEV-1'
+        assert values['fields.summary'] == 'Resumen'
+        assert values['fields.issuetype.name'] == 'Sub-task'
+        assert values['fields.issuetype.subtask'] is True
+        assert values['fields.customfield_10014'] == 'DEV-100'
+
+    def test_path_that_is_also_a_prefix(self):
+        values = AccessorPlan(PATHS).resolve(ISSUE)
+
+        assert values['fields.parent'] == {'key': 'DEV-0'}
+        assert values['fields.parent.key'] == 'DEV-0'
+
+    def test_missing_and_none_paths_are_omitted(self):
+        values = AccessorPlan(PATHS + ['fields.assignee.displayName']).resolve(ISSUE)
+
+        assert 'fields.status.name' not in values
+        assert 'fields.assignee.displayName' not in values
+
+    def test_resolves_resource_objects(self):
+        assert AccessorPlan(PATHS).resolve(as_resource(ISSUE))['fields.parent.key'] == 'DEV-0'
+
+    def test_matches_compile_path(self):
+        plan = AccessorPlan(PATHS)
+        for issue in (ISSUE, as_resource(ISSUE)):
+            values = plan.resolve(issue)
+            for path in PATHS:
+                expected = compile_path(path)(issue)
+                if expected is None:
+                    assert path not in values
+                elif isinstance(issue, dict):
+                    assert values[path] == expected
+                else:
+                    assert values[path] is expected
+
+    def test_repeated_paths_are_ignored(self):
+        plan = AccessorPlan(['key', 'fields.summary', 'key'])
+
+        assert plan.paths == ['key', 'fields.summary']
+        assert plan.resolve(ISSUE) == {'key': 'DEV-1', 'fields.summary': 'Resumen'}
+
+    def test_empty_issue(self):
+        assert AccessorPlan(PATHS).resolve({}) == {}
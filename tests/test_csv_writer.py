@@ -0,0 +1,137 @@
+"""
+Pruebas del escritor de CSV por filas
+"""
+import csv
+import gzip
+import io
+import os
+
+import pandas as pd
+import pytest
+
+from src.exporters import csv_writer
+from src.exporters.csv_writer import CSVStreamWriter
+
+COLUMNS = ['key', 'summary', 'time_spent']
+
+
+def make_rows(count, start=0):
+    return [[f'DEV-{n}', f'Issue {n}', n * 0.5] for n in range(start, start + count)]
+
+
+def read_csv(path, opener=open):
+    with opener(path, 'rt', encoding='utf-8-sig', newline='') as file:
+        return list(csv.reader(file))
+
+
+class TestSingleFile:
+
+    def test_header_and_rows(self, tmp_path):
+        path = str(tmp_path / 'data.csv')
+        with CSVStreamWriter(path, COLUMNS) as writer:
+            assert writer.write_rows(make_rows(3)) == 3
+
+        assert writer.paths == [path]
+        assert writer.rows_written == 3
+        assert read_csv(path) == [COLUMNS] + [[str(value) for value in r] for r in make_rows(3)]
+
+    def test_same_output_as_dataframe_to_csv(self, tmp_path):
+        rows = [['DEV-1', 'Coma, "comillas"', 1.5], ['DEV-2', None, None], ['DEV-3', 'Ñandú\nlínea', 0]]
+        path = str(tmp_path / 'data.csv')
+        with CSVStreamWriter(path, COLUMNS) as writer:
+            writer.write_rows(rows)
+
+        expected = pd.DataFrame(rows, columns=COLUMNS, dtype=object).to_csv(index=False, encoding='utf-8-sig')
+        with open(path, 'rb') as file:
+            assert file.read() == b'\xef\xbb\xbf' + expected.encode('utf-8')
+
+    def test_without_rows_writes_header(self, tmp_path):
+        path = str(tmp_path / 'data.csv')
+        with CSVStreamWriter(path, COLUMNS) as writer:
+            writer.write_rows([])
+
+        assert writer.paths == [path]
+        assert read_csv(path) == [COLUMNS]
+
+    def test_consumes_generators_in_chunks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(csv_writer, 'CHUNK_ROWS', 7)
+        path = str(tmp_path / 'data.csv')
+        with CSVStreamWriter(path, COLUMNS) as writer:
+            writer.write_rows(row for row in make_rows(50))
+
+        assert len(read_csv(path)) == 51
+
+
+class TestParts:
+
+    def test_rotation(self, tmp_path):
+        path = str(tmp_path / 'data.csv')
+        with CSVStreamWriter(path, COLUMNS, rows_per_file=1000) as writer:
+            writer.write_rows(make_rows(2500))
+
+        assert [os.path.basename(p) for p in writer.paths] == [
+            'data_part001.csv', 'data_part002.csv', 'data_part003.csv'
+        ]
+        parts = [read_csv(p) for p in writer.paths]
+        assert [len(part) - 1 for part in parts] == [1000, 1000, 500]
+        assert all(part[0] == COLUMNS for part in parts)
+        assert [r[0] for part in parts for r in part[1:]] == [f'DEV-{n}' for n in range(2500)]
+
+    def test_exact_multiple_does_not_leave_empty_part(self, tmp_path):
+        with CSVStreamWriter(str(tmp_path / 'data.csv'), COLUMNS, rows_per_file=100) as writer:
+            writer.write_rows(make_rows(200))
+
+        assert len(writer.paths) == 2
+
+    def test_parts_larger_than_chunk(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(csv_writer, 'CHUNK_ROWS', 3)
+        with CSVStreamWriter(str(tmp_path / 'data.csv'), COLUMNS, rows_per_file=10) as writer:
+            writer.write_rows(make_rows(25))
+
+        assert [len(read_csv(p)) - 1 for p in writer.paths] == [10, 10, 5]
+
+    def test_successive_calls_continue_current_part(self, tmp_path):
+        with CSVStreamWriter(str(tmp_path / 'data.csv'), COLUMNS, rows_per_file=4) as writer:
+            writer.write_rows(make_rows(3))
+            writer.write_rows(make_rows(3, start=3))
+            writer.write_rows(make_rows(3, start=6))
+
+        assert writer.rows_written == 9
+        assert [len(read_csv(p)) - 1 for p in writer.paths] == [4, 4, 1]
+
+
+class TestCompression:
+
+    def test_gzip(self, tmp_path):
+        path = str(tmp_path / 'data.csv')
+        with CSVStreamWriter(path, COLUMNS, compression='gzip') as writer:
+            writer.write_rows(make_rows(10))
+
+        assert writer.paths == [path + '.gz']
+        assert len(read_csv(path + '.gz', gzip.open)) == 11
+
+    def test_gzip_parts(self, tmp_path):
+        with CSVStreamWriter(str(tmp_path / 'data.csv'), COLUMNS, compression='gzip', rows_per_file=6) as writer:
+            writer.write_rows(make_rows(10))
+
+        assert [os.path.basename(p) for p in writer.paths] == ['data_part001.csv.gz', 'data_part002.csv.gz']
+        assert [len(read_csv(p, gzip.open)) - 1 for p in writer.paths] == [6, 4]
+
+    def test_zstd(self, tmp_path):
+        zstandard = pytest.importorskip('zstandard')
+        path = str(tmp_path / 'data.csv')
+        with CSVStreamWriter(path, COLUMNS, compression='zstd') as writer:
+            writer.write_rows(make_rows(10))
+
+        with open(path + '.zst', 'rb') as file:
+            data = zstandard.ZstdDecompressor().stream_reader(file).read()
+        assert len(list(csv.reader(io.StringIO(data.decode('utf-8-sig'))))) == 11
+
+    def test_zstd_without_package(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(csv_writer, 'zstandard', None)
+        with pytest.raises(ImportError):
+            CSVStreamWriter(str(tmp_path / 'data.csv'), COLUMNS, compression='zstd')
+
+    def test_unknown_compression(self, tmp_path):
+        with pytest.raises(ValueError):
+            CSVStreamWriter(str(tmp_path / 'data.csv'), COLUMNS, compression='bz2')
@@ -0,0 +1,132 @@
+"""
+Pruebas del almacén local de sincronización incremental
+"""
+import pytest
+
+from src.storage.issue_store import IssueStore
+
+SCOPE = 'project = DEV AND status NOT IN (Done)'
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = IssueStore(str(tmp_path / 'issues.sqlite3'))
+    yield store
+    store.close()
+
+
+def row(key, updated, **values):
+    return {'key': key, 'updated': updated, **values}
+
+
+class TestScope:
+
+    def test_split_order_by(self):
+        assert IssueStore.split_order_by('project = DEV ORDER BY updated DESC') == (
+            'project = DEV', ' ORDER BY updated DESC'
+        )
+        assert IssueStore.split_order_by('project = DEV order by created') == ('project = DEV', ' order by created')
+        assert IssueStore.split_order_by('project = DEV') == ('project = DEV', '')
+
+    def test_scope_ignores_order_and_whitespace(self):
+        assert IssueStore.scope_for('project = DEV   AND\n status NOT IN (Done) ORDER BY updated DESC') == SCOPE
+        assert IssueStore.scope_for(SCOPE + ' ORDER BY created') == IssueStore.scope_for(SCOPE)
+
+    def test_scopes_are_isolated(self, store):
+        store.upsert_rows(SCOPE, [row('DEV-1', '2024-01-02T10:00:00.000+0000')])
+        store.upsert_rows('project = OPS', [row('OPS-1', '2024-03-01T10:00:00.000+0000')])
+
+        assert [r['key'] for r in store.load_rows(SCOPE)] == ['DEV-1']
+        assert store.get_last_sync(SCOPE) == '2024-01-02T10:00:00+00:00'
+        assert store.get_last_sync('project = OPS') == '2024-03-01T10:00:00+00:00'
+
+
+class TestWatermark:
+
+    def test_never_synced(self, store):
+        assert store.get_last_sync(SCOPE) is None
+
+    def test_watermark_is_max_updated_in_utc(self, store):
+        watermark = store.upsert_rows(SCOPE, [
+            row('DEV-1', '2024-01-02T10:00:00.000+0000'),
+            # 08:00 en -0300 son las 11:00 UTC: es el más reciente aunque el texto sea menor
+            row('DEV-2', '2024-01-02T08:00:00.000-0300'),
+            row('DEV-3', '2024-01-02T12:30:00.000+0200')
+        ])
+
+        assert watermark == '2024-01-02T11:00:00+00:00'
+        assert store.get_last_sync(SCOPE) == watermark
+
+    def test_watermark_never_moves_back(self, store):
+        store.upsert_rows(SCOPE, [row('DEV-1', '2024-01-05T10:00:00.000+0000')])
+        watermark = store.upsert_rows(SCOPE, [row('DEV-2', '2024-01-03T10:00:00.000+0000')])
+
+        assert watermark == '2024-01-05T10:00:00+00:00'
+
+    def test_truncated_search_keeps_watermark(self, store):
+        store.upsert_rows(SCOPE, [row('DEV-1', '2024-01-02T10:00:00.000+0000')])
+        watermark = store.upsert_rows(SCOPE, [row('DEV-2', '2024-02-01T10:00:00.000+0000')],
+                                      advance_watermark=False)
+
+        assert watermark == '2024-01-02T10:00:00+00:00'
+        assert len(store.load_rows(SCOPE)) == 2
+
+    def test_truncated_first_sync_stays_unsynced(self, store):
+        assert store.upsert_rows(SCOPE, [row('DEV-1', '2024-01-02T10:00:00.000+0000')],
+                                 advance_watermark=False) is None
+        assert store.get_last_sync(SCOPE) is None
+
+    def test_rows_without_valid_updated(self, store):
+        watermark = store.upsert_rows(SCOPE, [row('DEV-1', None), row('DEV-2', 'ayer'),
+                                              row('DEV-3', '2024-01-02T10:00:00Z')])
+
+        assert watermark == '2024-01-02T10:00:00+00:00'
+
+    def test_persists_across_instances(self, store, tmp_path):
+        store.upsert_rows(SCOPE, [row('DEV-1', '2024-01-02T10:00:00.000+0000', summary='Uno')])
+        store.close()
+
+        reopened = IssueStore(str(tmp_path / 'issues.sqlite3'))
+        try:
+            assert reopened.get_last_sync(SCOPE) == '2024-01-02T10:00:00+00:00'
+            assert reopened.load_rows(SCOPE) == [row('DEV-1', '2024-01-02T10:00:00.000+0000', summary='Uno')]
+        finally:
+            reopened.close()
+
+
+class TestRows:
+
+    def test_upsert_replaces_by_key(self, store):
+        store.upsert_rows(SCOPE, [row('DEV-1', '2024-01-02T10:00:00.000+0000', status='To Do')])
+        store.upsert_rows(SCOPE, [row('DEV-1', '2024-01-03T10:00:00.000+0000', status='In Progress')])
+
+        assert store.load_rows(SCOPE) == [row('DEV-1', '2024-01-03T10:00:00.000+0000', status='In Progress')]
+
+    def test_load_rows_sorted_by_utc_updated(self, store):
+        store.upsert_rows(SCOPE, [
+            row('DEV-1', '2024-01-02T10:00:00.000+0000'),
+            row('DEV-2', '2024-01-02T08:00:00.000-0300'),
+            row('DEV-3', '2024-01-02T10:30:00.000+0200'),
+            row('DEV-4', '2024-01-02T10:00:00.000+0000')
+        ])
+
+        assert [r['key'] for r in store.load_rows(SCOPE)] == ['DEV-2', 'DEV-1', 'DEV-4', 'DEV-3']
+
+    def test_load_rows_keeps_original_updated_text(self, store):
+        store.upsert_rows(SCOPE, [row('DEV-1', '2024-01-02T08:00:00.000-0300')])
+
+        assert store.load_rows(SCOPE)[0]['updated'] == '2024-01-02T08:00:00.000-0300'
+
+    def test_delete_missing(self, store):
+        store.upsert_rows(SCOPE, [row(f'DEV-{n}', '2024-01-02T10:00:00.000+0000') for n in range(1, 5)])
+        store.upsert_rows('project = OPS', [row('OPS-1', '2024-01-02T10:00:00.000+0000')])
+
+        assert store.delete_missing(SCOPE, ['DEV-1', 'DEV-3', 'DEV-9']) == 2
+        assert sorted(r['key'] for r in store.load_rows(SCOPE)) == ['DEV-1', 'DEV-3']
+        assert [r['key'] for r in store.load_rows('project = OPS')] == ['OPS-1']
+
+    def test_delete_missing_without_changes(self, store):
+        store.upsert_rows(SCOPE, [row('DEV-1', '2024-01-02T10:00:00.000+0000')])
+
+        assert store.delete_missing(SCOPE, {'DEV-1'}) == 0
+        assert store.delete_missing('project = OPS', set()) == 0
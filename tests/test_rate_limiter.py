@@ -0,0 +1,189 @@
+"""
+Pruebas del limitador de tasa adaptativo
+"""
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import rate_limiter
+from src.services.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Reloj monotónico controlado por la prueba"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(rate_limiter.time, 'sleep', clock.sleep)
+    # Sin jitter: random.uniform(a, b) retorna siempre el mínimo
+    monkeypatch.setattr(rate_limiter.random, 'uniform', lambda low, high: low)
+    return clock
+
+
+@pytest.fixture
+def limiter(clock):
+    return RateLimiter(initial_rate=10.0, min_rate=0.5, max_rate=12.0, burst=5)
+
+
+def response(status_code: int = 200, **headers) -> SimpleNamespace:
+    """Respuesta HTTP mínima; los headers usan '_' en lugar de '-'"""
+    return SimpleNamespace(status_code=status_code,
+                           headers={name.replace('_', '-'): value for name, value in headers.items()})
+
+
+class TestParseRetryAfter:
+
+    def test_seconds(self, limiter):
+        assert limiter._parse_retry_after({'Retry-After': '7'}) == 7.0
+        assert limiter._parse_retry_after({'Retry-After': '2.5'}) == 2.5
+
+    def test_negative_seconds_are_clamped(self, limiter):
+        assert limiter._parse_retry_after({'Retry-After': '-3'}) == 0.0
+
+    def test_http_date(self, limiter):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = limiter._parse_retry_after({'Retry-After': format_datetime(retry_at, usegmt=True)})
+        assert 28 <= delay <= 30
+
+    def test_past_http_date(self, limiter):
+        retry_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+        assert limiter._parse_retry_after({'Retry-After': format_datetime(retry_at, usegmt=True)}) == 0.0
+
+    def test_missing_or_invalid(self, limiter):
+        assert limiter._parse_retry_after({}) is None
+        assert limiter._parse_retry_after({'Retry-After': ''}) is None
+        assert limiter._parse_retry_after({'Retry-After': 'pronto'}) is None
+
+
+class TestParseReset:
+
+    def test_epoch(self, limiter):
+        delay = limiter._parse_reset({'X-RateLimit-Reset': str(time.time() + 20)})
+        assert 19 <= delay <= 20
+
+    def test_seconds_until_reset(self, limiter):
+        assert limiter._parse_reset({'X-RateLimit-Reset': '15'}) == 15.0
+
+    def test_iso_date(self, limiter):
+        reset_at = datetime.now(timezone.utc) + timedelta(seconds=10)
+        delay = limiter._parse_reset({'X-RateLimit-Reset': reset_at.strftime('%Y-%m-%dT%H:%M:%S.%fZ')})
+        assert 9 <= delay <= 10
+
+    def test_naive_iso_date_is_utc(self, limiter):
+        reset_at = datetime.now(timezone.utc) + timedelta(seconds=10)
+        delay = limiter._parse_reset({'X-RateLimit-Reset': reset_at.replace(tzinfo=None).isoformat()})
+        assert 9 <= delay <= 10
+
+    def test_past_values_are_clamped(self, limiter):
+        assert limiter._parse_reset({'X-RateLimit-Reset': str(time.time() - 60)}) == 0.0
+        assert limiter._parse_reset({'X-RateLimit-Reset': '2000-01-01T00:00:00Z'}) == 0.0
+
+    def test_missing_or_invalid(self, limiter):
+        assert limiter._parse_reset({}) is None
+        assert limiter._parse_reset({'X-RateLimit-Reset': 'mañana'}) is None
+
+
+class TestIsNearLimit:
+
+    def test_near_limit_header(self, limiter):
+        assert limiter._is_near_limit({'X-RateLimit-NearLimit': 'true'})
+        assert limiter._is_near_limit({'X-RateLimit-NearLimit': 'True'})
+        assert not limiter._is_near_limit({'X-RateLimit-NearLimit': 'false'})
+
+    def test_remaining_below_ratio_of_limit(self, limiter):
+        assert limiter._is_near_limit({'X-RateLimit-Remaining': '10', 'X-RateLimit-Limit': '100'})
+        assert not limiter._is_near_limit({'X-RateLimit-Remaining': '11', 'X-RateLimit-Limit': '100'})
+
+    def test_small_limit_keeps_one_request_margin(self, limiter):
+        assert limiter._is_near_limit({'X-RateLimit-Remaining': '1', 'X-RateLimit-Limit': '5'})
+        assert not limiter._is_near_limit({'X-RateLimit-Remaining': '2', 'X-RateLimit-Limit': '5'})
+
+    def test_remaining_without_limit(self, limiter):
+        assert limiter._is_near_limit({'X-RateLimit-Remaining': '0'})
+        assert not limiter._is_near_limit({'X-RateLimit-Remaining': '3'})
+
+    def test_without_headers(self, limiter):
+        assert not limiter._is_near_limit({})
+        assert not limiter._is_near_limit({'X-RateLimit-Remaining': 'n/a'})
+
+
+class TestRecordResponse:
+
+    def test_success_increases_rate_up_to_max(self, limiter):
+        limiter.record_response(response())
+        assert limiter.rate == 10.5
+
+        for _ in range(10):
+            limiter.record_response(response())
+        assert limiter.rate == 12.0
+
+    def test_throttle_halves_rate_and_blocks_for_retry_after(self, limiter, clock):
+        limiter.record_response(response(429, Retry_After='10'))
+
+        assert limiter.rate == 5.0
+        assert limiter._tokens == 0.0
+        assert limiter._blocked_until == clock.now + 10
+        assert limiter.get_stats()['throttled'] == 1
+
+    def test_throttle_without_headers_uses_exponential_backoff(self, limiter, clock):
+        limiter.record_response(response(503))
+        assert limiter._blocked_until == clock.now + 0.5
+
+        limiter.record_response(response(503))
+        assert limiter._blocked_until == clock.now + 1.0
+
+        limiter.record_response(response(503))
+        assert limiter._blocked_until == clock.now + 2.0
+
+    def test_success_resets_backoff(self, limiter, clock):
+        limiter.record_response(response(429))
+        limiter.record_response(response(429))
+        limiter.record_response(response())
+        assert limiter._consecutive_throttles == 0
+
+        clock.now += 100
+        limiter.record_response(response(429))
+        assert limiter._blocked_until == clock.now + 0.5
+
+    def test_shorter_delay_does_not_shorten_block(self, limiter, clock):
+        limiter.record_response(response(429, Retry_After='30'))
+        limiter.record_response(response(429, Retry_After='1'))
+        assert limiter._blocked_until == clock.now + 30
+
+    def test_rate_never_goes_below_min(self, limiter):
+        for _ in range(10):
+            limiter.record_response(response(429, Retry_After='0'))
+        assert limiter.rate == 0.5
+
+    def test_near_limit_stops_increasing(self, limiter):
+        limiter.record_response(response(X_RateLimit_Remaining='5', X_RateLimit_Limit='100'))
+        assert limiter.rate == 5.0
+        assert limiter._blocked_until == 0.0
+
+    def test_exhausted_limit_blocks_until_reset(self, limiter, clock):
+        limiter.record_response(response(X_RateLimit_Remaining='0', X_RateLimit_Reset='30'))
+        assert limiter.rate == 5.0
+        assert limiter._blocked_until == clock.now + 30
+
+    def test_acquire_waits_for_block(self, limiter, clock):
+        start = clock.now
+        limiter.record_response(response(429, Retry_After='10'))
+        limiter.acquire()
+
+        assert clock.now == pytest.approx(start + 10)
+        assert limiter.get_stats()['requests'] == 1
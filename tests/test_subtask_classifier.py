@@ -0,0 +1,87 @@
+"""
+Pruebas del clasificador de subtareas por palabras clave
+"""
+from src.utils.subtask_classifier import SubtaskClassifier
+
+MAPPING = {
+    'analisis': ['analisis', 'análisis', 'diseño'],
+    'testing': ['test', 'qa', 'prueba'],
+    'desarrollo': ['desarrollo', 'dev']
+}
+
+
+def classify_word_by_word(mapping, default_category, issue_type, summary):
+    """Clasificación de referencia: primera categoría con alguna palabra clave contenida en el texto"""
+    text = f"{issue_type.lower()} {summary.lower()}"
+    for category, keywords in mapping.items():
+        for keyword in keywords:
+            if keyword.lower() in text:
+                return category
+    return default_category
+
+
+class TestSubtaskClassifier:
+
+    def test_single_category(self):
+        classifier = SubtaskClassifier(MAPPING, 'otros')
+
+        assert classifier.classify('Sub-task', 'Diseño de la API') == 'analisis'
+        assert classifier.classify('Sub-task', 'Pruebas de regresión') == 'testing'
+        assert classifier.classify('Sub-task', 'Desarrollo del endpoint') == 'desarrollo'
+
+    def test_first_category_in_mapping_wins(self):
+        classifier = SubtaskClassifier(MAPPING, 'otros')
+
+        # Coincide con 'test' y con 'diseño': gana analisis, que está antes en el mapeo
+        assert classifier.classify('Sub-task', 'Test del diseño') == 'analisis'
+        # Coincide con 'qa' y con 'dev': gana testing
+        assert classifier.classify('Sub-task', 'QA en dev') == 'testing'
+
+    def test_priority_follows_mapping_order(self):
+        reversed_mapping = dict(reversed(list(MAPPING.items())))
+        classifier = SubtaskClassifier(reversed_mapping, 'otros')
+
+        assert classifier.classify('Sub-task', 'Test del diseño') == 'testing'
+        assert classifier.classify('Sub-task', 'QA en dev') == 'desarrollo'
+
+    def test_issue_type_is_analyzed(self):
+        classifier = SubtaskClassifier(MAPPING, 'otros')
+
+        assert classifier.classify('QA Sub-task', 'Revisar login') == 'testing'
+
+    def test_default_category(self):
+        classifier = SubtaskClassifier(MAPPING, 'otros')
+
+        assert classifier.classify('Sub-task', 'Reunión de planificación') == 'otros'
+
+    def test_keywords_are_literal_and_case_insensitive(self):
+        classifier = SubtaskClassifier({'cpp': ['C++'], 'regex': ['a.b']}, 'otros')
+
+        assert classifier.classify('Sub-task', 'Migrar a c++') == 'cpp'
+        assert classifier.classify('Sub-task', 'axb') == 'otros'
+        assert classifier.classify('Sub-task', 'A.B') == 'regex'
+
+    def test_categories_without_keywords_are_skipped(self):
+        classifier = SubtaskClassifier({'vacia': [], 'testing': ['test']}, 'otros')
+
+        assert classifier.classify('Sub-task', 'test') == 'testing'
+        assert classifier.classify('Sub-task', 'nada') == 'otros'
+
+    def test_matches_word_by_word_search(self):
+        classifier = SubtaskClassifier(MAPPING, 'otros')
+        summaries = [
+            'Análisis funcional', 'Prueba de devolución', 'Revisión de diseño y QA',
+            'Deploy', 'Latest changes', 'Documentación', 'DEV: test de carga'
+        ]
+
+        for summary in summaries:
+            expected = classify_word_by_word(MAPPING, 'otros', 'Sub-task', summary)
+            assert classifier.classify('Sub-task', summary) == expected, summary
+
+    def test_results_are_memoized(self):
+        classifier = SubtaskClassifier(MAPPING, 'otros')
+
+        classifier.classify('Sub-task', 'Test del diseño')
+        classifier.classify('Sub-task', 'Test del diseño')
+
+        assert classifier.classify.cache_info().hits == 1
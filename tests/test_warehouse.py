@@ -0,0 +1,152 @@
+"""
+Pruebas de la base SQLite de reportes (upsert y depuración por proyecto)
+"""
+import sqlite3
+
+import pytest
+
+from src.models import IssueRecord, SUBTASK_COLUMNS
+from src.storage.warehouse import Warehouse
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    warehouse = Warehouse(str(tmp_path / 'warehouse.sqlite3'))
+    yield warehouse
+    warehouse.close()
+
+
+def issue(key, sprint_id=None, time_spent=3600, **values):
+    project_key = key.rsplit('-', 1)[0]
+    record = IssueRecord(key=key, project_key=project_key, is_subtask=False, time_spent=time_spent,
+                         sprint_id=sprint_id, sprint_name=f'Sprint {sprint_id}' if sprint_id else None,
+                         **values)
+    record.subtask_totals = (0,) * len(SUBTASK_COLUMNS)
+    return record
+
+
+def subtask(key, parent_key, sprint_id=None):
+    return IssueRecord(key=key, project_key=key.rsplit('-', 1)[0], is_subtask=True,
+                       parent_key=parent_key, sprint_id=sprint_id)
+
+
+def query(warehouse, sql, *params):
+    connection = sqlite3.connect(warehouse.path)
+    try:
+        return connection.execute(sql, params).fetchall()
+    finally:
+        connection.close()
+
+
+def keys(warehouse, table, project_key=None):
+    sql = f'SELECT key FROM {table}' + (' WHERE project_key = ?' if project_key else '') + ' ORDER BY key'
+    return [key for (key,) in query(warehouse, sql, *([project_key] if project_key else []))]
+
+
+def sprints(warehouse):
+    return query(warehouse, 'SELECT sprint_id, project_key FROM sprints ORDER BY sprint_id, project_key')
+
+
+class TestUpsert:
+
+    def test_first_run(self, warehouse):
+        summary = warehouse.write_run('DEV', [issue('DEV-1', 7), issue('DEV-2'), subtask('DEV-3', 'DEV-1', 7)])
+
+        assert summary == {'run_id': 1, 'issues': 2, 'subtasks': 1, 'sprints': 1}
+        assert keys(warehouse, 'issues') == ['DEV-1', 'DEV-2']
+        assert keys(warehouse, 'subtasks') == ['DEV-3']
+        assert sprints(warehouse) == [(7, 'DEV')]
+
+    def test_updates_rows_in_place(self, warehouse):
+        warehouse.write_run('DEV', [issue('DEV-1', time_spent=3600)])
+        warehouse.write_run('DEV', [issue('DEV-1', time_spent=7200)])
+
+        assert query(warehouse, 'SELECT key, time_spent, run_id FROM issues') == [('DEV-1', 7200, 2)]
+        assert query(warehouse, 'SELECT run_id, project_key FROM runs') == [(1, 'DEV'), (2, 'DEV')]
+
+    def test_issue_converted_to_subtask_moves_table(self, warehouse):
+        warehouse.write_run('DEV', [issue('DEV-1'), issue('DEV-2')])
+        warehouse.write_run('DEV', [issue('DEV-1'), subtask('DEV-2', 'DEV-1')])
+
+        assert keys(warehouse, 'issues') == ['DEV-1']
+        assert keys(warehouse, 'subtasks') == ['DEV-2']
+
+    def test_new_custom_columns_are_added(self, warehouse):
+        warehouse.write_run('DEV', [issue('DEV-1')])
+        warehouse.write_run('DEV', [issue('DEV-1', generico1='Alta')])
+
+        assert query(warehouse, 'SELECT generico1 FROM issues') == [('Alta',)]
+
+
+class TestPrune:
+
+    def test_rows_missing_from_the_run_are_deleted(self, warehouse):
+        warehouse.write_run('DEV', [issue('DEV-1', 7), issue('DEV-2', 8), subtask('DEV-3', 'DEV-2', 8)])
+        warehouse.write_run('DEV', [issue('DEV-1', 7)])
+
+        assert keys(warehouse, 'issues') == ['DEV-1']
+        assert keys(warehouse, 'subtasks') == []
+        assert sprints(warehouse) == [(7, 'DEV')]
+
+    def test_other_projects_are_kept(self, warehouse):
+        warehouse.write_run('DEV', [issue('DEV-1', 7)])
+        warehouse.write_run('OPS', [issue('OPS-1', 9)])
+        warehouse.write_run('DEV', [issue('DEV-2', 7)])
+
+        assert keys(warehouse, 'issues') == ['DEV-2', 'OPS-1']
+        assert sprints(warehouse) == [(7, 'DEV'), (9, 'OPS')]
+
+    def test_shared_sprint_is_kept_per_project(self, warehouse):
+        # Sprint 7 de un board con los dos proyectos
+        warehouse.write_run('DEV', [issue('DEV-1', 7)])
+        warehouse.write_run('OPS', [issue('OPS-1', 7)])
+        assert sprints(warehouse) == [(7, 'DEV'), (7, 'OPS')]
+
+        # OPS deja de tener issues en el sprint: DEV-1 lo sigue referenciando
+        warehouse.write_run('OPS', [issue('OPS-1', 9)])
+
+        assert sprints(warehouse) == [(7, 'DEV'), (9, 'OPS')]
+        assert query(warehouse, 'SELECT sprint_id FROM issues WHERE key = ?', 'DEV-1') == [(7,)]
+
+    def test_latest_run_per_project(self, warehouse):
+        warehouse.write_run('DEV', [issue('DEV-1')])
+        warehouse.write_run('OPS', [issue('OPS-1')])
+
+        latest = query(warehouse, 'SELECT MAX(run_id) FROM runs WHERE project_key = ?', 'DEV')[0][0]
+        assert latest == 1
+        assert query(warehouse, 'SELECT key FROM issues WHERE run_id = ?', latest) == [('DEV-1',)]
+
+    def test_empty_run_clears_the_project(self, warehouse):
+        warehouse.write_run('DEV', [issue('DEV-1', 7), subtask('DEV-2', 'DEV-1')])
+        warehouse.write_run('DEV', [])
+
+        assert keys(warehouse, 'issues') == []
+        assert keys(warehouse, 'subtasks') == []
+        assert sprints(warehouse) == []
+
+
+class TestSchema:
+
+    def test_indexes(self, warehouse):
+        warehouse.write_run('DEV', [issue('DEV-1')])
+        names = {name for (name,) in query(warehouse, "SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+        assert {'idx_issues_project_key', 'idx_issues_parent_key', 'idx_issues_epic_key',
+                'idx_issues_sprint_id', 'idx_subtasks_parent_key'} <= names
+
+    def test_migrates_sprints_keyed_by_id(self, tmp_path):
+        path = str(tmp_path / 'warehouse.sqlite3')
+        connection = sqlite3.connect(path)
+        connection.executescript(
+            'CREATE TABLE sprints (sprint_id INTEGER PRIMARY KEY, sprint_name TEXT, sprint_state TEXT,'
+            ' board_name TEXT, project_key TEXT, run_id INTEGER);'
+            "INSERT INTO sprints VALUES (7, 'Sprint 7', 'active', 'Board', 'DEV', 1);"
+        )
+        connection.close()
+
+        warehouse = Warehouse(path)
+        try:
+            warehouse.write_run('OPS', [issue('OPS-1', 7)])
+            assert sprints(warehouse) == [(7, 'DEV'), (7, 'OPS')]
+        finally:
+            warehouse.close()